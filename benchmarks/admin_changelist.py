@@ -0,0 +1,69 @@
+"""
+PostAdmin changelist latency at large row counts
+
+    python -m benchmarks.admin_changelist --rows 1000000
+
+Superuser နဲ့ login ဝင်ပြီး changelist (page 1, deep page, FTS search) ကို test Client နဲ့ ခေါ်
+- optimized → main.admin.PostAdmin (summary column, PostStats count, FTS search)
+- default   → list_display = title, content + exact COUNT(*) + icontains search
+"""
+import argparse
+import statistics
+
+from benchmarks import harness
+
+
+def default_admin_settings(post_admin):
+    """PostAdmin ကို Django default behaviour ပြန်ပြောင်း (before)"""
+    from django.contrib import admin
+    from django.core.paginator import Paginator
+
+    post_admin.list_display = ["title", "content"]
+    post_admin.list_per_page = 100
+    post_admin.paginator = Paginator
+    post_admin.show_full_result_count = True
+    post_admin.get_queryset = lambda request: admin.ModelAdmin.get_queryset(post_admin, request)
+    post_admin.get_search_results = lambda request, queryset, term: admin.ModelAdmin.get_search_results(
+        post_admin, request, queryset, term
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--content-size", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    harness.setup()
+    from django.contrib import admin
+    from django.contrib.auth.models import User
+    from django.test import Client
+    from django.urls import reverse
+    from main.models import Post
+
+    print(f"seeding {args.rows} rows ...", flush=True)
+    harness.seed_posts(args.rows, args.content_size, batch_size=5000)
+    User.objects.create_superuser("bench", "bench@example.com", "bench")
+    client = Client()
+    client.login(username="bench", password="bench")
+    url = reverse("admin:main_post_changelist")
+    pages = {
+        "page 1": {},
+        "page 1000": {"p": "999"},
+        "search": {"q": "Post 12345"},
+    }
+
+    post_admin = admin.site._registry[Post]
+    print(f"rows={args.rows} content_size={args.content_size}")
+    for mode in ("optimized", "default"):
+        if mode == "default":
+            default_admin_settings(post_admin)
+        for label, params in pages.items():
+            assert client.get(url, params).status_code == 200
+            samples = harness.timed(lambda: client.get(url, params), repeat=args.repeat)
+            print(f"{mode:10} {label:10} p50={statistics.median(samples) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+View တွေ အောက်က ORM path တွေကို HTTP stack မပါဘဲ benchmark
+"""
+from itertools import count
+
+
+def bench_orm_listing_page(bench):
+    from main.models import Post
+    from main.pagination import paginate
+
+    def listing_page():
+        pks = [item.pk for item in paginate(Post.objects.only("id")).items]
+        return list(Post.objects.listing().filter(pk__in=pks))
+
+    bench(listing_page)
+
+
+def bench_orm_get(bench, seeded):
+    from main.models import Post
+
+    counter = count()
+    bench(lambda: Post.objects.get(pk=seeded[next(counter) % len(seeded)]))
+
+
+def bench_orm_latest_update(bench):
+    from main.models import Post
+
+    bench(Post.objects.latest_update)
+
+
+def bench_orm_save(bench, seeded):
+    from main.models import Post
+
+    posts = list(Post.objects.filter(pk__in=seeded[:100]))
+    counter = count()
+
+    def save():
+        i = next(counter)
+        post = posts[i % len(posts)]
+        post.content = f"body {i} " * 50
+        post.save()
+
+    bench(save)
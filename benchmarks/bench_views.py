@@ -0,0 +1,117 @@
+"""
+Post views ကို Django test Client နဲ့ raw WSGI application နှစ်မျိုးလုံးကနေ benchmark
+- index, get_detail, post_create_post, post_update_post
+"""
+from http.cookies import SimpleCookie
+from itertools import count
+from urllib.parse import urlencode
+
+import pytest
+
+from benchmarks import harness
+
+
+class ClientTransport:
+    """django.test.Client (middleware အကုန်ပါ၊ CSRF check မပါ)"""
+
+    def __init__(self):
+        from django.test import Client
+
+        self.client = Client()
+
+    def get(self, path):
+        return self.client.get(path).status_code
+
+    def post(self, path, data):
+        return self.client.post(path, data).status_code
+
+
+class WSGITransport:
+    """cicd_test.wsgi.application ကို တိုက်ရိုက်ခေါ် (CSRF cookie + header ပါ)"""
+
+    def __init__(self):
+        from django.core.wsgi import get_wsgi_application
+        from django.urls import reverse
+
+        self.application = get_wsgi_application()
+        self.cookies = SimpleCookie()
+        self.get(reverse("website:get-create-post"))
+        self.csrf_token = self.cookies["csrftoken"].value
+
+    def _call(self, environ):
+        status = []
+
+        def start_response(line, headers, exc_info=None):
+            status.append(int(line.split()[0]))
+            for name, value in headers:
+                if name.lower() == "set-cookie":
+                    self.cookies.load(value)
+
+        body = self.application(environ, start_response)
+        try:
+            b"".join(body)
+        finally:
+            body.close()
+        return status[0]
+
+    def _headers(self):
+        cookie = "; ".join(f"{key}={morsel.value}" for key, morsel in self.cookies.items())
+        return {"Cookie": cookie} if cookie else {}
+
+    def get(self, path):
+        return self._call(harness.wsgi_environ(path, headers=self._headers()))
+
+    def post(self, path, data):
+        headers = dict(self._headers(), X_CSRFToken=self.csrf_token)
+        return self._call(harness.wsgi_environ(
+            path, method="POST", body=urlencode(data).encode(),
+            content_type="application/x-www-form-urlencoded", headers=headers,
+        ))
+
+
+TRANSPORTS = {"client": ClientTransport, "wsgi": WSGITransport}
+
+
+@pytest.fixture(params=sorted(TRANSPORTS))
+def transport(request, seeded):
+    return TRANSPORTS[request.param]()
+
+
+def bench_index(bench, transport):
+    from django.urls import reverse
+
+    url = reverse("website:index")
+    assert transport.get(url) == 200
+    bench(lambda: transport.get(url))
+
+
+def bench_get_detail(bench, transport, seeded):
+    from django.urls import reverse
+
+    urls = [reverse("website:get-detail", args=[pk]) for pk in seeded[:100]]
+    assert transport.get(urls[0]) == 200
+    counter = count()
+    bench(lambda: transport.get(urls[next(counter) % len(urls)]))
+
+
+def bench_post_create_post(bench, transport):
+    from django.urls import reverse
+
+    url = reverse("website:post-create-post")
+    counter = count()
+    assert transport.post(url, {"title": "warm", "content": "body"}) == 302
+    bench(lambda: transport.post(url, {"title": f"New {next(counter)}", "content": "body " * 50}))
+
+
+def bench_post_update_post(bench, transport, seeded):
+    from django.urls import reverse
+
+    urls = [reverse("website:post-update-post", args=[pk]) for pk in seeded[:100]]
+    counter = count()
+    assert transport.post(urls[0], {"title": "warm", "content": "body"}) == 302
+
+    def update():
+        i = next(counter)
+        return transport.post(urls[i % len(urls)], {"title": f"Edit {i}", "content": f"body {i} " * 50})
+
+    bench(update)
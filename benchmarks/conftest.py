@@ -0,0 +1,160 @@
+"""
+pytest benchmark suite (``bench_*.py``)
+
+    pytest -c benchmarks/pytest.ini benchmarks --bench-rows 2000 --bench-save baseline
+    pytest -c benchmarks/pytest.ini benchmarks --bench-compare baseline --bench-threshold 0.2
+
+- ``--bench-save NAME``    → results ကို benchmarks/baselines/NAME.json မှာ သိမ်း
+- ``--bench-compare NAME`` → baseline ထက် p50 latency က threshold ထက်ပိုနှေးရင် benchmark fail
+"""
+import json
+import platform
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from benchmarks import harness
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "post view benchmarks")
+    group.addoption("--bench-rows", type=int, default=1000, help="seed လုပ်မယ့် Post အရေအတွက်")
+    group.addoption("--bench-content-size", type=int, default=1024, help="Post.content characters")
+    group.addoption("--bench-iterations", type=int, default=200, help="benchmark တစ်ခုစီ run အကြိမ်ရေ")
+    group.addoption("--bench-warmup", type=int, default=20)
+    group.addoption("--bench-save", metavar="NAME", help="results → baselines/NAME.json")
+    group.addoption("--bench-compare", metavar="NAME", help="baselines/NAME.json နဲ့ နှိုင်းယှဉ်")
+    group.addoption("--bench-threshold", type=float, default=0.2, help="ခွင့်ပြုတဲ့ p50 slowdown (0.2 = 20%%)")
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples):
+    elapsed = sum(samples)
+    return {
+        "iterations": len(samples),
+        "throughput": len(samples) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def load_baseline(name):
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        raise pytest.UsageError(f"baseline not found: {path}")
+    return json.loads(path.read_text())
+
+
+class Bench:
+    """bench(fn) → fn ကို warmup + iterations ကြိမ် run ပြီး result မှတ်၊ compare mode မှာ regression စစ်"""
+
+    def __init__(self, name, config, results, baseline):
+        self.name = name
+        self.config = config
+        self.results = results
+        self.baseline = baseline
+
+    def __call__(self, fn):
+        for _ in range(self.config.getoption("bench_warmup")):
+            fn()
+        samples = []
+        for _ in range(self.config.getoption("bench_iterations")):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+        result = self.results[self.name] = summarize(samples)
+        self._check(result)
+        return result
+
+    def _check(self, result):
+        if self.baseline is None:
+            return
+        previous = self.baseline["results"].get(self.name)
+        if previous is None:
+            return
+        threshold = self.config.getoption("bench_threshold")
+        slowdown = result["p50_ms"] / previous["p50_ms"] - 1 if previous["p50_ms"] else 0.0
+        if slowdown > threshold:
+            pytest.fail(
+                f"{self.name}: p50 {result['p50_ms']:.3f} ms vs baseline {previous['p50_ms']:.3f} ms "
+                f"(+{slowdown:.0%} > {threshold:.0%})"
+            )
+
+
+def pytest_configure(config):
+    config._bench_results = {}
+    name = config.getoption("bench_compare")
+    config._bench_baseline = load_baseline(name) if name else None
+
+
+@pytest.fixture(scope="session")
+def seeded(pytestconfig):
+    """Test DB (in-memory) + Post rows seed — db.sqlite3 ကို မထိ (write view တွေကို rate limit မလုပ်)"""
+    harness.setup(WRITE_RATE_LIMIT="")
+    harness.seed_posts(
+        pytestconfig.getoption("bench_rows"), pytestconfig.getoption("bench_content_size")
+    )
+    from main.models import Post
+
+    return list(Post.objects.order_by("pk").values_list("pk", flat=True))
+
+
+@pytest.fixture
+def bench(request, seeded):
+    config = request.config
+    return Bench(request.node.name, config, config._bench_results, config._bench_baseline)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    name = config.getoption("bench_save")
+    if not name or not config._bench_results:
+        return
+    import django
+
+    BASELINE_DIR.mkdir(exist_ok=True)
+    payload = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+        },
+        "options": {
+            "rows": config.getoption("bench_rows"),
+            "content_size": config.getoption("bench_content_size"),
+            "iterations": config.getoption("bench_iterations"),
+        },
+        "results": config._bench_results,
+    }
+    path = BASELINE_DIR / f"{name}.json"
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config._bench_results
+    if not results:
+        return
+    baseline = (config._bench_baseline or {}).get("results", {})
+    terminalreporter.section("benchmarks")
+    for name, result in sorted(results.items()):
+        line = (
+            f"{name:50} {result['throughput']:10.1f} ops/s  "
+            f"p50={result['p50_ms']:8.3f} ms  p95={result['p95_ms']:8.3f} ms"
+        )
+        if name in baseline and baseline[name]["p50_ms"]:
+            line += f"  ({result['p50_ms'] / baseline[name]['p50_ms'] - 1:+.1%} vs baseline)"
+        terminalreporter.write_line(line)
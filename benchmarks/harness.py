@@ -0,0 +1,100 @@
+"""
+Benchmark script တွေအတွက် shared helper
+
+Django ကို test database (in-memory SQLite) နဲ့ setup လုပ်ပြီး Post rows seed လုပ်ပေး
+``db.sqlite3`` ကို ဘယ်တော့မှ မထိဘူး။
+"""
+import io
+import os
+import sys
+import time
+
+import django
+
+
+def setup(database_name=None, **overrides):
+    """
+    Django setup + fresh test database ဖန်တီး
+    database_name ပေးရင် in-memory အစား အဲ့ file ပေါ်မှာ ဖန်တီး (thread အများ ပြိုင်ရေးတဲ့ benchmark အတွက်)
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cicd_test.settings")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ.setdefault("DEBUG", "true")
+    # Benchmark DB က test database (tracked db.sqlite3 မဟုတ်) ဖြစ်လို့ tuned profile မှာ WAL ဖွင့်
+    os.environ.setdefault("SQLITE_WAL", "true")
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import override_settings
+
+    override_settings(ALLOWED_HOSTS=["*"], **overrides).enable()
+    if database_name:
+        connection.settings_dict["TEST"]["NAME"] = database_name
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def seed_posts(rows, content_size=1024, batch_size=1000):
+    """rows ခု Post ကို content_size characters စီနဲ့ bulk_create"""
+    from main.models import Post
+
+    body = ("lorem ipsum dolor sit amet " * (content_size // 27 + 1))[:content_size]
+    Post.objects.all().delete()
+    for start in range(0, rows, batch_size):
+        Post.objects.bulk_create(
+            Post(title=f"Post {i}", content=body)
+            for i in range(start, min(start + batch_size, rows))
+        )
+
+
+def session_cookie(username):
+    """Superuser တစ်ယောက် ဖန်တီးပြီး login ဝင်ထားတဲ့ session → ``Cookie`` header value (API write အတွက်)"""
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+    from django.contrib.auth.models import User
+
+    user = User.objects.create_superuser(username)
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.create()
+    return f"{settings.SESSION_COOKIE_NAME}={session.session_key}"
+
+
+def timed(fn, repeat=5):
+    """fn() ကို repeat ကြိမ် run ပြီး seconds list ပြန်ပေး"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def wsgi_environ(path, method="GET", body=b"", content_type=None, headers=None):
+    """Raw WSGI application ကို ခေါ်ဖို့ environ dict (network မပါ)"""
+    path, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": "localhost",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if content_type:
+        environ["CONTENT_TYPE"] = content_type
+    for name, value in (headers or {}).items():
+        environ["HTTP_" + name.upper().replace("-", "_")] = value
+    return environ
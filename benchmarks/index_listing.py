@@ -0,0 +1,86 @@
+"""
+Index listing: full rows vs deferred-column listing
+
+    python -m benchmarks.index_listing --rows 5000 --content-size 8192
+
+Page တစ်ခုစာ DB ကနေ fetch လုပ်တဲ့ bytes နဲ့ index render တစ်ခါရဲ့ peak memory ကို
+``Post.objects.all()`` (before) နဲ့ ``Post.objects.listing()`` (after) နှိုင်းယှဉ်
+"""
+import argparse
+import statistics
+import tracemalloc
+
+from benchmarks import harness
+
+
+def fetched_bytes(queryset):
+    """queryset ရဲ့ SQL ကို run ပြီး ပြန်လာတဲ့ column value bytes ပေါင်း"""
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+    total = 0
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for row in cursor.fetchall():
+            for value in row:
+                if value is None:
+                    continue
+                if isinstance(value, str):
+                    total += len(value.encode())
+                elif isinstance(value, bytes):
+                    total += len(value)
+                else:
+                    total += 8
+    return total
+
+
+def render_index(queryset):
+    """Row fragments + index.html (fragment cache မပါ)"""
+    from django.template.loader import render_to_string
+    from main.fragment_cache import render_html
+
+    rows = [html for _, html in render_html(list(queryset), "row")]
+    return render_to_string("index.html", {"rows": rows})
+
+
+def render_peak(queryset):
+    """index render တစ်ခါရဲ့ peak memory (bytes)"""
+    tracemalloc.start()
+    render_index(queryset)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--content-size", type=int, default=8192)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    harness.setup()
+    from main.models import Post
+
+    harness.seed_posts(args.rows, args.content_size)
+    modes = {
+        "before (all)": Post.objects.all(),
+        "after (listing)": Post.objects.listing(),
+    }
+    print(f"rows={args.rows} content_size={args.content_size} page_size={args.page_size}")
+    for label, queryset in modes.items():
+        page = queryset.order_by("pk")[:args.page_size]
+        samples = harness.timed(
+            lambda: render_index(page.all()),
+            repeat=args.repeat,
+        )
+        print(
+            f"{label:16} fetched={fetched_bytes(page):>12,} B  "
+            f"peak={render_peak(page.all()):>12,} B  "
+            f"render={statistics.median(samples) * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
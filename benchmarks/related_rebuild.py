@@ -0,0 +1,96 @@
+"""
+Related posts: corpus rebuild time, incremental update နဲ့ detail lookup
+
+    python -m benchmarks.related_rebuild --posts 100000
+
+Zipf-ish vocabulary (topic တစ်ခုစီမှာ term အုပ်စု + common term) နဲ့ post တွေ seed ပြီး
+``related.rebuild()`` stage တစ်ခုစီ၊ ``related.update_posts()`` (post တစ်ခု) နဲ့
+RelatedPost lookup query (PostQuerySet.detail ရဲ့ prefetch) ကို တိုင်း
+"""
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks import harness
+
+
+def seed_corpus(posts, topics, words_per_post, batch_size=2000, seed=0):
+    """topic vocabulary အလိုက် post content ဖန်တီး — term frequency က rank ပေါ် Zipf အတိုင်း"""
+    from main.models import Job, Post
+
+    rng = random.Random(seed)
+    common = [f"common{i}" for i in range(500)]
+    vocabularies = [[f"t{topic}w{i}" for i in range(200)] for topic in range(topics)]
+    zipf = [1 / (rank + 1) for rank in range(200)]
+    common_zipf = [1 / (rank + 1) for rank in range(len(common))]
+    for start in range(0, posts, batch_size):
+        batch = []
+        for i in range(start, min(start + batch_size, posts)):
+            words = vocabularies[rng.randrange(topics)]
+            body = rng.choices(words, zipf, k=words_per_post * 2 // 3)
+            body += rng.choices(common, common_zipf, k=words_per_post // 3)
+            rng.shuffle(body)
+            batch.append(Post(title=" ".join(rng.choices(words, zipf, k=4)), content=" ".join(body)))
+        Post.objects.bulk_create(batch)
+    # bulk_create က enqueue လုပ်ထားတဲ့ slug / related job တွေ — benchmark မှာ မလို
+    Job.objects.all().delete()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=100000)
+    parser.add_argument("--topics", type=int, default=50)
+    parser.add_argument("--words", type=int, default=120, help="post တစ်ခုစီရဲ့ content words")
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    harness.setup()
+    from django.conf import settings
+    from django.db import connection
+    from main import related
+    from main.models import Post, RelatedPost
+
+    started = time.perf_counter()
+    seed_corpus(args.posts, args.topics, args.words, batch_size=args.chunk_size)
+    print(f"posts={args.posts} topics={args.topics} words={args.words} seeded in {time.perf_counter() - started:.1f}s")
+
+    stage_times = {}
+    started = time.perf_counter()
+    mark = started
+    stage = None
+    for stage, _ in related.rebuild(chunk_size=args.chunk_size):
+        now = time.perf_counter()
+        stage_times[stage] = stage_times.get(stage, 0) + now - mark
+        mark = now
+    for name, seconds in stage_times.items():
+        print(f"rebuild {name:12} {seconds:8.2f} s")
+    print(f"rebuild total        {time.perf_counter() - started:8.2f} s  "
+          f"({RelatedPost.objects.count():,} RelatedPost rows)")
+
+    pks = list(Post.objects.order_by("?").values_list("pk", flat=True)[:args.repeat])
+    samples = []
+    for pk in pks:
+        post = Post.objects.get(pk=pk)
+        post.content += " " + post.title
+        post.save()
+        started = time.perf_counter()
+        related.update_posts([pk])
+        samples.append(time.perf_counter() - started)
+    print(f"update_posts (1 post) p50={statistics.median(samples) * 1000:8.2f} ms  max={max(samples) * 1000:8.2f} ms")
+
+    lookup = RelatedPost.objects.select_related("related").only(
+        "post_id", "score", "related__id", "related__title",
+    ).order_by("-score", "-related")
+    samples = harness.timed(lambda: [list(lookup.filter(post_id=pk)) for pk in pks], repeat=5)
+    print(f"lookup (limit={settings.RELATED_POSTS_LIMIT})      "
+          f"p50={statistics.median(samples) / len(pks) * 1000:8.3f} ms per post")
+    with connection.cursor() as cursor:
+        sql, params = lookup.filter(post_id=pks[0]).query.sql_with_params()
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        print("plan:", "; ".join(row[-1] for row in cursor.fetchall()))
+
+
+if __name__ == "__main__":
+    main()
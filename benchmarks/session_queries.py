@@ -0,0 +1,95 @@
+"""
+Session / messages storage profile ချင်း DB queries per request နှိုင်းယှဉ်
+
+    python -m benchmarks.session_queries [--rounds 20]
+
+settings.SESSION_PROFILES ထဲက profile တစ်ခုစီအတွက် anonymous / logged-in client နှစ်မျိုးနဲ့
+main view တွေကို (create → redirect, detail, missing detail → redirect, update, index) တစ်ပတ်စီ ခေါ်ပြီး
+request တစ်ခုချင်းရဲ့ query အရေအတွက် (စုစုပေါင်း / django_session table) ကို ပျမ်းမျှ
+"""
+import argparse
+from collections import defaultdict
+
+from benchmarks import harness
+
+
+def flow(client, reverse, pk):
+    """(label, callable) — round တစ်ခုအတွင်း ခေါ်မယ့် request တွေ"""
+    return [
+        ("create", lambda: client.post(reverse("website:post-create-post"), {"title": "T", "content": "C"})),
+        ("index", lambda: client.get(reverse("website:index"))),
+        ("detail", lambda: client.get(reverse("website:get-detail", args=[pk]))),
+        ("missing", lambda: client.get(reverse("website:get-detail", args=[10 ** 9]))),
+        ("index", lambda: client.get(reverse("website:index"))),
+        ("edit", lambda: client.get(reverse("website:get-update-post", args=[pk]))),
+        ("update", lambda: client.post(reverse("website:post-update-post", args=[pk]), {"title": "U", "content": "C"})),
+        ("index", lambda: client.get(reverse("website:index"))),
+    ]
+
+
+def measure(profile, logged_in, rounds):
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext, override_settings
+    from django.urls import reverse
+    from main.models import Post
+
+    engine, storage = settings.SESSION_PROFILES[profile]
+    with override_settings(SESSION_ENGINE=engine, MESSAGE_STORAGE=storage):
+        client = Client()
+        if logged_in:
+            client.force_login(User.objects.get(username="bench"))
+        pk = Post.objects.create(title="Bench", content="body").pk
+        totals = defaultdict(int)
+        requests = 0
+        for _ in range(rounds):
+            for label, call in flow(client, reverse, pk):
+                with CaptureQueriesContext(connection) as ctx:
+                    assert call().status_code in (200, 302), label
+                requests += 1
+                totals["queries"] += len(ctx.captured_queries)
+                totals["session"] += sum("django_session" in query["sql"] for query in ctx.captured_queries)
+                totals["session_writes"] += sum(
+                    "django_session" in query["sql"] and not query["sql"].startswith("SELECT")
+                    for query in ctx.captured_queries
+                )
+    return {name: value / requests for name, value in totals.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    # fragment cache ကို ပိတ် — cache hit/miss က profile နှိုင်းယှဉ်ချက်ထဲ မရောအောင်
+    harness.setup(
+        WRITE_RATE_LIMIT="100000/s",  # rate limit ဖွင့်ထား (client key အတွက် session ဖတ်) ပေမယ့် 429 မဖြစ်အောင်
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "sessions"},
+            "fragments": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+        },
+        POST_FRAGMENT_CACHE_ALIAS="fragments",
+    )
+    from django.conf import settings
+    from django.contrib.auth.models import User
+
+    User.objects.create_superuser("bench", "bench@example.com", "bench")
+    harness.seed_posts(100, 256)
+    print(f"rounds={args.rounds} (queries per request, mean)")
+    for logged_in in (False, True):
+        baseline = None
+        for profile in settings.SESSION_PROFILES:
+            result = measure(profile, logged_in, args.rounds)
+            baseline = baseline or result
+            print(
+                f"{'logged-in' if logged_in else 'anonymous':10} {profile:15} "
+                f"queries={result['queries']:5.2f}  session={result['session']:5.2f}  "
+                f"session_writes={result['session_writes']:5.2f}  "
+                f"saved={baseline['queries'] - result['queries']:5.2f}/req"
+            )
+
+
+if __name__ == "__main__":
+    main()
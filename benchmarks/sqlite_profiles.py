@@ -0,0 +1,160 @@
+"""
+SQLite profile benchmark: default (bare sqlite3) vs tuned (settings.SQLITE_PRAGMAS)
+
+    python -m benchmarks.sqlite_profiles --readers 8 --writers 2 --seconds 5
+
+Temp file DB တစ်ခုပေါ်မှာ reader / writer thread တွေကို တစ်ပြိုင်နက် run ပြီး
+ops/s နဲ့ "database is locked" error အရေအတွက်ကို နှိုင်းယှဉ်တယ်။
+- default → request တိုင်း connection အသစ် (CONN_MAX_AGE=0), rollback journal
+- tuned   → thread တစ်ခုစီ persistent connection + WAL / synchronous / mmap / cache pragmas
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE main_post (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title VARCHAR(100) NOT NULL,
+    content TEXT NOT NULL,
+    summary VARCHAR(50) NOT NULL,
+    updated_at DATETIME NOT NULL
+)
+"""
+
+
+def tuned_pragmas():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cicd_test.settings")
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    from django.conf import settings
+
+    return [f"PRAGMA {name}={value}" for name, value in settings.SQLITE_PRAGMAS.items()]
+
+
+def seed(path, rows, content_size):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    body = "x" * content_size
+    conn.executemany(
+        "INSERT INTO main_post (title, content, summary, updated_at) VALUES (?, ?, ?, datetime('now'))",
+        ((f"Post {i}", body, body[:50]) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+
+class Profile:
+    def __init__(self, path, persistent, pragmas):
+        self.path = path
+        self.persistent = persistent
+        self.pragmas = pragmas
+        self.local = threading.local()
+
+    def connect(self):
+        # Python sqlite3 default timeout (5s) ကို profile နှစ်ခုလုံးမှာ ထားတယ်
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        for pragma in self.pragmas:
+            conn.execute(pragma)
+        return conn
+
+    def run(self, fn):
+        if not self.persistent:
+            conn = self.connect()
+            try:
+                return fn(conn)
+            finally:
+                conn.close()
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.local.conn = self.connect()
+        return fn(conn)
+
+
+def read_op(rows):
+    def op(conn):
+        pk = random.randint(1, rows)
+        conn.execute("SELECT id, title, content FROM main_post WHERE id = ?", (pk,)).fetchone()
+        conn.execute("SELECT id, title, summary FROM main_post WHERE id > ? ORDER BY id LIMIT 50", (pk,)).fetchall()
+    return op
+
+
+def write_op(rows, content_size):
+    body = "y" * content_size
+
+    def op(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "UPDATE main_post SET content = ?, updated_at = datetime('now') WHERE id = ?",
+                (body, random.randint(1, rows)),
+            )
+            conn.execute(
+                "INSERT INTO main_post (title, content, summary, updated_at) VALUES (?, ?, ?, datetime('now'))",
+                ("new", body, body[:50]),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError:
+            conn.execute("ROLLBACK")
+            raise
+    return op
+
+
+def measure(profile, readers, writers, seconds, rows, content_size):
+    deadline = time.perf_counter() + seconds
+    counts = {"read": 0, "write": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def loop(kind, op):
+        done = locked = 0
+        while time.perf_counter() < deadline:
+            try:
+                profile.run(op)
+                done += 1
+            except sqlite3.OperationalError:
+                locked += 1
+        with lock:
+            counts[kind] += done
+            counts["locked"] += locked
+
+    threads = [threading.Thread(target=loop, args=("read", read_op(rows))) for _ in range(readers)]
+    threads += [threading.Thread(target=loop, args=("write", write_op(rows, content_size))) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {key: value / seconds if key != "locked" else value for key, value in counts.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--content-size", type=int, default=2048)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    profiles = {
+        "default": dict(persistent=False, pragmas=[]),
+        "tuned": dict(persistent=True, pragmas=tuned_pragmas()),
+    }
+    print(f"rows={args.rows} readers={args.readers} writers={args.writers} seconds={args.seconds}")
+    for name, options in profiles.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.sqlite3")
+            seed(path, args.rows, args.content_size)
+            result = measure(
+                Profile(path, **options), args.readers, args.writers, args.seconds, args.rows, args.content_size,
+            )
+        print(
+            f"{name:8} reads={result['read']:10.1f}/s  writes={result['write']:8.1f}/s  "
+            f"locked errors={result['locked']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Streaming index: TTFB + peak memory vs row count
+
+    python -m benchmarks.streaming_index --rows 1000,10000,50000 [--accept-encoding gzip]
+
+Row အရေအတွက် တစ်ခုစီအတွက်
+- buffered → Post အားလုံးကို row fragments render ပြီး index.html တစ်ခုလုံး memory ထဲ တည်ဆောက်
+- stream   → WSGI application ကနေ /stream/ ကို chunk တစ်ခုချင်း ဖတ်ပြီး ချက်ချင်း ပစ်
+TTFB (ပထမ body byte ရတဲ့အချိန်), total time, tracemalloc peak ကို နှိုင်းယှဉ်
+Fragment cache ကို DummyCache နဲ့ ပိတ်ထား (cache ကြီးလာတာ request memory ထဲ မရောအောင်)
+"""
+import argparse
+import time
+import tracemalloc
+
+from benchmarks import harness
+
+
+def measure(fn):
+    """fn() → first-byte time ကို report() နဲ့ မှတ် → (ttfb, total, peak)"""
+    first = []
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn(lambda: first or first.append(time.perf_counter() - started))
+    total = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (first[0] if first else total), total, peak
+
+
+def buffered(report):
+    from django.template.loader import render_to_string
+    from main.fragment_cache import render_html
+    from main.models import Post
+
+    rows = [html for _, html in render_html(Post.objects.listing().order_by("pk"), "row")]
+    body = render_to_string("index.html", {"rows": rows}).encode()
+    report()
+    return len(body)
+
+
+def streamed(application, accept_encoding):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+
+    def run(report):
+        size = 0
+        body = application(harness.wsgi_environ("/stream/", headers=headers), lambda *args: None)
+        try:
+            for chunk in body:
+                if chunk:
+                    report()
+                    size += len(chunk)
+        finally:
+            body.close()
+        return size
+    return run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1000,10000,50000", help="comma separated row counts")
+    parser.add_argument("--content-size", type=int, default=512)
+    parser.add_argument("--accept-encoding", default="", help="ဥပမာ gzip / br")
+    args = parser.parse_args(argv)
+
+    harness.setup(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    print(f"content_size={args.content_size} accept_encoding={args.accept_encoding or '-'}")
+    for rows in (int(value) for value in args.rows.split(",")):
+        harness.seed_posts(rows, args.content_size)
+        for label, fn in (("buffered", buffered), ("stream", streamed(application, args.accept_encoding))):
+            ttfb, total, peak = measure(fn)
+            print(
+                f"rows={rows:>7} {label:9} ttfb={ttfb * 1000:9.2f} ms  "
+                f"total={total * 1000:9.2f} ms  peak={peak / 1024:10.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Sync-WSGI vs async-ASGI load test (in-process, network မပါ)
+
+    python -m benchmarks.sync_vs_async --requests 2000 --concurrency 64 --path /
+
+Mode တစ်ခုစီကို VIEW_MODE env နဲ့ subprocess သီးသန့်မှာ run တယ် (urls.py က import
+time မှာ view module ရွေးလို့)။ WSGI ကို thread pool (concurrency threads) နဲ့၊
+ASGI ကို event loop တစ်ခုပေါ်မှာ concurrency ခု in-flight နဲ့ ခေါ်ပြီး
+throughput (req/s), p50 / p99 latency ကို နှိုင်းယှဉ်တယ်။
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import harness
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(mode, latencies, elapsed, errors):
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_wsgi(path, requests, concurrency):
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+
+    def call(_):
+        statuses = []
+        started = time.perf_counter()
+        body = application(harness.wsgi_environ(path), lambda status, headers, exc_info=None: statuses.append(status))
+        b"".join(body)
+        body.close()
+        return time.perf_counter() - started, statuses[0].startswith("200")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(call, range(requests)))
+    elapsed = time.perf_counter() - started
+    return summarize("sync-wsgi", [r[0] for r in results], elapsed, sum(not r[1] for r in results))
+
+
+def run_asgi(path, requests, concurrency):
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+    path, _, query = path.partition("?")
+
+    async def call(limit):
+        async with limit:
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+                "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+                "query_string": query.encode(), "root_path": "",
+                "headers": [(b"host", b"localhost")],
+                "client": ("127.0.0.1", 50000), "server": ("localhost", 80),
+            }
+            pending = [{"type": "http.request", "body": b"", "more_body": False}]
+            disconnect = asyncio.Event()
+            status = []
+
+            async def receive():
+                if pending:
+                    return pending.pop()
+                await disconnect.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+
+            started = time.perf_counter()
+            await application(scope, receive, send)
+            disconnect.set()
+            return time.perf_counter() - started, status[0] == 200
+
+    async def main():
+        limit = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(call(limit) for _ in range(requests)))
+
+    started = time.perf_counter()
+    results = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    return summarize("async-asgi", [r[0] for r in results], elapsed, sum(not r[1] for r in results))
+
+
+def worker(args):
+    harness.setup()
+    harness.seed_posts(args.rows, args.content_size)
+    runner = run_asgi if os.environ["VIEW_MODE"] == "async" else run_wsgi
+    runner(args.path, min(50, args.requests), args.concurrency)  # warm-up
+    print(json.dumps(runner(args.path, args.requests, args.concurrency)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--content-size", type=int, default=1024)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return worker(args)
+
+    child_args = list(argv if argv is not None else sys.argv[1:])
+    print(f"requests={args.requests} concurrency={args.concurrency} path={args.path}")
+    for mode in ("sync", "async"):
+        env = dict(os.environ, VIEW_MODE=mode)
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.sync_vs_async", "--worker", *child_args],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['mode']:11} {result['throughput']:10.1f} req/s  "
+            f"p50={result['p50_ms']:8.2f} ms  p99={result['p99_ms']:8.2f} ms  errors={result['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Index render microbenchmark: per-row {% url %} reverse (before) vs precomputed pk URLs (after)
+
+    python -m benchmarks.template_render --rows 10000
+
+DB မပါ — in-memory Post object rows ခုကို
+- before → template loop ထဲ row တစ်ခုစီ {% url %} ၃ ကြိမ် (get-detail, get-update-post, get-create-post)
+- after  → fragment_cache.render_html() (template တစ်ခါ load၊ URL pattern တစ်ခါ reverse) + index.html
+- concat → f-string join (lower bound reference)
+"""
+import argparse
+import statistics
+
+from benchmarks import harness
+
+BEFORE_TEMPLATE = """<ul>
+{% for item in items %}
+<li><a href="{% url 'website:get-detail' item.id %}">{{ item.title }} - {{ item.summary }}</a> <a href="{% url 'website:get-update-post' item.id %}">Edit</a><a href="{% url 'website:get-create-post' %}">Create</a></li>
+{% endfor %}
+</ul>"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    harness.setup()
+    from django.template import engines
+    from django.template.loader import render_to_string
+    from django.utils.html import escape
+    from main.fragment_cache import render_html
+    from main.models import Post
+    from main.templatetags.post_urls import post_urls
+
+    items = [Post(id=i, title=f"Post {i}", summary="lorem ipsum dolor sit amet") for i in range(1, args.rows + 1)]
+    before = engines["django"].from_string(BEFORE_TEMPLATE)
+
+    def after():
+        rows = [html for _, html in render_html(items, "row")]
+        return render_to_string("index.html", {"rows": rows})
+
+    def concat():
+        urls = post_urls()
+        return "".join(
+            f'<li><a href="{urls["detail"].format(item.id)}">{escape(item.title)} - {escape(item.summary)}</a> '
+            f'<a href="{urls["edit"].format(item.id)}">Edit</a></li>'
+            for item in items
+        )
+
+    modes = {
+        "before (url per row)": lambda: before.render({"items": items}),
+        "after (precomputed)": after,
+        "concat (reference)": concat,
+    }
+    print(f"rows={args.rows} repeat={args.repeat}")
+    for label, fn in modes.items():
+        samples = harness.timed(fn, repeat=args.repeat)
+        median = statistics.median(samples)
+        print(f"{label:22} {median * 1000:10.2f} ms  {median / args.rows * 1e6:8.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Write storm load test: unprotected vs throttled (rate limit + write admission)
+
+    python -m benchmarks.write_storm --clients 32 --requests 50 [--profile tuned]
+
+File-backed SQLite test DB (thread တွေ တကယ် writer lock ပြိုင်အောင်) ပေါ်မှာ client thread
+တစ်ခုစီ (REMOTE_ADDR / login user သီးသန့်) က POST /api/posts/ ကို ဆက်တိုက်ပစ်
+- unprotected → WRITE_RATE_LIMIT ပိတ်၊ admission limit = clients (writer အကုန် SQLite ထဲ ပုံ)
+- throttled   → settings ထဲက WRITE_RATE_LIMIT / WRITE_MAX_CONCURRENCY / WRITE_QUEUE_TIMEOUT
+Status ခွဲ (2xx / 429 / 503 / 5xx) နဲ့ latency p50 / p99 / max ကို report
+Throttled မှာ "database is locked" 500 မရှိဘဲ p99 က WRITE_QUEUE_TIMEOUT နားမှာ ငြိမ်နေရမယ်
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import harness
+from benchmarks.sync_vs_async import percentile
+
+
+def run(mode, clients, requests, database_name):
+    overrides = {}
+    if mode == "unprotected":
+        overrides = {"WRITE_RATE_LIMIT": "", "WRITE_MAX_CONCURRENCY": clients}
+    harness.setup(database_name=database_name, **overrides)
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    body = json.dumps({"title": "storm", "content": "lorem ipsum " * 40}).encode()
+    # API write က login လို — rate limit bucket က user အလိုက်ဖြစ်လို့ client တစ်ခု user တစ်ယောက်
+    cookies = [harness.session_cookie(f"storm{index}") for index in range(clients)]
+
+    def client(index):
+        results = []
+        for _ in range(requests):
+            status = []
+            environ = harness.wsgi_environ(
+                "/api/posts/", "POST", body, "application/json", headers={"Cookie": cookies[index]}
+            )
+            environ["REMOTE_ADDR"] = f"10.0.{index // 256}.{index % 256}"
+            started = time.perf_counter()
+            response = application(environ, lambda line, headers, exc_info=None: status.append(int(line.split()[0])))
+            b"".join(response)
+            response.close()
+            results.append((time.perf_counter() - started, status[0]))
+        return results
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = [result for batch in pool.map(client, range(clients)) for result in batch]
+    elapsed = time.perf_counter() - started
+    latencies = [latency for latency, _ in results]
+    statuses = Counter(
+        "2xx" if status < 300 else str(status) if status in (429, 503) else "5xx" if status >= 500 else "other"
+        for _, status in results
+    )
+    return {
+        "mode": mode,
+        "elapsed_s": elapsed,
+        "statuses": dict(statuses),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--profile", default=os.getenv("SQLITE_PROFILE", "default"), help="SQLITE_PROFILE")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        with tempfile.TemporaryDirectory() as tmp:
+            print(json.dumps(run(args.mode, args.clients, args.requests, os.path.join(tmp, "storm.sqlite3"))))
+        return
+
+    # settings (SQLITE_PROFILE) နဲ့ admission semaphore ကို mode တစ်ခုစီ process သီးသန့်မှာ
+    print(f"clients={args.clients} requests/client={args.requests} profile={args.profile}")
+    for mode in ("unprotected", "throttled"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.write_storm", "--mode", mode,
+             "--clients", str(args.clients), "--requests", str(args.requests)],
+            env={**os.environ, "SQLITE_PROFILE": args.profile},
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        statuses = " ".join(f"{key}={value}" for key, value in sorted(result["statuses"].items()))
+        print(
+            f"{mode:12} {statuses:40} p50={result['p50_ms']:8.2f} ms  "
+            f"p99={result['p99_ms']:8.2f} ms  max={result['max_ms']:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,4 +13,7 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cicd_test.settings')
 
-application = get_asgi_application()
+# Static files → middleware chain အပြင်မှာ WhiteNoise (main/static.py)
+from main.static import StaticFilesASGIHandler  # noqa: E402
+
+application = StaticFilesASGIHandler(get_asgi_application())
@@ -30,12 +30,18 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'whitenoise.runserver_nostatic',  # runserver မှာလည်း WSGI_APPLICATION (WhiteNoise wrap) က static serve
     'django.contrib.staticfiles',
     'main',
 ]
 
 MIDDLEWARE = [
+    # Static files → WhiteNoise ကို middleware chain ထဲ မထည့် (sync-only) — wsgi.py / asgi.py မှာ
+    # application ကို main.static နဲ့ wrap လို့ static request က ဒီ chain ကို မရောက်
     'django.middleware.security.SecurityMiddleware',
+    'main.metrics.RequestMetricsMiddleware',
+    'main.compression.CompressionMiddleware',  # br / gzip, streaming response ပါ
+    'main.middleware.ReplicaStickinessMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -48,10 +54,19 @@ ROOT_URLCONF = 'cicd_test.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'main.metrics.InstrumentedDjangoTemplates',  # DjangoTemplates + render timing
+        'NAME': 'django',
         'DIRS': [],
-        'APP_DIRS': True,
+        'APP_DIRS': False,
         'OPTIONS': {
+            # Cached loader ကို DEBUG ဖြစ်ဖြစ် မဖြစ်ဖြစ် အမြဲသုံး → template ကို process တစ်ခုမှာ တစ်ခါပဲ compile
+            # (template ပြင်ရင် runserver auto-reload က cache ကို reset လုပ်ပေးတယ်)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -63,16 +78,168 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'cicd_test.wsgi.application'
+ASGI_APPLICATION = 'cicd_test.asgi.application'
+
+# Post views: "sync" (WSGI, main/views.py) or "async" (ASGI, main/async_views.py)
+VIEW_MODE = os.getenv("VIEW_MODE", "sync")
 
 # ------------------------------------------------------------------------------
 # DATABASE CONFIGURATION (SQLite3)
 # ------------------------------------------------------------------------------
+# SQLITE_PROFILE = tuned (pragmas + persistent connections, WAL if SQLITE_WAL) | default (bare sqlite3)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "tuned")
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',           # readers never block the writer
+    'synchronous': 'NORMAL',         # fsync on checkpoint only (safe with WAL)
+    'mmap_size': int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    'cache_size': int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),  # negative = KiB (64 MiB)
+    'busy_timeout': int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),  # ms
+    'temp_store': 'MEMORY',
+}
+
+# journal_mode=WAL က connection setting မဟုတ်ဘဲ database file ထဲ အမြဲ မှတ်သွားလို့ default
+# (git မှာ track လုပ်ထားတဲ့ dev db.sqlite3) ကို (makemigrations --check လို command ကနေတောင်)
+# ပြောင်းပစ်တယ်။ ဒါကြောင့် tuned profile မှာတောင် WAL က opt-in — deploy / load test မှာ
+# SQLITE_WAL=true နဲ့ SQLITE_DATABASE ကို track မလုပ်ထားတဲ့ file ဆီ ညွှန်ပြီး ဖွင့်။
+SQLITE_DATABASE = Path(os.getenv("SQLITE_DATABASE", BASE_DIR / 'db.sqlite3'))
+SQLITE_WAL = os.getenv("SQLITE_WAL", "False").lower() == "true"
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': SQLITE_DATABASE,
     }
 }
+if SQLITE_PROFILE == 'tuned':
+    _pragmas = {
+        name: value for name, value in SQLITE_PRAGMAS.items()
+        if name != 'journal_mode' or SQLITE_WAL
+    }
+    DATABASES['default'].update({
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in _pragmas.items()),
+            # write transaction ကို စကတည်းက lock ယူ → read→write upgrade deadlock မဖြစ်
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'CONN_MAX_AGE': int(os.getenv("CONN_MAX_AGE", "600")),
+        'CONN_HEALTH_CHECKS': True,
+    })
+
+# Read replicas: SQLITE_REPLICAS="/path/replica1.sqlite3@3,/path/replica2.sqlite3@1"
+# (@weight is optional, used when REPLICA_STRATEGY=weighted). Reads go to replicas,
+# writes to 'default'; see main/db_router.py. Under `manage.py test` each replica gets its own
+# test database (not a MIRROR of default) and main.testing.TestRunner turns routing off; only
+# ReplicaIntegrationTest turns it back on.
+DATABASE_ROUTERS = ['main.db_router.PrimaryReplicaRouter']
+DATABASE_REPLICAS = {}
+for _index, _spec in enumerate(filter(None, os.getenv("SQLITE_REPLICAS", "").split(","))):
+    _path, _, _weight = _spec.partition('@')
+    _alias = f'replica{_index + 1}'
+    DATABASES[_alias] = {**DATABASES['default'], 'NAME': _path}
+    DATABASE_REPLICAS[_alias] = int(_weight or 1)
+REPLICA_STRATEGY = os.getenv("REPLICA_STRATEGY", "round_robin")  # round_robin | weighted
+READ_YOUR_WRITES_COOKIE = 'pin_primary'
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+
+# ------------------------------------------------------------------------------
+# CACHE (CACHE_BACKEND = locmem | file | redis)
+# ------------------------------------------------------------------------------
+CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'cicd-test'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / 'cache')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+_cache_backend, _cache_location = CACHE_BACKENDS[os.getenv("CACHE_BACKEND", "locmem")]
+CACHES = {
+    'default': {
+        'BACKEND': _cache_backend,
+        'LOCATION': os.getenv("CACHE_LOCATION", _cache_location),
+    }
+}
+
+# ------------------------------------------------------------------------------
+# SESSIONS / MESSAGES (SESSION_PROFILE = db | cached_db | cache | signed_cookies)
+# ------------------------------------------------------------------------------
+# db             → Django default (session read = SELECT, write = UPDATE/INSERT)
+# cached_db      → read ကို cache ကနေ၊ write-through DB (process တွေ cache မျှမှ — redis)
+# cache          → DB မထိ (cache eviction / restart ဆို logout)
+# signed_cookies → server-side state မရှိ (data က client ဆီမှာ signed, encrypt မလုပ်)
+# db မဟုတ်တဲ့ profile တွေမှာ messages ကို cookie ထဲမှာပဲ ထား (session fallback မသုံး)
+SESSION_PROFILES = {
+    'db': ('django.contrib.sessions.backends.db', 'django.contrib.messages.storage.fallback.FallbackStorage'),
+    'cached_db': ('django.contrib.sessions.backends.cached_db', 'django.contrib.messages.storage.cookie.CookieStorage'),
+    'cache': ('django.contrib.sessions.backends.cache', 'django.contrib.messages.storage.cookie.CookieStorage'),
+    'signed_cookies': ('django.contrib.sessions.backends.signed_cookies', 'django.contrib.messages.storage.cookie.CookieStorage'),
+}
+SESSION_PROFILE = os.getenv("SESSION_PROFILE", "cached_db" if os.getenv("CACHE_BACKEND") == "redis" else "db")
+SESSION_ENGINE, MESSAGE_STORAGE = SESSION_PROFILES[SESSION_PROFILE]
+SESSION_CACHE_ALIAS = os.getenv("SESSION_CACHE_ALIAS", "default")
+# session data မပြောင်းရင် (modified = False) save / Set-Cookie မလုပ်
+SESSION_SAVE_EVERY_REQUEST = False
+
+# Rendered post fragment cache (see main/fragment_cache.py)
+POST_FRAGMENT_CACHE_ALIAS = os.getenv("POST_FRAGMENT_CACHE_ALIAS", "default")
+POST_FRAGMENT_CACHE_TIMEOUT = int(os.getenv("POST_FRAGMENT_CACHE_TIMEOUT", "86400"))
+
+# Write-behind view counters (see main/counters.py)
+# Background flusher thread — main.testing.TestRunner က ပိတ် (test တွေက buffer.flush() ကို ကိုယ်တိုင်ခေါ်)
+VIEW_COUNT_FLUSHER = os.getenv("VIEW_COUNT_FLUSHER", "true").lower() == "true"
+VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "5"))  # seconds
+VIEW_COUNT_FLUSH_SIZE = int(os.getenv("VIEW_COUNT_FLUSH_SIZE", "1000"))  # pending increments
+POPULAR_POSTS_LIMIT = int(os.getenv("POPULAR_POSTS_LIMIT", "50"))
+
+# Post.content compression (see main/fields.py) — ဒီ UTF-8 bytes ထက်ကြီးရင် zlib နဲ့ BLOB အဖြစ်သိမ်း
+TEXT_COMPRESS_MIN_BYTES = int(os.getenv("TEXT_COMPRESS_MIN_BYTES", "1024"))
+TEXT_COMPRESS_LEVEL = int(os.getenv("TEXT_COMPRESS_LEVEL", "6"))
+
+# ------------------------------------------------------------------------------
+# PAGINATION (keyset / cursor based, see main/pagination.py)
+# ------------------------------------------------------------------------------
+POSTS_PAGE_SIZE = int(os.getenv("POSTS_PAGE_SIZE", "50"))
+POSTS_MAX_PAGE_SIZE = int(os.getenv("POSTS_MAX_PAGE_SIZE", "200"))
+# Streaming index (/stream/) — iterator chunk = row fragment batch
+POSTS_STREAM_CHUNK_SIZE = int(os.getenv("POSTS_STREAM_CHUNK_SIZE", "500"))
+
+# Full-text search (SQLite FTS5, see main/search.py)
+SEARCH_RESULTS_LIMIT = int(os.getenv("SEARCH_RESULTS_LIMIT", "20"))
+
+# Related posts (TF-IDF, see main/related.py, manage.py rebuild_related_posts)
+RELATED_POSTS_LIMIT = int(os.getenv("RELATED_POSTS_LIMIT", "5"))  # post တစ်ခုစီ သိမ်းမယ့် neighbour (top-k)
+RELATED_TERMS_PER_POST = int(os.getenv("RELATED_TERMS_PER_POST", "24"))  # sparse vector ရဲ့ term အများဆုံး
+RELATED_MAX_DF = float(os.getenv("RELATED_MAX_DF", "0.2"))  # post ရဲ့ ဒီ ratio ထက်များတဲ့ term → stopword
+
+# Background job queue (see main/tasks.py, manage.py run_worker)
+TASK_LOCK_TIMEOUT = int(os.getenv("TASK_LOCK_TIMEOUT", "300"))  # running job ကို stale လို့ ယူဆမယ့် seconds
+TASK_RETRY_BACKOFF = float(os.getenv("TASK_RETRY_BACKOFF", "2"))
+TASK_MAX_BACKOFF = float(os.getenv("TASK_MAX_BACKOFF", "600"))
+TASK_POLL_INTERVAL = float(os.getenv("TASK_POLL_INTERVAL", "1"))
+
+# Write endpoint protection (see main/throttle.py)
+# WRITE_RATE_LIMIT = "<count>/<s|m|h>" per client (user / session / IP), "" ဆို ပိတ်
+WRITE_RATE_LIMIT = os.getenv("WRITE_RATE_LIMIT", "60/m")
+RATE_LIMIT_CACHE_ALIAS = os.getenv("RATE_LIMIT_CACHE_ALIAS", "default")
+# process တစ်ခုအတွင်း concurrent writer အများဆုံး (SQLite က writer တစ်ခုပဲ ရလို့ 1)၊
+# slot စောင့်ချိန် (s) — SQLite busy_timeout ထက်တို
+WRITE_MAX_CONCURRENCY = int(os.getenv("WRITE_MAX_CONCURRENCY", "1"))
+WRITE_QUEUE_TIMEOUT = float(os.getenv("WRITE_QUEUE_TIMEOUT", "2"))
+
+# Response compression (see main/compression.py). brotli package ရှိမှ br သုံး
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# JSON API (see main/api.py)
+API_MAX_BATCH_SIZE = int(os.getenv("API_MAX_BATCH_SIZE", "500"))
+
+# Per-view SQL query budgets (URL name → max queries), enforced in tests via main/testing.py
+TEST_RUNNER = 'main.testing.TestRunner'
+VIEW_QUERY_BUDGETS = {
+    "website:index": 4,
+    "website:get-detail": 2,  # post + related posts prefetch
+    "website:search": 1,
+    "website:popular": 1,
+    "website:get-update-post": 1,
+    "website:api-posts": 2,
+    "website:api-post-detail": 1,
+}
 
 # ------------------------------------------------------------------------------
 # PASSWORD VALIDATION
@@ -98,6 +265,19 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'  # used when running collectstatic
 
+# Production → collectstatic က content-hashed filename + manifest + .gz / .br (brotli) variants ထုတ်
+# WhiteNoise (main/static.py) က hashed file တွေကို Cache-Control: immutable (10 years) နဲ့ serve
+# DEBUG → manifest မလိုဘဲ app static dirs ကနေ တိုက်ရိုက် (WHITENOISE_USE_FINDERS)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "django.contrib.staticfiles.storage.StaticFilesStorage" if DEBUG
+            else "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        ),
+    },
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'  # ✅ for uploaded user files
 
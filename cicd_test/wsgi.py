@@ -13,4 +13,7 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cicd_test.settings')
 
-application = get_wsgi_application()
+# Static files → middleware chain အပြင်မှာ WhiteNoise (main/static.py)
+from main.static import StaticFilesWSGIHandler  # noqa: E402
+
+application = StaticFilesWSGIHandler(get_wsgi_application())
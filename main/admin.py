@@ -1,6 +1,38 @@
 from django.contrib import admin
-from main.models import Post
+from main.models import Post, PostDailyStats
+from main.pagination import EstimatedCountPaginator
+from main import search, stats
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display= ['title', 'content']
+    """
+    Large table (million rows) အတွက် changelist
+    - content အစား stored summary column (SQL ထဲမှာ တွက်ပြီးသား), content ကို defer
+    - Page တစ်ခု 50 rows — changelist cost က DB ထက် row render (date format, checkbox) က များ
+    - COUNT(*) အစား PostStats count (EstimatedCountPaginator), full result count မပြ
+    - search → FTS5 MATCH (icontains full scan မဟုတ်)
+    """
+    list_display = ['title', 'summary', 'created_at']
+    list_per_page = 50
+    search_fields = ['title', 'content']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match is not None and match.url_name == 'main_post_changelist':
+            queryset = queryset.only('id', 'title', 'summary', 'created_at')
+        return queryset
+
+    def get_search_results(self, request, queryset, search_term):
+        return search.filter_queryset(queryset, search_term), False
+
+    def changelist_view(self, request, extra_context=None):
+        """Dashboard counts ကို PostStats / PostDailyStats ကနေ (COUNT(*) မလုပ်)"""
+        extra_context = {
+            'post_totals': stats.get_totals(),
+            'daily_stats': PostDailyStats.objects.all()[:14],
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context=extra_context)
@@ -0,0 +1,238 @@
+"""
+Post JSON API
+
+- ``GET    /api/posts/``        → keyset pagination list (?after= / ?before= / ?page_size=)
+- ``POST   /api/posts/``        → object တစ်ခု (သို့) list (batch create, bulk_create)
+- ``PATCH  /api/posts/``        → [{"id": .., "version": .., ...}, ...] batch partial update (bulk_update)
+- ``GET    /api/posts/<pk>/``   → detail
+- ``PATCH  /api/posts/<pk>/``   → {"version": .., ...} partial update
+- ``DELETE /api/posts/<pk>/``   → delete
+
+Batch တစ်ခုလုံးကို PostForm rules နဲ့ validate လုပ်ပြီး row တစ်ခုမှားရင် ဘာမှ မရေးဘူး
+(transaction တစ်ခုတည်း)။ Ingestion job တွေအတွက်ဖြစ်လို့ CSRF exempt — အဲ့ဒါကြောင့် body ကို
+``Content-Type: application/json`` ဆိုမှ parse (cross-site ``<form enctype="text/plain">`` → 415)။
+Write method တွေက login + model permission (main.add_post / change_post / delete_post) လို
+(401 / 403)၊ main.throttle (rate limit 429 / admission 503) ကိုလည်း ဖြတ်ရ။
+PATCH က read လုပ်တုန်းက ``version`` ပါရ — တခြား request ပြင်သွားပြီဆို (lost update မဖြစ်အောင်) 409။
+"""
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from main.forms import PostForm, non_string_errors
+from main.models import Post, PostVersionConflict
+from main.pagination import paginate, InvalidCursor
+from main.throttle import throttle_writes
+
+EDITABLE_FIELDS = ('title', 'content')
+LIST_FIELDS = ('id', 'title', 'summary', 'created_at', 'updated_at', 'version')
+WRITE_PERMISSIONS = {'POST': 'main.add_post', 'PATCH': 'main.change_post', 'DELETE': 'main.delete_post'}
+CONFLICT = {'version': [{'message': 'Post was changed by another request.', 'code': 'conflict'}]}
+
+
+class PayloadError(ValueError):
+    """Request body ကို သုံးလို့မရရင် (400 / 415)"""
+
+    def __init__(self, errors, status=400):
+        super().__init__(errors)
+        self.errors = errors
+        self.status = status
+
+
+def serialize_post(post, fields=None):
+    fields = fields or LIST_FIELDS + ('content',)
+    data = {}
+    for name in fields:
+        value = getattr(post, name)
+        data[name] = value.isoformat() if hasattr(value, 'isoformat') else value
+    return data
+
+
+def _error(errors, status=400):
+    return JsonResponse({'errors': errors}, status=status)
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_permission(request):
+    """Write method → login (401) + model permission (403) စစ်၊ ရရင် None"""
+    perm = WRITE_PERMISSIONS.get(request.method)
+    if perm is None:
+        return None
+    if not request.user.is_authenticated:
+        return _error({'auth': ['Authentication required.']}, status=401)
+    if not request.user.has_perm(perm):
+        return _error({'auth': ['Permission denied.']}, status=403)
+    return None
+
+
+def _load_json(request):
+    # Browser form က application/json နဲ့ cross-site POST လို့မရ (CORS preflight လို)
+    if request.content_type != 'application/json':
+        raise PayloadError({'body': ['Content-Type must be application/json.']}, status=415)
+    try:
+        return json.loads(request.body or b'null')
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise PayloadError({'body': [f'Invalid JSON: {exc}']}) from exc
+
+
+def _as_batch(payload):
+    """object → [object], list → list (max API_MAX_BATCH_SIZE)"""
+    items = payload if isinstance(payload, list) else [payload]
+    if not items or not all(isinstance(item, dict) for item in items):
+        raise PayloadError({'body': ['Expected a JSON object or a non-empty list of objects.']})
+    if len(items) > settings.API_MAX_BATCH_SIZE:
+        raise PayloadError({'body': [f'Batch size is limited to {settings.API_MAX_BATCH_SIZE} items.']})
+    return items
+
+
+def _validated(item, instance=None):
+    """
+    PostForm rules နဲ့ validate → (form, errors)
+    partial update ဆိုရင် မပါတဲ့ field ကို instance ကနေ ဖြည့်ပြီး ``version`` (integer) မဖြစ်မနေ ပါရ
+    """
+    invalid = non_string_errors(item, EDITABLE_FIELDS)
+    if instance is not None and not _is_int(item.get('version')):
+        invalid['version'] = [{'message': 'Expected the integer version being updated.', 'code': 'required'}]
+    if invalid:
+        return None, invalid
+    data = {
+        name: item.get(name, getattr(instance, name) if instance else '')
+        for name in EDITABLE_FIELDS
+    }
+    if instance is not None:
+        data['version'] = item['version']
+    form = PostForm(data=data, instance=instance)
+    if not form.is_valid():
+        return None, form.errors.get_json_data()
+    return form, None
+
+
+def create_posts(items):
+    """Validate all → bulk_create (transaction တစ်ခု)"""
+    posts, errors = [], {}
+    for index, item in enumerate(items):
+        form, item_errors = _validated(item)
+        if item_errors:
+            errors[index] = item_errors
+            continue
+        posts.append(form.instance)
+    if errors:
+        raise PayloadError(errors)
+    with transaction.atomic():
+        return Post.objects.bulk_create(posts)
+
+
+def update_posts(items):
+    """
+    [{"id": pk, "version": n, ...}] → validate all → bulk_update (transaction တစ်ခု)
+    Row တွေကို lock ယူပြီး (select_for_update၊ SQLite မှာ write transaction) version စစ် —
+    တစ်ခုမကိုက်ရင် ဘာမှမရေးဘဲ 409
+    """
+    ids = [item.get('id') for item in items]
+    if not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+        raise PayloadError({'body': ['Every item needs an integer "id".']})
+    if len(set(ids)) != len(ids):
+        raise PayloadError({'body': ['Duplicate ids in batch.']})
+
+    with transaction.atomic():
+        existing = Post.objects.select_for_update().in_bulk(ids)
+        posts, errors, conflicts = [], {}, {}
+        for index, item in enumerate(items):
+            instance = existing.get(item['id'])
+            if instance is None:
+                errors[index] = {'id': [{'message': 'Post not found.', 'code': 'not_found'}]}
+                continue
+            form, item_errors = _validated(item, instance)
+            if item_errors:
+                errors[index] = item_errors
+            elif instance.version != item['version']:
+                conflicts[index] = CONFLICT
+            else:
+                posts.append(form.instance)
+        if errors:
+            raise PayloadError(errors)
+        if conflicts:
+            raise PayloadError(conflicts, status=409)
+        fields = [name for name in EDITABLE_FIELDS if any(name in item for item in items)]
+        if fields:
+            Post.objects.bulk_update(posts, fields)
+    return posts
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'POST', 'PATCH'])
+@throttle_writes
+def post_collection(request):
+    if request.method == 'GET':
+        return _list(request)
+    if denied := _check_permission(request):
+        return denied
+    try:
+        payload = _load_json(request)
+        items = _as_batch(payload)
+        if request.method == 'POST':
+            posts, status = create_posts(items), 201
+        else:
+            posts, status = update_posts(items), 200
+    except PayloadError as exc:
+        return _error(exc.errors, exc.status)
+
+    results = [serialize_post(post) for post in posts]
+    if isinstance(payload, dict):
+        return JsonResponse(results[0], status=status)
+    return JsonResponse({'results': results}, status=status)
+
+
+def _list(request):
+    try:
+        page = paginate(
+            Post.objects.only(*LIST_FIELDS),
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            page_size=request.GET.get('page_size'),
+        )
+    except InvalidCursor:
+        return _error({'cursor': ['Invalid cursor.']})
+    return JsonResponse({
+        'results': [serialize_post(post, LIST_FIELDS) for post in page.items],
+        'next': page.next_cursor,
+        'previous': page.previous_cursor,
+    })
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'PATCH', 'DELETE'])
+@throttle_writes
+def post_detail(request, pk):
+    if denied := _check_permission(request):
+        return denied
+    try:
+        post = Post.objects.get(pk=pk)
+    except Post.DoesNotExist:
+        return _error({'id': ['Post not found.']}, status=404)
+
+    if request.method == 'DELETE':
+        post.delete()
+        return HttpResponse(status=204)
+    if request.method == 'PATCH':
+        try:
+            payload = _load_json(request)
+            if not isinstance(payload, dict):
+                raise PayloadError({'body': ['Expected a JSON object.']})
+            form, errors = _validated(payload, post)
+            if errors:
+                raise PayloadError(errors)
+        except PayloadError as exc:
+            return _error(exc.errors, exc.status)
+        try:
+            # ပြောင်းတဲ့ field တွေကိုပဲ UPDATE ... WHERE id = ? AND version = ?
+            form.save_changes()
+        except PostVersionConflict:
+            return _error(CONFLICT, status=409)
+    return JsonResponse(serialize_post(post))
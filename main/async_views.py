@@ -0,0 +1,183 @@
+"""
+main/views.py ရဲ့ async (ASGI-native) version များ
+
+Django async ORM (aget, aaggregate, async for, asave) ကို သုံးလို့ uvicorn စတဲ့ ASGI server
+အောက်မှာ DB round-trip အတွင်း thread-pool slot တစ်ခုကို မချုပ်ထားဘူး။
+settings.VIEW_MODE = "async" ဆိုရင် main/urls.py က ဒီ module ကို သုံးတယ်။
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import router
+from django.http import StreamingHttpResponse
+from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
+from django.views.decorators.http import require_GET, require_POST
+from django.urls import reverse
+from django.contrib import messages
+from .constants import INDEX_URL_NAME, CREATE_POST_URL_NAME, CREATE_POST_FORM_URL_NAME, UPDATE_POST_FORM_URL_NAME, ID_NOT_FOUND, VERSION_CONFLICT
+from main.models import Post, PostVersionConflict
+from main.forms import PostForm
+from main.pagination import apaginate, InvalidCursor
+from main import fragment_cache, conditional, counters, stats
+from main.throttle import throttle_writes
+
+
+@require_GET
+async def index(request):
+    """views.index ရဲ့ async version"""
+    etag, last_modified = await conditional.alisting_validators(await Post.objects.alatest_update(), request)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    try:
+        page = await apaginate(
+            Post.objects.only('id'),
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            page_size=request.GET.get('page_size'),
+        )
+    except InvalidCursor:
+        page = await apaginate(Post.objects.only('id'), page_size=request.GET.get('page_size'))
+
+    rows = await _row_html([item.pk for item in page.items])
+    totals = await stats.aget_totals()
+    context = {'items': page.items, 'rows': rows, 'page': page, 'total_posts': totals.posts}
+    response = render(request, 'index.html', context)
+    return conditional.set_validators(response, etag, last_modified)
+
+
+async def _row_html(pks):
+    """views._row_html ရဲ့ async version"""
+    versions = await fragment_cache.aget_versions(pks)
+    fragments = await fragment_cache.aget_fragments(versions, 'row')
+    missing = [pk for pk in versions if pk not in fragments]
+    if missing:
+        items = [item async for item in Post.objects.primary().listing().filter(pk__in=missing)]
+        fragments.update(await fragment_cache.arender_fragments(items, 'row', versions))
+    return [fragments[pk].html for pk in pks if pk in fragments]
+
+
+async def _stream_rows(pks, chunk_size, total_posts):
+    yield render_to_string('fragments/index_head.html', {'total_posts': total_posts})
+    empty = True
+    chunk = []
+    async for pk in pks:
+        chunk.append(pk)
+        if len(chunk) == chunk_size:
+            empty = False
+            yield "".join(await _row_html(chunk))
+            chunk = []
+    if chunk:
+        empty = False
+        yield "".join(await _row_html(chunk))
+    if empty:
+        yield "<li>No items found</li>"
+    yield render_to_string('fragments/index_tail.html')
+
+
+@require_GET
+async def index_stream(request):
+    """
+    views.index_stream ရဲ့ async version — async iterator နဲ့ ASGI အောက်မှာ buffer မလုပ်ဘဲ stream
+    """
+    etag, last_modified = await conditional.alisting_validators(await Post.objects.alatest_update(), request)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    chunk_size = settings.POSTS_STREAM_CHUNK_SIZE
+    # Body ကို ReplicaStickinessMiddleware က unpin ပြီးမှ iterate လုပ်လို့ database ကို ဒီမှာ ရွေးထား
+    using = router.db_for_read(Post)
+    pks = Post.objects.using(using).order_by('pk').values_list('pk', flat=True).aiterator(chunk_size=chunk_size)
+    totals = await stats.aget_totals()
+    content = _stream_rows(pks, chunk_size, totals.posts)
+    response = StreamingHttpResponse(content, content_type='text/html; charset=utf-8')
+    return conditional.set_validators(response, etag, last_modified)
+
+
+@require_GET
+async def get_detail(request, pk):
+    """views.get_detail ရဲ့ async version"""
+    versions = await fragment_cache.aget_versions([pk])
+    fragment = (await fragment_cache.aget_fragments(versions, 'detail')).get(pk)
+    item = None
+    if fragment is None:
+        try:
+            item = await Post.objects.primary().detail().aget(pk=pk)
+            if not item.render_version:
+                # render မလုပ်ရသေးတဲ့ row → template fallback က deferred content ကို loop ပေါ်ကနေ lazy load မလုပ်ရ
+                item.content = await Post.objects.primary().values_list('content', flat=True).aget(pk=pk)
+        except Post.DoesNotExist:
+            messages.error(request, ID_NOT_FOUND)
+            return redirect(INDEX_URL_NAME)
+        updated_at = item.updated_at
+    else:
+        updated_at = fragment.updated_at
+    counters.record_view(pk)
+
+    etag, last_modified = conditional.post_validators(pk, updated_at, versions[pk])
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    context = {'fragment': fragment.html if fragment else None}
+    if item is not None:
+        context['item'] = item
+        context['fragment'] = (await fragment_cache.arender_fragments([item], 'detail', versions))[pk].html
+    response = render(request, 'detail.html', context)
+    return conditional.set_validators(response, etag, last_modified)
+
+
+@require_POST
+@throttle_writes
+async def post_create_post(request):
+    """views.post_create_post ရဲ့ async version"""
+    form = PostForm(request.POST)
+    if form.is_valid():
+        await form.save(commit=False).asave()
+        messages.success(request, "successfully")
+        return redirect(INDEX_URL_NAME)
+    else:
+        messages.error(request, "fail")
+        return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': CREATE_POST_FORM_URL_NAME})
+
+
+@require_GET
+async def get_update_post(request, pk):
+    """views.get_update_post ရဲ့ async version"""
+    try:
+        post = await Post.objects.aget(pk=pk)
+    except Post.DoesNotExist:
+        messages.error(request, ID_NOT_FOUND)
+        return redirect(INDEX_URL_NAME)
+    form = PostForm(instance=post)
+    return render(
+        request,
+        CREATE_POST_URL_NAME,
+        {'form': form, 'action': reverse(UPDATE_POST_FORM_URL_NAME, args=[pk])}
+    )
+
+
+@require_POST
+@throttle_writes
+async def post_update_post(request, pk):
+    """views.post_update_post ရဲ့ async version"""
+    try:
+        post = await Post.objects.aget(pk=pk)
+    except Post.DoesNotExist:
+        messages.error(request, ID_NOT_FOUND)
+        return redirect(INDEX_URL_NAME)
+
+    form = PostForm(request.POST, instance=post)
+    action = reverse(UPDATE_POST_FORM_URL_NAME, args=[pk])
+    if not form.is_valid():
+        messages.error(request, "Update failed. Check the data.")
+        return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': action})
+    try:
+        await sync_to_async(form.save_changes)()
+    except PostVersionConflict:
+        messages.error(request, VERSION_CONFLICT)
+        return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': action}, status=409)
+    messages.success(request, "Update successfully")
+    return redirect(INDEX_URL_NAME)
@@ -0,0 +1,153 @@
+"""
+Response compression (br / gzip) — streaming response တွေပါ
+
+django.middleware.gzip.GZipMiddleware နဲ့ တူပေမယ့်
+- ``brotli`` package install ထားပြီး client က ``br`` လက်ခံရင် brotli ကို ဦးစားပေး
+- Streaming response ကို compressor တစ်ခုတည်းနဲ့ chunk တစ်ခုစီ sync-flush → client က
+  chunk တိုင်း ချက်ချင်း decode လုပ်နိုင် (TTFB မပျက်)၊ async iterator (ASGI) လည်း ရ
+gzip မှာ Django ရဲ့ BREACH mitigation (random filename padding) ကို ဆက်သုံးတယ်။
+Brotli မှာ အဲ့ padding မရှိလို့ CSRF token ပါတဲ့ response (create / edit form စသည်) ကို gzip နဲ့ပဲ ပို့။
+"""
+import secrets
+from gzip import GzipFile
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import StreamingBuffer, compress_string
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+MIN_LENGTH = 200
+MAX_RANDOM_BYTES = 100
+
+
+def accepted_encodings(header):
+    """Accept-Encoding → q=0 မဟုတ်တဲ့ encoding names set"""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name.lower())
+    return accepted
+
+
+def uses_csrf_token(request):
+    """
+    Response ထဲ CSRF token ပါသလား — get_token() က CSRF_COOKIE_NEEDS_UPDATE ကို set ပြီး
+    CsrfViewMiddleware.process_response က False ပြန်ထားလို့ value မဟုတ်ဘဲ key ရှိမရှိ စစ်
+    """
+    return "CSRF_COOKIE_NEEDS_UPDATE" in request.META
+
+
+def choose_encoding(header, allow_brotli=True):
+    accepted = accepted_encodings(header)
+    if allow_brotli and brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class GzipEncoder:
+    def __init__(self):
+        self.buffer = StreamingBuffer()
+        self.file = GzipFile(
+            filename=b"a" * secrets.randbelow(MAX_RANDOM_BYTES), mode="wb",
+            compresslevel=6, fileobj=self.buffer, mtime=0,
+        )
+
+    def compress(self, chunk):
+        self.file.write(chunk)
+        self.file.flush()
+        return self.buffer.read()
+
+    def finish(self):
+        self.file.close()
+        return self.buffer.read()
+
+
+class BrotliEncoder:
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, chunk):
+        return self.compressor.process(chunk) + self.compressor.flush()
+
+    def finish(self):
+        return self.compressor.finish()
+
+
+ENCODERS = {"gzip": GzipEncoder, "br": BrotliEncoder}
+
+
+def compress_bytes(encoding, content):
+    if encoding == "gzip":
+        return compress_string(content, max_random_bytes=MAX_RANDOM_BYTES)
+    return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+
+def compress_stream(encoding, chunks):
+    encoder = ENCODERS[encoding]()
+    for chunk in chunks:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+async def acompress_stream(encoding, chunks):
+    encoder = ENCODERS[encoding]()
+    async for chunk in chunks:
+        data = encoder.compress(chunk)
+        if data:
+            yield data
+    yield encoder.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """GZipMiddleware အစား — br / gzip, streaming (sync + async) response ပါ"""
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < MIN_LENGTH:
+            return response
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""), allow_brotli=not uses_csrf_token(request),
+        )
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            original = response.streaming_content
+            if response.is_async:
+                response.streaming_content = acompress_stream(encoding, original)
+            else:
+                response.streaming_content = compress_stream(encoding, original)
+            del response.headers["Content-Length"]
+        else:
+            compressed = compress_bytes(encoding, response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # Body ပြောင်းသွားလို့ strong ETag → weak (If-None-Match က weak compare နဲ့ ဆက်ကိုက်)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
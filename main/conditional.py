@@ -0,0 +1,79 @@
+"""
+Conditional GET (ETag / Last-Modified) helper
+
+Validator တွေကို Post.updated_at (indexed) ကနေ တွက်တယ်။
+- Detail → row ရဲ့ updated_at + fragment cache version (related list ပြောင်းရင် updated_at မပြောင်း)
+- Index  → MAX(updated_at) aggregate (index ပေါ်က တစ်ကြိမ် lookup) + delete marker
+Delete က MAX(updated_at) ကို မပြောင်းတဲ့အတွက် post_delete မှာ cache ထဲ timestamp မှတ်ထား။
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from main import rendering
+
+LISTING_CHANGED_KEY = "posts:listing-changed-at"
+
+
+def _make_etag(*parts):
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value else None
+
+
+def mark_listing_changed():
+    """Post delete → index validator ပြောင်းအောင် timestamp မှတ်"""
+    caches[settings.POST_FRAGMENT_CACHE_ALIAS].set(LISTING_CHANGED_KEY, timezone.now(), timeout=None)
+
+
+def post_validators(pk, updated_at, version):
+    """
+    Detail page → (etag, last_modified)
+    render_posts က updated_at မပြောင်းဘဲ content_html ပြန်ရေးလို့ renderer version ပါ etag ထဲ ထည့်
+    Neighbour edit / delete က related list ကို ပြောင်းပြီး fragment ကိုပဲ invalidate လုပ်လို့
+    fragment cache version (``fragment_cache.get_versions``) ပါ ထည့်
+    """
+    etag = _make_etag("post", pk, updated_at.isoformat(), rendering.RENDERER_VERSION, version)
+    return etag, _timestamp(updated_at)
+
+
+def listing_validators(latest, request):
+    """
+    Index page → (etag, last_modified), query string ပါ etag ထဲ ထည့်
+    latest = Post.objects.latest_update() (MAX(updated_at))
+    """
+    changed_at = caches[settings.POST_FRAGMENT_CACHE_ALIAS].get(LISTING_CHANGED_KEY)
+    return _listing_validators(latest, changed_at, request)
+
+
+async def alisting_validators(latest, request):
+    """listing_validators() ရဲ့ async version (cache ကို event loop မ block ဘဲ ဖတ်)"""
+    changed_at = await caches[settings.POST_FRAGMENT_CACHE_ALIAS].aget(LISTING_CHANGED_KEY)
+    return _listing_validators(latest, changed_at, request)
+
+
+def _listing_validators(latest, changed_at, request):
+    if changed_at and (latest is None or changed_at > latest):
+        latest = changed_at
+    etag = _make_etag("listing", latest.isoformat() if latest else "", request.GET.urlencode())
+    return etag, _timestamp(latest)
+
+
+def not_modified(request, etag, last_modified):
+    """Client cache valid ဖြစ်ရင် 304 (သို့) 412 response, မဟုတ်ရင် None"""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    if last_modified and not response.has_header("Last-Modified"):
+        response.headers["Last-Modified"] = http_date(last_modified)
+    if etag:
+        response.headers.setdefault("ETag", etag)
+    return response
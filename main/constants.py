@@ -3,4 +3,5 @@ INDEX_URL_NAME = "website:index"
 CREATE_POST_URL_NAME='create_post.html'
 CREATE_POST_FORM_URL_NAME = "website:post-create-post"
 UPDATE_POST_FORM_URL_NAME = "website:post-update-post"
-ID_NOT_FOUND = "Id not found"
\ No newline at end of file
+ID_NOT_FOUND = "Id not found"
+VERSION_CONFLICT = "This post was changed by someone else. Reload it and try again."
\ No newline at end of file
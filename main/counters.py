@@ -0,0 +1,159 @@
+"""
+Write-behind post view counters
+
+    counters.record_view(pk)
+
+- Increment ကို process memory (Counter) ထဲမှာပဲ စု → page view တိုင်း SQLite writer lock မယူ၊
+  request thread က DB ကို လုံးဝမထိ
+- Background flusher thread က VIEW_COUNT_FLUSH_INTERVAL စက္ကန့်တစ်ခါ (သို့) pending increment
+  VIEW_COUNT_FLUSH_SIZE ခုပြည့်လို့ နှိုးရင် transaction တစ်ခုတည်းနဲ့ PostViews ထဲ ``count = count + n`` upsert
+- Flusher ကို settings.VIEW_COUNT_FLUSHER ဖွင့်ထားမှ ပထမ record_view မှာ စ (fork ပြီးမှ — worker
+  process တစ်ခုစီမှာ)။ ပိတ်ထားရင် (test runner) ``buffer.flush()`` ကို ကိုယ်တိုင်ခေါ်
+- Worker process အများကြီးရှိလည်း delta ကိုပဲ ပေါင်းထည့်လို့ count မပျောက် (overwrite မလုပ်)
+- Flush fail (ဥပမာ database is locked) ရင် log ပြီး delta ကို buffer ထဲ ပြန်ထည့်၊ နောက် interval မှာ ထပ်ကြိုး
+- Upsert ကို WRITE_CHUNK_SIZE post စီ ခွဲရေး → fail ပြီး delta တွေ စုလာလည်း SQLite bound
+  variable limit မကျော် (transaction ကတော့ တစ်ခုတည်း)
+- Process ပိတ်ရင် atexit နဲ့ flusher ကို ရပ်ပြီး နောက်ဆုံး flush — SIGKILL / crash ဆိုရင်တော့
+  မ flush ရသေးတာ ပျောက်
+"""
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections, router, transaction
+
+logger = logging.getLogger(__name__)
+
+# Upsert statement တစ်ခုမှာ post 499 (bound variable 998) — SQLite 3.32 မတိုင်ခင် limit 999 မကျော်အောင်
+# (pk__in SELECT ကိုလည်း အတူတူ ခွဲ)
+WRITE_CHUNK_SIZE = 499
+
+UPSERT_SQL = (
+    'INSERT INTO main_postviews (post_id, count) VALUES {values} '
+    'ON CONFLICT (post_id) DO UPDATE SET count = main_postviews.count + excluded.count'
+)
+
+
+class ViewCounter:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._size = 0
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def add(self, pk, n=1):
+        """Increment ကို buffer ထဲထည့် (DB မထိ)၊ size threshold ပြည့်ရင် flusher ကို နှိုး"""
+        with self._lock:
+            self._pending[pk] += n
+            self._size += n
+            if settings.VIEW_COUNT_FLUSHER and (self._thread is None or not self._thread.is_alive()):
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+                self._thread.start()
+            if self._size >= settings.VIEW_COUNT_FLUSH_SIZE:
+                self._wake.set()
+
+    def stop(self):
+        """Flusher thread ကို ရပ် (ရပ်ခါနီး နောက်ဆုံး flush တစ်ခါ)"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wake.wait(settings.VIEW_COUNT_FLUSH_INTERVAL)
+            self._wake.clear()
+            try:
+                self._flush_logged()
+            finally:
+                connections.close_all()  # ဒီ thread ရဲ့ connection တွေပဲ
+
+    def _flush_logged(self):
+        try:
+            self.flush()
+        except Exception:
+            # delta ကို _restore ပြီးသား — နောက် interval မှာ ထပ်ကြိုး
+            logger.exception("View count flush failed; %d posts kept for retry", len(self.pending()))
+
+    def pending(self):
+        with self._lock:
+            return dict(self._pending)
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._size = 0
+            return pending
+
+    def _restore(self, pending):
+        with self._lock:
+            self._pending.update(pending)
+            self._size += sum(pending.values())
+
+    def discard(self):
+        self._take()
+
+    def flush(self):
+        """Buffer ကို DB ထဲ ရေး → ရေးခဲ့တဲ့ post အရေအတွက်"""
+        pending = self._take()
+        if not pending:
+            return 0
+        try:
+            return write_counts(pending)
+        except Exception:
+            self._restore(pending)
+            raise
+
+
+def write_counts(counts):
+    """
+    {pk: n} → PostViews upsert (WRITE_CHUNK_SIZE post စီ statement တစ်ခု၊ transaction တစ်ခုတည်း)
+    ဖျက်ပြီးသား post ကို ကျော်
+    """
+    from main.models import Post, PostViews
+
+    using = router.db_for_write(PostViews)
+    pks = sorted(counts)
+    written = 0
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        for start in range(0, len(pks), WRITE_CHUNK_SIZE):
+            chunk = pks[start:start + WRITE_CHUNK_SIZE]
+            existing = sorted(Post.objects.using(using).filter(pk__in=chunk).values_list('pk', flat=True))
+            if not existing:
+                continue
+            values = ", ".join(["(%s, %s)"] * len(existing))
+            params = [value for pk in existing for value in (pk, counts[pk])]
+            cursor.execute(UPSERT_SQL.format(values=values), params)
+            written += len(existing)
+    return written
+
+
+buffer = ViewCounter()
+atexit.register(buffer.stop)
+
+
+def record_view(pk):
+    """Detail page view တစ်ခု — memory ထဲပဲ ထည့်လို့ async view ကနေလည်း တိုက်ရိုက်ခေါ်လို့ရ"""
+    buffer.add(pk)
+
+
+def popular(limit):
+    """
+    View အများဆုံး post ``limit`` ခု — main_postviews_popular_idx (count DESC, post_id DESC) ကို
+    index order အတိုင်း ဖတ်ပြီး main_post ကို pk နဲ့ join (query တစ်ခုတည်း)
+    """
+    from main.models import PostViews
+
+    return (
+        PostViews.objects.select_related('post').only('count', 'post__id', 'post__title')
+        .order_by('-count', '-post')[:limit]
+    )
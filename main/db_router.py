@@ -0,0 +1,66 @@
+"""
+Primary / read-replica database router
+
+- Write → 'default' (primary)
+- Read  → settings.DATABASE_REPLICAS ထဲက alias (round_robin / weighted)
+- ReplicaStickinessMiddleware က write လုပ်ပြီး READ_YOUR_WRITES_SECONDS အတွင်း
+  (cookie window) read တွေကို primary ကိုပဲ ပို့ (read-your-writes)
+"""
+import itertools
+import random
+import threading
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+_pinned_to_primary = ContextVar("pinned_to_primary", default=False)
+
+
+def pin_to_primary(value=True):
+    """Current request / task ရဲ့ read တွေကို primary ဆီ ပို့ (reset token ပြန်ပေး)"""
+    return _pinned_to_primary.set(value)
+
+
+def unpin(token):
+    _pinned_to_primary.reset(token)
+
+
+def is_pinned():
+    return _pinned_to_primary.get()
+
+
+class PrimaryReplicaRouter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cycle = None
+        self._cycle_key = None
+
+    def _replicas(self):
+        return getattr(settings, "DATABASE_REPLICAS", {}) or {}
+
+    def _round_robin(self, replicas):
+        key = tuple(replicas)
+        with self._lock:
+            if self._cycle_key != key:
+                self._cycle_key, self._cycle = key, itertools.cycle(key)
+            return next(self._cycle)
+
+    def db_for_read(self, model, **hints):
+        replicas = self._replicas()
+        if not replicas or is_pinned():
+            return DEFAULT_DB_ALIAS
+        if settings.REPLICA_STRATEGY == "weighted":
+            return random.choices(list(replicas), weights=list(replicas.values()))[0]
+        return self._round_robin(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary / replica အားလုံး data တူတူပဲ
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Local SQLite stand-in replica တွေကိုလည်း `migrate --database replicaN` လုပ်လို့ရအောင်
+        return True
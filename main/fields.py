@@ -0,0 +1,191 @@
+"""
+CompressedTextField — TextField ကို SQLite မှာ zlib နဲ့ ချုံ့သိမ်း
+
+- UTF-8 size က TEXT_COMPRESS_MIN_BYTES ထက် ကြီးပြီး ချုံ့လို့ ပိုသေးမှ BLOB (codec marker 1 byte +
+  မူလ UTF-8 size ASCII digits + ``:`` + zlib stream) အဖြစ် သိမ်း၊ ကျန်တာ plain TEXT အတိုင်း
+  → column တစ်ခုထဲမှာ နှစ်မျိုးရော
+- DB ကနေ ဖတ်ရင် CompressedText (bytes wrapper) ပဲ ထားပြီး attribute ကို ပထမဆုံး access လုပ်မှ
+  decompress (descriptor) → listing / title-only save စတာတွေမှာ decompress cost မရှိ
+- Access မလုပ်ခဲ့ရင် save() က ချုံ့ပြီးသား bytes ကို ပြန်ရေး (decompress → compress မလုပ်)
+- values() / values_list() row တွေကိုတော့ ``decompressing_iterable()`` နဲ့ str ပြောင်းပေး
+- SQL ထဲကနေ (trigger စသည်) decompress မလုပ်နိုင် — app function မလို (sqlite3 CLI / backup tool ကနေ
+  write လုပ်လို့ရအောင်)၊ size ကိုတော့ ``CAST(substr(x, 2, 20) AS INTEGER)`` နဲ့ header ကနေ ဖတ်နိုင်
+
+SQLite မဟုတ်တဲ့ backend မှာ plain TextField အတိုင်း (မချုံ့)။
+"""
+import zlib
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.db.models.query_utils import DeferredAttribute
+
+ZLIB = b"z"
+SIZE_END = b":"
+
+
+class CompressedText:
+    """DB ကဖတ်ထားတဲ့ ချုံ့ထားသော value (decompress မလုပ်ရသေး)"""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = bytes(data)
+
+    def __repr__(self):
+        return f"<CompressedText: {len(self.data)} bytes>"
+
+    def __eq__(self, other):
+        return isinstance(other, CompressedText) and other.data == self.data
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def decompress(self):
+        return decompress(self.data)
+
+
+def may_compress(text):
+    """compress() က BLOB ပြန်နိုင်တဲ့ size လား (ချုံ့မကြည့်ဘဲ)"""
+    return len(text.encode()) >= settings.TEXT_COMPRESS_MIN_BYTES
+
+
+def compress(text, min_bytes=None):
+    """str → BLOB (ချုံ့ထိုက်ရင်) သို့ မူလ str"""
+    min_bytes = settings.TEXT_COMPRESS_MIN_BYTES if min_bytes is None else min_bytes
+    raw = text.encode()
+    if len(raw) < min_bytes:
+        return text
+    packed = ZLIB + str(len(raw)).encode() + SIZE_END + zlib.compress(raw, settings.TEXT_COMPRESS_LEVEL)
+    return packed if len(packed) < len(raw) else text
+
+
+def decompress(value):
+    """Stored value (TEXT / BLOB / CompressedText / NULL) → str"""
+    if isinstance(value, CompressedText):
+        value = value.data
+    if not isinstance(value, (bytes, memoryview)):
+        return value
+    value = bytes(value)
+    size, end, body = value[1:].partition(SIZE_END)
+    if value[:1] != ZLIB or not end or not size.isdigit():
+        raise ValueError(f"Unknown compressed text codec {value[:1]!r}")
+    return zlib.decompress(body).decode()
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    """
+    ပထမဆုံး access မှ decompress ပြီး instance ပေါ်မှာ str အဖြစ် cache
+    Data descriptor (__set__ ပါ) ဖြစ်မှ instance __dict__ ထဲ value ရှိနေလည်း __get__ ကို ဖြတ်
+    """
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+    def __get__(self, instance, cls=None):
+        value = super().__get__(instance, cls)
+        if isinstance(value, CompressedText):
+            value = instance.__dict__[self.field.attname] = value.decompress()
+        return value
+
+
+class CompressedTextField(models.TextField):
+    descriptor_class = CompressedTextDescriptor
+
+    def from_db_value(self, value, expression, connection):
+        if isinstance(value, (bytes, memoryview)):
+            return CompressedText(value)
+        return value
+
+    def to_python(self, value):
+        if isinstance(value, CompressedText):
+            return value.decompress()
+        return super().to_python(value)
+
+    def pre_save(self, model_instance, add):
+        # Access မလုပ်ခဲ့ရင် (ပြောင်းမှာ မဟုတ်) loaded bytes ကို decompress မလုပ်ဘဲ ပြန်ရေး
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, CompressedText):
+            return value
+        return super().pre_save(model_instance, add)
+
+    def get_db_prep_save(self, value, connection):
+        # Lookup (icontains စသည်) value ကို မချုံ့ — INSERT / UPDATE value မှာပဲ
+        if isinstance(value, CompressedText):
+            return value.data
+        value = super().get_db_prep_save(value, connection)
+        if connection.vendor == "sqlite" and isinstance(value, str):
+            return compress(value)
+        return value
+
+
+def _resolve(value):
+    return value.decompress() if isinstance(value, CompressedText) else value
+
+
+def _resolve_row(row):
+    if isinstance(row, dict):
+        if any(isinstance(value, CompressedText) for value in row.values()):
+            return {key: _resolve(value) for key, value in row.items()}
+        return row
+    if isinstance(row, tuple):
+        if any(isinstance(value, CompressedText) for value in row):
+            values = [_resolve(value) for value in row]
+            return row._make(values) if hasattr(row, "_make") else tuple(values)
+        return row
+    return _resolve(row)
+
+
+_ITERABLES = {}
+
+
+def decompressing_iterable(iterable_class):
+    """values() / values_list() iterable class → CompressedText ကို str ပြောင်းပေးတဲ့ subclass"""
+    if iterable_class in _ITERABLES.values():
+        return iterable_class
+    if iterable_class not in _ITERABLES:
+        class Iterable(iterable_class):
+            def __iter__(self):
+                for row in super().__iter__():
+                    yield _resolve_row(row)
+
+        Iterable.__name__ = Iterable.__qualname__ = f"Decompressing{iterable_class.__name__}"
+        _ITERABLES[iterable_class] = Iterable
+    return _ITERABLES[iterable_class]
+
+
+def compress_rows(model, field_name, chunk_size=1000, decompress_all=False, using=DEFAULT_DB_ALIAS):
+    """
+    ရှိပြီးသား rows ကို pk range chunk တစ်ခုချင်း (transaction တစ်ခုစီ) ချုံ့ / decompress_all=True ဆို ပြန်ဖြေ
+    Raw UPDATE ပဲ သုံးလို့ updated_at / version / signal မပြောင်း
+    Chunk ပြီးတိုင်း (scanned, rewritten) cumulative ကို yield
+    """
+    conn = connections[using]
+    table = conn.ops.quote_name(model._meta.db_table)
+    pk = conn.ops.quote_name(model._meta.pk.column)
+    column = conn.ops.quote_name(model._meta.get_field(field_name).column)
+    wanted = "blob" if decompress_all else "text"
+    last_pk = 0
+    scanned = rewritten = 0
+    while True:
+        with transaction.atomic(using=using), conn.cursor() as cursor:
+            # ပြောင်းစရာမရှိတဲ့ rows ရဲ့ content ကို မဖတ် (NULL)
+            cursor.execute(
+                f"SELECT {pk}, CASE WHEN typeof({column}) = %s THEN {column} END FROM {table} "
+                f"WHERE {pk} > %s ORDER BY {pk} LIMIT %s",
+                [wanted, last_pk, chunk_size],
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            updates = []
+            for row_pk, value in rows:
+                if value is None:
+                    continue
+                new = decompress(value) if decompress_all else compress(value)
+                if new is not value:
+                    updates.append((new, row_pk))
+            if updates:
+                cursor.executemany(f"UPDATE {table} SET {column} = %s WHERE {pk} = %s", updates)
+        last_pk = rows[-1][0]
+        scanned += len(rows)
+        rewritten += len(updates)
+        yield scanned, rewritten
@@ -1,11 +1,26 @@
 from django import forms
 from .models import Post
 
+
+def non_string_errors(data, fields=('title', 'content')):
+    """
+    JSON ကလာတဲ့ data ထဲ string မဟုတ်တဲ့ field → ``form.errors.get_json_data()`` ပုံစံ error dict
+    Form က list / number ကို str() ပြောင်းပြီး "['a']" အဖြစ် သိမ်းမိလို့ form မဖြတ်ခင် စစ် (API, import_posts)
+    """
+    return {
+        name: [{'message': 'Expected a string.', 'code': 'invalid'}]
+        for name in fields
+        if name in data and not isinstance(data[name], str)
+    }
+
 class PostForm(forms.ModelForm):
     """
     Post model အတွက် form
     - title, content field အတွက် user input လက်ခံ
+    - version (hidden) → form ဖွင့်တုန်းက Post.version၊ update မှာ lost update စစ်ဖို့
     """
+    version = forms.IntegerField(widget=forms.HiddenInput, required=False, min_value=1)
+
     class Meta:
         model = Post
         fields = ['title', 'content']  # Form မှာ အသုံးပြုမယ့် fields
@@ -18,3 +33,16 @@ class PostForm(forms.ModelForm):
             'content': 'အကြောင်းအရာ',
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields['version'].initial = self.instance.version
+
+    def save_changes(self):
+        """
+        Instance နဲ့ ကွာတဲ့ field တွေကိုပဲ Post.save_changes() နဲ့ ရေး — ဘာမှမပြောင်းရင် False
+        version မပါတဲ့ submit ဆိုရင် load လုပ်ထားတဲ့ instance ရဲ့ version နဲ့ စစ်
+        """
+        fields = [name for name in self.changed_data if name in self._meta.fields]
+        return self.instance.save_changes(fields, self.cleaned_data.get('version') or self.instance.version)
+
@@ -0,0 +1,146 @@
+"""
+Post အလိုက် rendered HTML fragment cache
+
+Key = ``post:<pk>:v<version>:<name>``. Post တစ်ခု ပြောင်းရင် (save / delete)
+version counter ကို တိုးလိုက်တာနဲ့ အဟောင်း fragment တွေ အလိုလို orphan ဖြစ်သွားတယ်။
+Backend ကို settings.CACHES / POST_FRAGMENT_CACHE_ALIAS နဲ့ ရွေးလို့ရ။
+``a``-prefix function တွေက async view အတွက် — file / redis backend ဆိုရင် sync API က
+event loop ကို block လုပ်လို့ cache ရဲ့ async API (aget_many / aset_many / aadd) ကို သုံး။
+"""
+import time
+from typing import NamedTuple, Optional
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from main.templatetags.post_urls import post_urls
+
+
+class Fragment(NamedTuple):
+    html: str
+    updated_at: Optional[datetime]  # Last-Modified / ETag validator (deferred ဆိုရင် None)
+
+
+def _cache():
+    return caches[settings.POST_FRAGMENT_CACHE_ALIAS]
+
+
+def _version_key(pk):
+    return f"post:{pk}:version"
+
+
+def _fragment_key(pk, version, name):
+    return f"post:{pk}:v{version}:{name}"
+
+
+def _new_version():
+    # Version key evict ဖြစ်သွားရင်တောင် အဟောင်း fragment နဲ့ မတိုက်အောင် time-based seed
+    return time.time_ns()
+
+
+def get_versions(pks):
+    """pk list → {pk: version}. မရှိသေးတဲ့ counter ကို initialize"""
+    cache = _cache()
+    keys = {_version_key(pk): pk for pk in pks}
+    found = cache.get_many(keys)
+    versions = {keys[key]: value for key, value in found.items()}
+    for key, pk in keys.items():
+        if pk not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[pk] = cache.get(key)
+    return versions
+
+
+async def aget_versions(pks):
+    """get_versions() ရဲ့ async version"""
+    cache = _cache()
+    keys = {_version_key(pk): pk for pk in pks}
+    found = await cache.aget_many(keys)
+    versions = {keys[key]: value for key, value in found.items()}
+    for key, pk in keys.items():
+        if pk not in versions:
+            await cache.aadd(key, _new_version(), timeout=None)
+            versions[pk] = await cache.aget(key)
+    return versions
+
+
+def invalidate(pk):
+    """Post pk ရဲ့ fragment အားလုံးကို invalid ဖြစ်အောင် version တိုး"""
+    cache = _cache()
+    key = _version_key(pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), timeout=None)
+
+
+def get_fragments(versions, name):
+    """
+    versions ({pk: version}, get_versions() ကနေ) → cache hit ဖြစ်တဲ့ {pk: Fragment}
+
+    DB ကနေ Post ကို မဖတ်ခင် version ကို အရင်ယူထားရမယ် — ဒါမှ ကြားထဲ save ဖြစ်ရင်
+    stale render ကို version အသစ်နဲ့ cache မလုပ်မိမှာ။
+    """
+    if not versions:
+        return {}
+    keys = _fragment_keys(versions, name)
+    return _hits(keys, _cache().get_many(keys))
+
+
+async def aget_fragments(versions, name):
+    """get_fragments() ရဲ့ async version"""
+    if not versions:
+        return {}
+    keys = _fragment_keys(versions, name)
+    return _hits(keys, await _cache().aget_many(keys))
+
+
+def _fragment_keys(versions, name):
+    return {_fragment_key(pk, version, name): pk for pk, version in versions.items()}
+
+
+def _hits(keys, found):
+    return {
+        keys[key]: Fragment(mark_safe(html), updated_at)
+        for key, (html, updated_at) in found.items()
+    }
+
+
+def render_html(items, name):
+    """
+    items → [(item, html)], cache မပါ
+    Template ကို တစ်ခါပဲ load ပြီး pk URL patterns ကို render တစ်ခါ reverse တစ်ကြိမ်ပဲ လုပ်
+    """
+    template = get_template(f"fragments/post_{name}.html")
+    urls = post_urls()
+    return [(item, template.render({"item": item, "urls": urls})) for item in items]
+
+
+def render_fragments(items, name, versions):
+    """
+    items အတွက် ``fragments/post_<name>.html`` ကို render ပြီး versions နဲ့ cache
+    {pk: Fragment} ကို return ပြန်
+    """
+    rendered, to_cache = _render(items, name, versions)
+    _cache().set_many(to_cache, timeout=settings.POST_FRAGMENT_CACHE_TIMEOUT)
+    return rendered
+
+
+async def arender_fragments(items, name, versions):
+    """render_fragments() ရဲ့ async version (items က list ဖြစ်ရမယ် — queryset ကို loop ပေါ်မှာ မဖတ်)"""
+    rendered, to_cache = _render(items, name, versions)
+    await _cache().aset_many(to_cache, timeout=settings.POST_FRAGMENT_CACHE_TIMEOUT)
+    return rendered
+
+
+def _render(items, name, versions):
+    rendered = {}
+    to_cache = {}
+    for item, html in render_html(items, name):
+        updated_at = None if 'updated_at' in item.get_deferred_fields() else item.updated_at
+        rendered[item.pk] = Fragment(html, updated_at)
+        to_cache[_fragment_key(item.pk, versions[item.pk], name)] = (html, updated_at)
+    return rendered, to_cache
@@ -0,0 +1,34 @@
+"""
+import_posts / export_posts အတွက် shared helper (underscore prefix → command မဟုတ်)
+"""
+import sys
+from contextlib import contextmanager
+
+from django.core.management.base import CommandError
+
+FORMATS = ("jsonl", "csv")
+EXPORT_FIELDS = ("id", "title", "content", "created_at", "updated_at")
+
+
+def detect_format(path, fmt=None):
+    """--format မပေးရင် file extension ကနေ ခန့်မှန်း ('-' → jsonl)"""
+    if fmt:
+        return fmt
+    if path.endswith(".csv"):
+        return "csv"
+    if path == "-" or path.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    raise CommandError(f"Cannot infer format from {path!r}; pass --format jsonl|csv.")
+
+
+@contextmanager
+def open_stream(path, mode):
+    """'-' → stdin/stdout, မဟုတ်ရင် UTF-8 text file (csv အတွက် newline='')"""
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    try:
+        with open(path, mode, encoding="utf-8", newline="") as stream:
+            yield stream
+    except OSError as exc:
+        raise CommandError(str(exc)) from exc
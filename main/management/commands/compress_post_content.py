@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, DEFAULT_DB_ALIAS
+from main import fields
+from main.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Compress existing Post.content rows larger than TEXT_COMPRESS_MIN_BYTES "
+        "(or decompress them all with --decompress) in pk-ordered chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument("--decompress", action="store_true", help="Rewrite compressed rows as plain text.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, chunk_size, decompress, database, **options):
+        if connections[database].vendor != "sqlite":
+            raise CommandError("Compressed content storage requires the SQLite backend.")
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        scanned = rewritten = 0
+        rows = fields.compress_rows(Post, "content", chunk_size=chunk_size, decompress_all=decompress, using=database)
+        for scanned, rewritten in rows:
+            if options["verbosity"] > 1:
+                self.stdout.write(f"scanned {scanned} posts, rewrote {rewritten}")
+        action = "decompressed" if decompress else f"compressed (>= {settings.TEXT_COMPRESS_MIN_BYTES} bytes)"
+        self.stdout.write(self.style.SUCCESS(f"{rewritten} of {scanned} posts {action}"))
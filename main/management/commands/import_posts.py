@@ -0,0 +1,91 @@
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from main.forms import PostForm, non_string_errors
+from main.models import Post
+from ._post_io import FORMATS, detect_format, open_stream
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream posts from a JSONL or CSV file, validate each row with PostForm and "
+        "insert them with bulk_create in batches (one transaction per batch)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or '-' for stdin.")
+        parser.add_argument("--format", dest="fmt", choices=FORMATS)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--skip-invalid", action="store_true",
+            help="Report and skip rows that fail PostForm validation instead of aborting.",
+        )
+
+    def handle(self, *args, path, fmt, batch_size, skip_invalid, **options):
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+        fmt = detect_format(path, fmt)
+        verbosity = options["verbosity"]
+
+        started = time.perf_counter()
+        imported = skipped = 0
+        batch = []
+        with open_stream(path, "r") as stream:
+            for line_no, row in self._rows(stream, fmt):
+                # API နဲ့ rule တူ — JSON က string မဟုတ်တဲ့ title / content ကို str() မပြောင်းဘဲ invalid row
+                errors = non_string_errors(row)
+                if not errors:
+                    form = PostForm(data={"title": row.get("title", ""), "content": row.get("content", "")})
+                    if not form.is_valid():
+                        errors = form.errors.get_json_data()
+                if errors:
+                    message = f"line {line_no}: {json.dumps(errors)}"
+                    if not skip_invalid:
+                        raise CommandError(
+                            f"Invalid row ({message}); {imported} posts were already imported."
+                        )
+                    self.stderr.write(message)
+                    skipped += 1
+                    continue
+                batch.append(form.save(commit=False))
+                if len(batch) >= batch_size:
+                    imported += self._flush(batch)
+                    if verbosity > 1:
+                        self.stdout.write(f"imported {imported} posts")
+            imported += self._flush(batch)
+
+        elapsed = time.perf_counter() - started
+        rate = imported / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} posts ({skipped} skipped) in {elapsed:.2f}s, {rate:,.0f} rows/s"
+        ))
+
+    def _rows(self, stream, fmt):
+        """(line number, dict) ကို တစ်ကြောင်းချင်း yield — file တစ်ခုလုံး memory ထဲ မတင်"""
+        if fmt == "csv":
+            reader = csv.DictReader(stream)
+            for row in reader:
+                yield reader.line_num, row
+            return
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise CommandError(f"line {line_no}: invalid JSON ({exc})") from exc
+            if not isinstance(row, dict):
+                raise CommandError(f"line {line_no}: expected a JSON object")
+            yield line_no, row
+
+    def _flush(self, batch):
+        if not batch:
+            return 0
+        count = len(batch)
+        with transaction.atomic():
+            Post.objects.bulk_create(batch)
+        batch.clear()
+        return count
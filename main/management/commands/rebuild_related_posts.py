@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from main import related
+
+
+class Command(BaseCommand):
+    help = "Recompute the TF-IDF vocabulary, post vectors and top-k related posts for the whole corpus."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, chunk_size, database, **options):
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        started = time.perf_counter()
+        total = 0
+        for stage, total in related.rebuild(chunk_size=chunk_size, using=database):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{stage}: {total} posts")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Related posts rebuilt: {total} posts in {elapsed:.1f}s"))
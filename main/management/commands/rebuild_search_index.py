@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, DEFAULT_DB_ALIAS
+from main import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the SQLite FTS5 post search index in pk-ordered batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, batch_size, database, **options):
+        conn = connections[database]
+        if not search.is_supported(conn):
+            raise CommandError("Full-text search index requires the SQLite backend.")
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        total = 0
+        for total in search.rebuild(batch_size=batch_size, conn=conn):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"indexed {total} posts")
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt: {total} posts"))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, DEFAULT_DB_ALIAS
+from main import stats
+
+
+class Command(BaseCommand):
+    help = "Recompute PostStats / PostDailyStats from main_post in pk-ordered chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=10000)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, chunk_size, database, **options):
+        conn = connections[database]
+        if not stats.is_supported(conn):
+            raise CommandError("Post stats triggers require the SQLite backend.")
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        stats.install(conn)
+        total = 0
+        for total in stats.reconcile(chunk_size=chunk_size, conn=conn):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"scanned {total} posts")
+        totals = stats.get_totals(using=database)
+        self.stdout.write(self.style.SUCCESS(
+            f"Post stats reconciled: {totals.posts} posts, {totals.content_bytes} content bytes"
+        ))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from main import rendering
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-render Post.content_html for posts rendered by an older RENDERER_VERSION "
+        "(or all posts with --all) using a process pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--processes", type=int, default=None, help="Worker processes (default: CPU count).")
+        parser.add_argument("--all", action="store_true", dest="force", help="Re-render up-to-date posts too.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, chunk_size, processes, force, database, **options):
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+        if processes is not None and processes < 1:
+            raise CommandError("--processes must be positive.")
+
+        total = 0
+        for total in rendering.rerender_posts(chunk_size, processes, force, using=database):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"rendered {total} posts")
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {total} posts (renderer version {rendering.RENDERER_VERSION})"
+        ))
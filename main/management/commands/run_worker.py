@@ -0,0 +1,36 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from main import tasks
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (main.tasks) in batches; polls until interrupted unless --once."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain due jobs once and exit.")
+        parser.add_argument("--names", nargs="+", help="Only run jobs with these task names.")
+        parser.add_argument("--max-batches", type=int, help="Stop after this many batches per poll.")
+
+    def handle(self, *args, once, names, max_batches, **options):
+        if max_batches is not None and max_batches < 1:
+            raise CommandError("--max-batches must be positive.")
+        unknown = [name for name in names or () if tasks.get_task(name) is None]
+        if unknown:
+            raise CommandError(f"Unknown task names: {', '.join(unknown)}")
+
+        total = 0
+        try:
+            while True:
+                processed = tasks.run_pending(limit=max_batches, names=names)
+                total += processed
+                if processed and options["verbosity"] > 1:
+                    self.stdout.write(f"processed {processed} jobs")
+                if once:
+                    break
+                if not processed:
+                    time.sleep(settings.TASK_POLL_INTERVAL)
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Worker processed {total} jobs"))
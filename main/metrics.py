@@ -0,0 +1,212 @@
+"""
+Per-request instrumentation (query count, DB time, template time, response size)
+
+RequestMetricsMiddleware က request တစ်ခုစီအတွက်
+- Server-Timing header (db / tpl / total) ထည့်
+- URL name (ဥပမာ ``website:index``) တစ်ခုစီအတွက် histogram ထဲ observe
+``/metrics`` က Prometheus text format နဲ့ ပြန်ပေးတယ်။
+Registry က process တစ်ခုချင်းစီမှာပဲ ရှိ (worker များရင် Prometheus ဘက်က sum လုပ်)။
+
+Query counter (execute wrapper) ကို connection_created (main/signals.py) ကနေ connection တိုင်းမှာ
+install — ASGI အောက်မှာ ORM က sync_to_async thread ရဲ့ connection ကို သုံးလို့ request thread ရဲ့
+connection ကိုပဲ wrap ရင် မရေတွက်မိ။ Request မဟုတ်တဲ့ query (_current မရှိ) ကို မရေတွက်။
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpResponse
+from django.template.backends.django import DjangoTemplates, Template
+from django.views.decorators.http import require_GET
+
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+METRICS = {
+    "django_request_duration_seconds": ("Total request time", TIME_BUCKETS),
+    "django_request_db_seconds": ("Time spent in SQL queries", TIME_BUCKETS),
+    "django_request_queries": ("SQL queries per request", QUERY_BUCKETS),
+    "django_request_template_seconds": ("Time spent rendering templates", TIME_BUCKETS),
+    "django_response_size_bytes": ("Response body size", SIZE_BUCKETS),
+}
+
+_current = ContextVar("request_metrics", default=None)
+
+
+@dataclass
+class RequestMetrics:
+    queries: int = 0
+    db_time: float = 0.0
+    template_time: float = 0.0
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # နောက်ဆုံး slot = +Inf
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+
+class Registry:
+    """metric name → view name → Histogram"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {name: {} for name in METRICS}
+
+    def observe(self, view_name, values):
+        with self._lock:
+            for name, value in values.items():
+                if value is None:
+                    continue
+                histograms = self._histograms[name]
+                if view_name not in histograms:
+                    histograms[view_name] = Histogram(METRICS[name][1])
+                histograms[view_name].observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {name: {} for name in METRICS}
+
+    def render(self):
+        lines = []
+        with self._lock:
+            for name, (help_text, buckets) in METRICS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for view_name, histogram in sorted(self._histograms[name].items()):
+                    label = f'view="{_escape(view_name)}"'
+                    cumulative = 0
+                    for bound, count in zip((*buckets, "+Inf"), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+                    lines.append(f"{name}_sum{{{label}}} {histogram.total}")
+                    lines.append(f"{name}_count{{{label}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.queries += 1
+            metrics.db_time += time.perf_counter() - started
+
+
+def install_query_recorder(connection):
+    """DatabaseWrapper တစ်ခုမှာ တစ်ခါပဲ (persistent connection ပြန်ဆက်ရင်လည်း မထပ်)"""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """
+    TEMPLATES BACKEND — render() တစ်ခုချင်းစီ (fragment တွေပါ) ရဲ့ အချိန်ကို request metrics ထဲ ပေါင်း
+    """
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return InstrumentedTemplate(template.template, self)
+
+
+def _response_size(response):
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+def server_timing(metrics, total):
+    return ", ".join([
+        f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.queries} queries"',
+        f"tpl;dur={metrics.template_time * 1000:.2f}",
+        f"total;dur={total * 1000:.2f}",
+    ])
+
+
+class RequestMetricsMiddleware:
+    """
+    Request တစ်ခုစီရဲ့ query count / DB time / template time / response size ကို
+    Server-Timing header နဲ့ /metrics histogram ထဲ မှတ်
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _finish(self, request, response, metrics, started):
+        total = time.perf_counter() - started
+        response.headers["Server-Timing"] = server_timing(metrics, total)
+        match = request.resolver_match
+        view_name = match.view_name if match else "<unresolved>"
+        registry.observe(view_name, {
+            "django_request_duration_seconds": total,
+            "django_request_db_seconds": metrics.db_time,
+            "django_request_queries": metrics.queries,
+            "django_request_template_seconds": metrics.template_time,
+            "django_response_size_bytes": _response_size(response),
+        })
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics, started)
+
+
+@require_GET
+def metrics_view(request):
+    """Prometheus text exposition format"""
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
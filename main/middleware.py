@@ -0,0 +1,53 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from main import db_router
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Read-your-writes stickiness
+    - Write request (POST / PATCH / DELETE ...) → request တစ်ခုလုံး primary ကိုပဲ သုံး
+    - Write အောင်မြင်ရင် READ_YOUR_WRITES_SECONDS cookie ထည့် → အဲ့ window အတွင်း read တွေ primary
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _should_pin(self, request):
+        return (
+            request.method not in SAFE_METHODS
+            or settings.READ_YOUR_WRITES_COOKIE in request.COOKIES
+        )
+
+    def _finish(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                settings.READ_YOUR_WRITES_COOKIE, "1",
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True, samesite="Lax", secure=settings.SESSION_COOKIE_SECURE,
+            )
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = db_router.pin_to_primary(self._should_pin(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            db_router.unpin(token)
+        return self._finish(request, response)
+
+    async def __acall__(self, request):
+        token = db_router.pin_to_primary(self._should_pin(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            db_router.unpin(token)
+        return self._finish(request, response)
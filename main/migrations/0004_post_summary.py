@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:10
+
+from django.db import migrations, models
+from django.db.models.functions import Substr
+
+
+def backfill_summary(apps, schema_editor):
+    Post = apps.get_model('main', 'Post')
+    Post.objects.using(schema_editor.connection.alias).update(summary=Substr('content', 1, 50))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_delete_item_remove_post_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='summary',
+            field=models.CharField(blank=True, editable=False, max_length=50),
+        ),
+        migrations.RunPython(backfill_summary, migrations.RunPython.noop),
+    ]
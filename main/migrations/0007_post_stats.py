@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:30
+
+import datetime
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Cast, Length, TruncDate
+
+# main/stats.py ရဲ့ ဒီ migration အချိန်က trigger (content က plain TEXT ပဲ) — live module ကို မ import
+STATS_TABLE = "main_poststats"
+DAILY_TABLE = "main_postdailystats"
+STATS_PK = 1
+
+_BYTES = "length(CAST({}.content AS BLOB))"
+
+SCHEMA_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_ai AFTER INSERT ON main_post BEGIN
+        INSERT INTO {STATS_TABLE} (id, total_posts, total_content_bytes)
+        VALUES ({STATS_PK}, 1, {_BYTES.format('new')})
+        ON CONFLICT(id) DO UPDATE SET
+            total_posts = total_posts + 1,
+            total_content_bytes = total_content_bytes + excluded.total_content_bytes;
+        INSERT INTO {DAILY_TABLE} (day, created_count) VALUES (date(new.created_at), 1)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_ad AFTER DELETE ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_posts = total_posts - 1,
+            total_content_bytes = total_content_bytes - {_BYTES.format('old')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1 WHERE day = date(old.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_au AFTER UPDATE OF content, created_at ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_content_bytes = total_content_bytes - {_BYTES.format('old')} + {_BYTES.format('new')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1
+        WHERE day = date(old.created_at) AND date(old.created_at) IS NOT date(new.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+        INSERT INTO {DAILY_TABLE} (day, created_count)
+        SELECT date(new.created_at), 1 WHERE date(old.created_at) IS NOT date(new.created_at)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS main_post_stats_ai",
+    "DROP TRIGGER IF EXISTS main_post_stats_ad",
+    "DROP TRIGGER IF EXISTS main_post_stats_au",
+]
+
+
+def install_stats(apps, schema_editor):
+    """Trigger ဖန်တီးပြီး ရှိပြီးသား rows ကနေ counter တွေကို စတွက်"""
+    conn = schema_editor.connection
+    if conn.vendor != 'sqlite':
+        return
+    with conn.cursor() as cursor:
+        for sql in SCHEMA_SQL:
+            cursor.execute(sql)
+    using = conn.alias
+    Post = apps.get_model('main', 'Post')
+    PostStats = apps.get_model('main', 'PostStats')
+    PostDailyStats = apps.get_model('main', 'PostDailyStats')
+    posts = Post.objects.using(using)
+    totals = posts.aggregate(
+        count=Count('pk'), size=Sum(Length(Cast('content', output_field=models.BinaryField()))),
+    )
+    PostStats.objects.using(using).update_or_create(
+        pk=STATS_PK, defaults={'total_posts': totals['count'], 'total_content_bytes': totals['size'] or 0},
+    )
+    daily = posts.annotate(day=TruncDate('created_at', tzinfo=datetime.timezone.utc)).values('day').annotate(
+        count=Count('pk'),
+    ).values_list('day', 'count')
+    PostDailyStats.objects.using(using).bulk_create(
+        PostDailyStats(day=day, created_count=count) for day, count in daily
+    )
+
+
+def drop_stats(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for sql in DROP_SQL:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_post_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True)),
+                ('created_count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'post daily stats',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_posts', models.BigIntegerField(default=0)),
+                ('total_content_bytes', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'post stats',
+            },
+        ),
+        migrations.RunPython(install_stats, drop_stats),
+    ]
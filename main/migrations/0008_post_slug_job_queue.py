@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:39
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def enqueue_slug_backfill(apps, schema_editor):
+    """ရှိပြီးသား post တွေအတွက် slug job ကို queue ထဲ ထည့် (worker က batch နဲ့ fill)"""
+    Post = apps.get_model('main', 'Post')
+    Job = apps.get_model('main', 'Job')
+    db = schema_editor.connection.alias
+    pks = Post.objects.using(db).values_list('pk', flat=True).order_by('pk').iterator(chunk_size=2000)
+    batch = []
+    for pk in pks:
+        batch.append(Job(name='posts.slug', payload={'pk': pk}, idempotency_key=f'posts.slug:{pk}'))
+        if len(batch) >= 2000:
+            Job.objects.using(db).bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    Job.objects.using(db).bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_post_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='slug',
+            field=models.SlugField(blank=True, editable=False, max_length=120),
+        ),
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('payload', models.JSONField(default=dict)),
+                ('idempotency_key', models.CharField(blank=True, max_length=200, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=64)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'run_at'], name='main_job_due_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('idempotency_key',), name='main_job_pending_key_uniq')],
+            },
+        ),
+        migrations.RunPython(enqueue_slug_backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_post_slug_job_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostViews',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='views', serialize=False, to='main.post')),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'post views',
+                'indexes': [models.Index(fields=['-count', '-post'], name='main_postviews_popular_idx')],
+            },
+        ),
+    ]
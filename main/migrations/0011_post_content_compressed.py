@@ -0,0 +1,148 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:58
+
+import zlib
+
+import main.fields
+from django.db import migrations
+
+# Content ကို ``z<UTF-8 size>:<zlib>`` BLOB အဖြစ် ချုံ့သိမ်းနိုင်လာလို့ main_post trigger တွေကို
+# built-in function ပဲသုံးတဲ့ version နဲ့ အစားထိုး (sqlite3 CLI / backup tool ကနေ write လုပ်လို့ရ)
+# — main/search.py, main/stats.py ရဲ့ ဒီ migration အချိန်က SQL၊ live module ကို မ import
+FTS_TABLE = "main_post_fts"
+STATS_TABLE = "main_poststats"
+DAILY_TABLE = "main_postdailystats"
+STATS_PK = 1
+
+# FTS table က text ကို ကိုယ်တိုင်သိမ်း — BLOB ကို trigger က မဖတ်နိုင်လို့ app (search.index_text) က ဖြည့်
+_TEXT = "CASE WHEN typeof({0}.content) = 'blob' THEN {1} ELSE {0}.content END"
+# BLOB header ရဲ့ leading digits = မူလ UTF-8 size
+_BYTES = (
+    "CASE WHEN typeof({0}.content) = 'blob' THEN CAST(substr({0}.content, 2, 20) AS INTEGER) "
+    "ELSE length(CAST({0}.content AS BLOB)) END"
+)
+
+DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    "DROP TRIGGER IF EXISTS main_post_stats_ai",
+    "DROP TRIGGER IF EXISTS main_post_stats_ad",
+    "DROP TRIGGER IF EXISTS main_post_stats_au",
+]
+
+SEARCH_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, content,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON main_post BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, {_TEXT.format('new', 'NULL')});
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON main_post BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF title, content ON main_post
+    WHEN old.title IS NOT new.title OR old.content IS NOT new.content BEGIN
+        UPDATE {FTS_TABLE} SET title = new.title, content = {_TEXT.format('new', 'content')}
+        WHERE rowid = new.id;
+    END
+    """,
+]
+
+STATS_SQL = [
+    f"""
+    CREATE TRIGGER main_post_stats_ai AFTER INSERT ON main_post BEGIN
+        INSERT INTO {STATS_TABLE} (id, total_posts, total_content_bytes)
+        VALUES ({STATS_PK}, 1, {_BYTES.format('new')})
+        ON CONFLICT(id) DO UPDATE SET
+            total_posts = total_posts + 1,
+            total_content_bytes = total_content_bytes + excluded.total_content_bytes;
+        INSERT INTO {DAILY_TABLE} (day, created_count) VALUES (date(new.created_at), 1)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER main_post_stats_ad AFTER DELETE ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_posts = total_posts - 1,
+            total_content_bytes = total_content_bytes - {_BYTES.format('old')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1 WHERE day = date(old.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+    END
+    """,
+    f"""
+    CREATE TRIGGER main_post_stats_au AFTER UPDATE OF content, created_at ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_content_bytes = total_content_bytes - {_BYTES.format('old')} + {_BYTES.format('new')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1
+        WHERE day = date(old.created_at) AND date(old.created_at) IS NOT date(new.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+        INSERT INTO {DAILY_TABLE} (day, created_count)
+        SELECT date(new.created_at), 1 WHERE date(old.created_at) IS NOT date(new.created_at)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+]
+
+
+def _text(value):
+    """Stored content → str (``z<size>:<zlib>`` BLOB ဆို decompress)"""
+    if not isinstance(value, (bytes, memoryview)):
+        return value
+    _, _, stream = bytes(value)[1:].partition(b":")
+    return zlib.decompress(stream).decode()
+
+
+def reinstall_triggers(apps, schema_editor, batch_size=1000):
+    """FTS table ကို text သိမ်းတဲ့ table နဲ့ အစားထိုးပြီး index ပြန်ဆောက်၊ stats trigger အသစ်"""
+    conn = schema_editor.connection
+    if conn.vendor != 'sqlite':
+        return
+    tables = conn.introspection.table_names()
+    with conn.cursor() as cursor:
+        for sql in DROP_SQL:
+            cursor.execute(sql)
+        if FTS_TABLE in tables:
+            for sql in SEARCH_SQL:
+                cursor.execute(sql)
+            last_pk = 0
+            while True:
+                cursor.execute(
+                    "SELECT id, title, content FROM main_post WHERE id > %s ORDER BY id LIMIT %s",
+                    [last_pk, batch_size],
+                )
+                rows = [(pk, title, _text(content)) for pk, title, content in cursor.fetchall()]
+                if not rows:
+                    break
+                cursor.executemany(f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (%s, %s, %s)", rows)
+                last_pk = rows[-1][0]
+        if STATS_TABLE in tables:
+            for sql in STATS_SQL:
+                cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_post_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='content',
+            field=main.fields.CompressedTextField(),
+        ),
+        # Rows တွေကို ဒီမှာ မချုံ့ — manage.py compress_post_content (chunked) နဲ့ backfill
+        migrations.RunPython(reinstall_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:01
+
+import main.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_post_content_compressed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=main.fields.CompressedTextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='render_version',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        # ရှိပြီးသား rows (render_version = 0) → 0015 က render
+    ]
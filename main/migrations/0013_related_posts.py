@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_post_content_html'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64, unique=True)),
+                ('df', models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='related_posts', to='main.post')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['post', '-score', '-related'], name='main_relatedpost_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'related'), name='main_relatedpost_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weight', models.FloatField()),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='main.post')),
+                ('term', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.relatedterm')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'post', 'weight'], name='main_postterm_term_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'term'), name='main_postterm_uniq')],
+            },
+        ),
+    ]
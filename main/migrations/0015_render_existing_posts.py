@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:19
+
+import zlib
+
+from django.db import migrations
+
+
+def _text(value):
+    """Stored content → str (``z<size>:<zlib>`` BLOB ဆို decompress)"""
+    if not isinstance(value, (bytes, memoryview)):
+        return value
+    _, _, stream = bytes(value)[1:].partition(b":")
+    return zlib.decompress(stream).decode()
+
+
+def render_existing_posts(apps, schema_editor, batch_size=500):
+    """
+    0012 မတိုင်ခင်က rows (render_version = 0) ကို render — detail page က content ကို defer လုပ်လို့
+    async view မှာ fallback အတွက် lazy load မလုပ်ရအောင်
+    Live Post model / rerender_posts() မသုံး — historical model နဲ့ raw read၊ renderer (Django မလို
+    pure function) ကိုပဲ ခေါ်ပြီး သူ့ version နဲ့ တွဲ stamp (နောက် version တွေကို render_posts က ဆက်ယူ)
+    """
+    from main import rendering
+
+    Post = apps.get_model('main', 'Post')
+    using = schema_editor.connection.alias
+    posts = Post.objects.using(using)
+    last_pk = 0
+    while True:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, content FROM main_post WHERE id > %s AND render_version = 0 ORDER BY id LIMIT %s",
+                [last_pk, batch_size],
+            )
+            rows = cursor.fetchall()
+        if not rows:
+            break
+        for pk, content in rows:
+            text = _text(content)
+            # content_html ကို historical field က ချုံ့ (get_db_prep_save)
+            posts.filter(pk=pk, render_version=0).update(
+                content_html=rendering.render(text),
+                content_hash=rendering.content_hash(text),
+                render_version=rendering.RENDERER_VERSION,
+            )
+        last_pk = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_related_posts'),
+    ]
+
+    operations = [
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
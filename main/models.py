@@ -1,13 +1,331 @@
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
 from django.utils.text import slugify
+from main import fragment_cache, rendering, search, tasks
+from main.fields import CompressedText, CompressedTextField, decompressing_iterable, may_compress
+
+SUMMARY_LENGTH = 50
+
+
+class PostVersionConflict(Exception):
+    """Form ဖွင့်ပြီးနောက် Post ကို တခြား request က ပြင်သွားပြီ (version မကိုက်)"""
+
+
+class PostQuerySet(models.QuerySet):
+    """
+    Post queryset
+    - listing() → list page အတွက် id, title, summary ပဲ fetch (content မပါ)
+    - primary() → replica မဟုတ်ဘဲ primary ကနေ ဖတ် (fragment cache ဖြည့်မယ့် read)
+    - latest_update() → index page ETag / Last-Modified validator
+    - bulk_create / bulk_update → save() မခေါ်တဲ့အတွက် derived field တွေကို ဒီမှာ sync
+    - bulk_update → auto_now မအလုပ်လုပ်တဲ့အတွက် updated_at ကို ဒီမှာ set၊ version +1
+    - bulk_update → signal မထွက်တဲ့အတွက် fragment cache ကို ဒီမှာ invalidate
+    - bulk_create / bulk_update(title, content) → slug / related job ကို ဒီမှာ enqueue
+    - bulk_create / bulk_update / update(content=...) → ချုံ့သိမ်းတဲ့ content ကို FTS index ထဲ ဖြည့်
+    - values() / values_list() → ချုံ့ထားတဲ့ content ကို str အဖြစ် ပြန်
+    """
+
+    def listing(self):
+        return self.only('id', 'title', 'summary')
+
+    def primary(self):
+        """
+        Write ပြီးတာနဲ့ version counter အသစ်ဖြစ်သွားလို့ lag ရှိတဲ့ replica ကနေ ဖတ်ပြီး cache ရင်
+        stale HTML က နောက် edit (သို့) timeout ထိ ကျန်နေမယ် — cache miss path ကို primary ကနေပဲ ဖတ်
+        """
+        return self.using(router.db_for_write(self.model))
+
+    def detail(self):
+        """
+        Detail page → pre-rendered content_html ပဲ ဖတ် (Markdown source content မပါ)
+        Related posts → item.related_list (main_relatedpost_lookup_idx ပေါ်က query တစ်ခု)
+        """
+        related = RelatedPost.objects.using(self._db).select_related('related').only(
+            'post_id', 'score', 'related__id', 'related__title',
+        ).order_by('-score', '-related')
+        return self.defer('content').prefetch_related(
+            models.Prefetch('related_posts', queryset=related, to_attr='related_list')
+        )
+
+    def latest_update(self):
+        """MAX(updated_at) — indexed column ပေါ်က aggregate (full scan မဟုတ်)"""
+        return self.aggregate(latest=models.Max('updated_at'))['latest']
+
+    async def alatest_update(self):
+        return (await self.aaggregate(latest=models.Max('updated_at')))['latest']
+
+    def values(self, *fields, **expressions):
+        clone = super().values(*fields, **expressions)
+        clone._iterable_class = decompressing_iterable(clone._iterable_class)
+        return clone
+
+    def values_list(self, *fields, **kwargs):
+        clone = super().values_list(*fields, **kwargs)
+        clone._iterable_class = decompressing_iterable(clone._iterable_class)
+        return clone
+
+    def _write_db(self):
+        return self._db or router.db_for_write(self.model)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.refresh_derived_fields()
+        using = self._write_db()
+        with transaction.atomic(using=using, savepoint=False):
+            created = super().bulk_create(objs, *args, **kwargs)
+            search.index_text(
+                [(obj.pk, obj.content) for obj in created if obj.pk is not None], connections[using]
+            )
+        tasks.enqueue_post_updates([obj.pk for obj in created if obj.pk is not None])
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        fields = list(fields)
+        now = timezone.now()
+        fields.extend(name for name in ('updated_at', 'version') if name not in fields)
+        for obj in objs:
+            obj.updated_at = now
+            obj.version += 1
+            for name in obj.refresh_derived_fields():
+                if name not in fields:
+                    fields.append(name)
+        using = self._write_db()
+        with transaction.atomic(using=using, savepoint=False):
+            updated = super().bulk_update(objs, fields, *args, **kwargs)
+            if 'content' in fields:
+                search.index_text([(obj.pk, obj.content) for obj in objs], connections[using])
+        for obj in objs:
+            fragment_cache.invalidate(obj.pk)
+        tasks.enqueue_post_updates([obj.pk for obj in objs], fields=fields)
+        return updated
+
+    def update(self, **kwargs):
+        content = kwargs.get('content')
+        if not isinstance(content, str) or not may_compress(content):
+            return super().update(**kwargs)
+        # ချုံ့သိမ်းမယ့် content → trigger က index မလုပ်နိုင်လို့ ထိမယ့် rows ကို အရင်ဖတ်
+        using = self._write_db()
+        with transaction.atomic(using=using, savepoint=False):
+            pks = list(self.using(using).values_list('pk', flat=True))
+            updated = super().update(**kwargs)
+            search.index_text([(pk, content) for pk in pks], connections[using])
+        return updated
+
 
 class Post(models.Model):
     title = models.CharField(max_length=100)
-    content = models.TextField()
+    # TEXT_COMPRESS_MIN_BYTES ထက်ကြီးရင် zlib BLOB — attribute access မှ decompress
+    content = CompressedTextField()
+    summary = models.CharField(max_length=SUMMARY_LENGTH, blank=True, editable=False)
+    # content (Markdown) ကို save မှာ တစ်ခါ render ပြီး sanitized HTML သိမ်း (main/rendering.py)
+    # content_hash / render_version မပြောင်းရင် re-render မလုပ်
+    content_html = CompressedTextField(blank=True, editable=False)
+    content_hash = models.CharField(max_length=32, blank=True, editable=False)
+    render_version = models.PositiveSmallIntegerField(default=0, editable=False)
+    slug = models.SlugField(max_length=120, blank=True, editable=False)  # main.tasks က background မှာ fill
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Optimistic concurrency — update တိုင်း +1၊ save_changes() က WHERE version = ? နဲ့ စစ်
+    version = models.PositiveIntegerField(default=1, editable=False)
 
+    objects = PostQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        changed = self.refresh_derived_fields()
+        if not self._state.adding:
+            self.version += 1
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            kwargs['update_fields'] = set(update_fields) | set(changed) | {'updated_at', 'version'}
+        if 'content_hash' not in changed or (update_fields and 'content' not in update_fields):
+            super().save(*args, **kwargs)
+            return
+        # content ပြောင်း → ချုံ့သိမ်းရင် FTS index ကို row write နဲ့ transaction တစ်ခုတည်းမှာ ဖြည့်
+        using = kwargs.get('using') or router.db_for_write(Post, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+            search.index_text([(self.pk, self.content)], connections[using])
+
+    def save_changes(self, fields, expected_version):
+        """
+        ပြောင်းတဲ့ ``fields`` (+ derived field, updated_at, version) ကိုပဲ
+        ``UPDATE ... WHERE id = ? AND version = ?`` statement တစ်ခုတည်းနဲ့ ရေး
+        - fields မရှိရင် write မလုပ် → False
+        - version မကိုက်ရင် (တခြား request ပြင်ပြီး / ဖျက်ပြီး) → PostVersionConflict
+        queryset.update() က signal မထုတ်လို့ post_save ကို ကိုယ်တိုင် send (fragment cache, slug job)
+        """
+        fields = set(fields)
+        if not fields:
+            return False
+        fields.update(self.refresh_derived_fields())
+        self.updated_at = timezone.now()
+        values = {name: getattr(self, name) for name in fields}
+        updated = Post.objects.filter(pk=self.pk, version=expected_version).update(
+            updated_at=self.updated_at, version=expected_version + 1, **values
+        )
+        if not updated:
+            raise PostVersionConflict(self.pk)
+        self.version = expected_version + 1
+        post_save.send(
+            sender=Post, instance=self, created=False, raw=False, using=self._state.db,
+            update_fields=frozenset(fields | {'updated_at', 'version'}),
+        )
+        return True
+
+    def refresh_derived_fields(self):
+        """
+        content ကနေ ထွက်လာတဲ့ stored column တွေကို update လုပ်
+        ပြောင်းသွားတဲ့ field name list ကို return ပြန်
+        """
+        changed = []
+        # deferred (သို့) load ပြီး access မလုပ်ရသေး (ချုံ့ထားဆဲ) → content မပြောင်း
+        if 'content' in self.get_deferred_fields() or isinstance(self.__dict__['content'], CompressedText):
+            return changed
+        summary = self.content[:SUMMARY_LENGTH]
+        if summary != self.summary:
+            self.summary = summary
+            changed.append('summary')
+        digest = rendering.content_hash(self.content)
+        if digest != self.content_hash or self.render_version != rendering.RENDERER_VERSION:
+            self.content_html = rendering.render(self.content)
+            self.content_hash = digest
+            self.render_version = rendering.RENDERER_VERSION
+            changed.extend(['content_html', 'content_hash', 'render_version'])
+        return changed
+
+    def build_slug(self):
+        """``<slugified title>-<pk>`` — pk ပါလို့ unique၊ ASCII မရှိတဲ့ title ဆိုရင် ``post-<pk>``"""
+        base = slugify(self.title)[:100].strip('-') or 'post'
+        return f"{base}-{self.pk}"
+
     def get_summary(self):
-        return self.content[:50]
+        # Stored prefix ကိုပဲ ဖတ် (content ကို decompress မလုပ်)
+        # save မလုပ်ရသေးတဲ့ instance အတွက် content ကနေ တွက်
+        if not self.summary and 'content' not in self.get_deferred_fields():
+            return self.content[:SUMMARY_LENGTH]
+        return self.summary
+
+
+class PostStats(models.Model):
+    """
+    Post aggregate counters (single row, pk=1) — main/stats.py ရဲ့ SQLite trigger တွေက
+    main_post insert / update / delete တိုင်း transaction တစ်ခုတည်းအတွင်း update
+    """
+    total_posts = models.BigIntegerField(default=0)
+    total_content_bytes = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "post stats"
+
+    def __str__(self):
+        return f"{self.total_posts} posts"
+
+
+class PostDailyStats(models.Model):
+    """နေ့ (UTC) အလိုက် Post create အရေအတွက်"""
+    day = models.DateField(unique=True)
+    created_count = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-day']
+        verbose_name_plural = "post daily stats"
+
+    def __str__(self):
+        return f"{self.day}: {self.created_count}"
+
+
+class PostViews(models.Model):
+    """
+    Post detail view counter — main/counters.py က process memory ထဲ စုထားပြီး batch နဲ့
+    ``count = count + n`` upsert (main_post row / trigger တွေကို မထိ)
+    """
+    post = models.OneToOneField(Post, on_delete=models.CASCADE, primary_key=True, related_name='views')
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=['-count', '-post'], name='main_postviews_popular_idx')]
+        verbose_name_plural = "post views"
+
+    def __str__(self):
+        return f"{self.post_id}: {self.count}"
+
+
+class RelatedTerm(models.Model):
+    """
+    main/related.py ရဲ့ TF-IDF vocabulary — rebuild တုန်းက document frequency
+    Post နှစ်ခုအောက်မှာပဲ ပါ (သို့) RELATED_MAX_DF ထက်များတဲ့ term မပါ
+    """
+    term = models.CharField(max_length=64, unique=True)
+    df = models.PositiveIntegerField()
+
+    def __str__(self):
+        return self.term
+
+
+class PostTerm(models.Model):
+    """Post ရဲ့ L2-normalized TF-IDF sparse vector (weight အများဆုံး term RELATED_TERMS_PER_POST ခု)"""
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='terms', db_index=False)
+    term = models.ForeignKey(RelatedTerm, on_delete=models.CASCADE, related_name='+', db_index=False)
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['post', 'term'], name='main_postterm_uniq')]
+        # term → (post, weight) covering index — similarity join က table ကို မဖတ်
+        indexes = [models.Index(fields=['term', 'post', 'weight'], name='main_postterm_term_idx')]
+
+    def __str__(self):
+        return f"{self.post_id}: {self.term_id}"
+
+
+class RelatedPost(models.Model):
+    """Post တစ်ခုစီရဲ့ precomputed top-k neighbour (cosine similarity)"""
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='related_posts', db_index=False)
+    related = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['post', 'related'], name='main_relatedpost_uniq')]
+        indexes = [models.Index(fields=['post', '-score', '-related'], name='main_relatedpost_lookup_idx')]
+
+    def __str__(self):
+        return f"{self.post_id} → {self.related_id}"
+
+
+class Job(models.Model):
+    """
+    main/tasks.py ရဲ့ DB-backed job queue row (SQLite ကို broker အဖြစ်သုံး)
+    idempotency_key တူတဲ့ pending job တစ်ခုပဲ ရှိနိုင် (partial unique index) → enqueue ထပ်ရင် coalesce
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(PENDING, 'Pending'), (RUNNING, 'Running'), (FAILED, 'Failed')]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    idempotency_key = models.CharField(max_length=200, null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['status', 'run_at'], name='main_job_due_idx')]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['idempotency_key'], condition=models.Q(status='pending'),
+                name='main_job_pending_key_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.status})"
@@ -0,0 +1,140 @@
+"""
+Keyset (cursor) pagination for Post listings.
+
+Page တွေကို ``pk`` ပေါ်မှာ အခြေခံပြီး ခွဲတယ် — OFFSET / COUNT(*) မသုံးဘူး။
+Each page is a single ``WHERE id > ? ORDER BY id LIMIT n + 1`` query, so the
+cost of page 10,000 is the same as the cost of page 1.
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(ValueError):
+    """Raised when an ``after`` / ``before`` token cannot be decoded."""
+
+
+def encode_cursor(pk):
+    """pk → opaque url-safe token"""
+    raw = f"pk:{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """opaque token → pk (int)"""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor(token) from exc
+    prefix, _, value = raw.partition(":")
+    # str.isdigit() က "²" လို Unicode digit ကိုပါ လက်ခံလို့ ASCII ပဲ
+    if prefix != "pk" or not (value.isascii() and value.isdigit()):
+        raise InvalidCursor(token)
+    return int(value)
+
+
+def get_page_size(value=None):
+    """
+    ``?page_size=`` ကို settings.POSTS_PAGE_SIZE / POSTS_MAX_PAGE_SIZE နဲ့ ကန့်သတ်
+    """
+    default = settings.POSTS_PAGE_SIZE
+    if value in (None, ""):
+        return default
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, settings.POSTS_MAX_PAGE_SIZE))
+
+
+@dataclass
+class KeysetPage:
+    items: list
+    page_size: int
+    next_cursor: str = None
+    previous_cursor: str = None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+def _page_queryset(queryset, after, before, page_size):
+    """(page_size + 1 rows ယူမယ့် queryset, backwards?)"""
+    if before:
+        return queryset.filter(pk__lt=decode_cursor(before)).order_by("-pk")[:page_size + 1], True
+    queryset = queryset.order_by("pk")
+    if after:
+        queryset = queryset.filter(pk__gt=decode_cursor(after))
+    return queryset[:page_size + 1], False
+
+
+def _build_page(rows, page_size, after, backwards):
+    has_more = len(rows) > page_size
+    if backwards:
+        items = rows[:page_size][::-1]
+        return KeysetPage(
+            items=items,
+            page_size=page_size,
+            next_cursor=encode_cursor(items[-1].pk) if items else None,
+            previous_cursor=encode_cursor(items[0].pk) if has_more and items else None,
+        )
+    items = rows[:page_size]
+    return KeysetPage(
+        items=items,
+        page_size=page_size,
+        next_cursor=encode_cursor(items[-1].pk) if has_more else None,
+        previous_cursor=encode_cursor(items[0].pk) if after and items else None,
+    )
+
+
+def paginate(queryset, after=None, before=None, page_size=None):
+    """
+    Queryset ကို pk ascending order နဲ့ keyset page တစ်ခုအဖြစ် ပြန်ပေး
+
+    - ``after``  → pk > cursor (next page)
+    - ``before`` → pk < cursor (previous page)
+    - page_size + 1 rows ကို fetch ပြီး နောက်ထပ် page ရှိ/မရှိ ဆုံးဖြတ်
+    """
+    page_size = get_page_size(page_size)
+    page_queryset, backwards = _page_queryset(queryset, after, before, page_size)
+    return _build_page(list(page_queryset), page_size, after, backwards)
+
+
+async def apaginate(queryset, after=None, before=None, page_size=None):
+    """paginate() ရဲ့ async ORM version"""
+    page_size = get_page_size(page_size)
+    page_queryset, backwards = _page_queryset(queryset, after, before, page_size)
+    rows = [row async for row in page_queryset]
+    return _build_page(rows, page_size, after, backwards)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin changelist အတွက် Paginator — filter မပါတဲ့ Post queryset ဆိုရင် ``COUNT(*)``
+    အစား PostStats (trigger-maintained, pk lookup) ကနေ count ယူ
+    Filter / search ပါရင် (သို့) stats row မရှိရင် ပုံမှန် count() ကို သုံး
+    """
+
+    @cached_property
+    def count(self):
+        from main.models import PostStats
+        from main.stats import STATS_PK
+
+        queryset = self.object_list
+        if getattr(queryset, "query", None) is not None and not queryset.query.where:
+            total = PostStats.objects.using(queryset.db).filter(pk=STATS_PK).values_list(
+                "total_posts", flat=True
+            ).first()
+            if total is not None:
+                return total
+        return super().count
@@ -0,0 +1,267 @@
+"""
+"Related posts" — Post.title / content ပေါ်က TF-IDF cosine similarity top-k ကို precompute
+
+- Vector: sublinear tf (title term က TITLE_WEIGHT ဆ) × smoothed idf၊ L2-normalize ပြီး weight
+  အများဆုံး RELATED_TERMS_PER_POST ခုပဲ PostTerm (sparse row) အဖြစ် သိမ်း
+- Similarity: sparse matrix × matrixᵀ ကို SQL join + SUM() နဲ့ pk range batch အလိုက် တွက်
+  (term covering index ပေါ်မှာ SQLite C loop ထဲ run — Python loop မရှိ)၊ ROW_NUMBER() နဲ့ top-k
+- Request time: ``RelatedPost`` ကို (post_id, score DESC) index နဲ့ query တစ်ခုတည်း (PostQuerySet.detail)
+
+``rebuild()`` (manage.py rebuild_related_posts) က vocabulary (df) ကိုပါ ပြန်တွက်တယ်။
+Post create / edit ဆိုရင် ``posts.related`` job (main/tasks.py) က ``update_posts()`` နဲ့
+အဲ့ post ရဲ့ vector နဲ့ သူ့ကို ထိတဲ့ neighbour list တွေကိုပဲ update — vocabulary / idf ကတော့
+နောက်ဆုံး rebuild အတိုင်း (vocabulary မှာ မရှိတဲ့ term အသစ် → နောက် rebuild မှ ပါ)။
+Post delete → CASCADE က row တွေ ဖျက်လို့ တခြား post ရဲ့ list မှာ တစ်ခုလျော့နိုင် (rebuild မှ ပြည့်)။
+"""
+import heapq
+import math
+import re
+from collections import Counter
+from operator import itemgetter
+
+from django.conf import settings
+from django.db import connections, router, transaction
+
+from main import fragment_cache, stats
+
+TITLE_WEIGHT = 3
+MAX_TERM_LENGTH = 64
+# Incremental update မှာ neighbour list ကို စစ်မယ့် candidate (score အမြင့်ဆုံး) အရေအတွက်
+CANDIDATES = 200
+
+# မြန်မာ vowel sign / asat တွေက \w မဟုတ်လို့ Myanmar block ကို ထည့်
+_TOKEN = re.compile(r"[\w\u1000-\u109f]+")
+STOPWORDS = frozenset(
+    "a about an and are as at be been but by can for from had has have he her his how i if in into is it its "
+    "me my no not of on or our she so than that the their them then there these they this to was we were "
+    "what when which who will with you your".split()
+)
+
+SCORES_SQL = """
+SELECT b.post_id, SUM(a.weight * b.weight) AS score
+FROM main_postterm a
+JOIN main_postterm b ON b.term_id = a.term_id AND b.post_id != a.post_id
+WHERE a.post_id = %s
+GROUP BY b.post_id
+ORDER BY score DESC, b.post_id DESC
+LIMIT %s
+"""
+
+NEIGHBOURS_SQL = """
+INSERT INTO main_relatedpost (post_id, related_id, score)
+SELECT post_id, related_id, score FROM (
+    SELECT a.post_id, b.post_id AS related_id, SUM(a.weight * b.weight) AS score,
+           ROW_NUMBER() OVER (
+               PARTITION BY a.post_id ORDER BY SUM(a.weight * b.weight) DESC, b.post_id DESC
+           ) AS position
+    FROM main_postterm a
+    JOIN main_postterm b ON b.term_id = a.term_id AND b.post_id != a.post_id
+    WHERE a.post_id BETWEEN %s AND %s
+    GROUP BY a.post_id, b.post_id
+)
+WHERE position <= %s
+"""
+
+EVICT_SQL = """
+DELETE FROM main_relatedpost WHERE id IN (
+    SELECT id FROM main_relatedpost WHERE post_id = %s ORDER BY score, related_id LIMIT 1
+)
+"""
+
+
+def tokenize(text):
+    return [
+        token for token in _TOKEN.findall(text.lower())
+        if 1 < len(token) <= MAX_TERM_LENGTH and not token.isdigit() and token not in STOPWORDS
+    ]
+
+
+def term_counts(title, content):
+    counts = Counter(tokenize(content))
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    return counts
+
+
+def vectorize(counts, vocabulary, total):
+    """
+    term counts → [(term_id, weight)] — vocabulary = {term: (term_id, df)}
+    Norm ကို vocabulary ထဲက term အားလုံးနဲ့ တွက်ပြီးမှ top RELATED_TERMS_PER_POST ခု ဖြတ်
+    """
+    weights = []
+    for term, tf in counts.items():
+        known = vocabulary.get(term)
+        if known is not None:
+            term_id, df = known
+            weights.append((term_id, (1 + math.log(tf)) * (math.log((1 + total) / (1 + df)) + 1)))
+    if not weights:
+        return []
+    norm = math.sqrt(sum(weight * weight for _, weight in weights))
+    top = heapq.nlargest(settings.RELATED_TERMS_PER_POST, weights, key=itemgetter(1))
+    return [(term_id, weight / norm) for term_id, weight in top]
+
+
+def _chunks(posts, chunk_size):
+    """pk range chunk → [(pk, title, content)] list (content ကို decompress ပြီးသား)"""
+    last_pk = 0
+    while True:
+        rows = list(posts.filter(pk__gt=last_pk).values_list('pk', 'title', 'content')[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        last_pk = rows[-1][0]
+
+
+def _insert_terms(cursor, rows):
+    cursor.executemany("INSERT INTO main_postterm (post_id, term_id, weight) VALUES (%s, %s, %s)", rows)
+
+
+def rebuild(chunk_size=2000, using=None):
+    """
+    Corpus တစ်ခုလုံး ပြန်တွက် — (1) document frequency (2) vectors (3) top-k neighbours
+    Chunk တစ်ခုစီကို transaction တစ်ခုစီနဲ့ ရေးလို့ rebuild အတွင်း detail page က list မပြည့်သေးနိုင်
+    Chunk ပြီးတိုင်း (stage, rows) cumulative ကို yield
+    """
+    from main.models import Post, PostTerm, RelatedPost, RelatedTerm
+
+    using = using or router.db_for_write(RelatedPost)
+    conn = connections[using]
+    posts = Post.objects.using(using).order_by('pk')
+
+    df = Counter()
+    total = 0
+    for rows in _chunks(posts, chunk_size):
+        for _, title, content in rows:
+            df.update(term_counts(title, content).keys())
+        total += len(rows)
+        yield 'vocabulary', total
+    max_df = settings.RELATED_MAX_DF * total
+    terms = sorted(term for term, n in df.items() if 2 <= n <= max_df)
+    vocabulary = {term: (term_id, df[term]) for term_id, term in enumerate(terms, start=1)}
+    del df, terms
+
+    with transaction.atomic(using=using), conn.cursor() as cursor:
+        for model in (RelatedPost, PostTerm, RelatedTerm):
+            cursor.execute(f"DELETE FROM {model._meta.db_table}")
+        cursor.executemany(
+            "INSERT INTO main_relatedterm (id, term, df) VALUES (%s, %s, %s)",
+            [(term_id, term, n) for term, (term_id, n) in vocabulary.items()],
+        )
+
+    done = 0
+    for rows in _chunks(posts, chunk_size):
+        vectors = [
+            (pk, term_id, weight)
+            for pk, title, content in rows
+            for term_id, weight in vectorize(term_counts(title, content), vocabulary, total)
+        ]
+        with transaction.atomic(using=using), conn.cursor() as cursor:
+            _insert_terms(cursor, vectors)
+        done += len(rows)
+        yield 'vectors', done
+
+    done = 0
+    pks = posts.values_list('pk', flat=True)
+    last_pk = 0
+    while True:
+        chunk = list(pks.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            break
+        with transaction.atomic(using=using), conn.cursor() as cursor:
+            cursor.execute(NEIGHBOURS_SQL, [chunk[0], chunk[-1], settings.RELATED_POSTS_LIMIT])
+        for pk in chunk:
+            fragment_cache.invalidate(pk)
+        last_pk = chunk[-1]
+        done += len(chunk)
+        yield 'neighbours', done
+
+
+def _load_vocabulary(terms, using):
+    from main.models import RelatedTerm
+
+    vocabulary = {}
+    terms = list(terms)
+    for start in range(0, len(terms), 500):
+        rows = RelatedTerm.objects.using(using).filter(term__in=terms[start:start + 500])
+        vocabulary.update((term, (term_id, df)) for term, term_id, df in rows.values_list('term', 'id', 'df'))
+    return vocabulary
+
+
+def _scores(cursor, pk):
+    cursor.execute(SCORES_SQL, [pk, CANDIDATES])
+    return cursor.fetchall()
+
+
+def _replace_list(pk, scores, using):
+    from main.models import RelatedPost
+
+    related = RelatedPost.objects.using(using)
+    related.filter(post_id=pk).delete()
+    related.bulk_create(
+        RelatedPost(post_id=pk, related_id=other, score=score)
+        for other, score in scores[:settings.RELATED_POSTS_LIMIT]
+    )
+
+
+def _refresh_neighbours(cursor, pk, using):
+    """
+    pk ရဲ့ list ကို အသစ်တွက်ပြီး candidate တွေရဲ့ list ထဲ pk ဝင်/ထွက် patch
+    ပြောင်းသွားတဲ့ list ပိုင်ရှင် pk set ကို return (fragment cache invalidate ဖို့)
+    """
+    from main.models import RelatedPost
+
+    limit = settings.RELATED_POSTS_LIMIT
+    related = RelatedPost.objects.using(using)
+    scores = _scores(cursor, pk)
+    _replace_list(pk, scores, using)
+
+    had = set(related.filter(related_id=pk).values_list('post_id', flat=True))
+    related.filter(related_id=pk).delete()
+    # candidate တစ်ခုစီရဲ့ list အရွယ်နဲ့ နောက်ဆုံးနေရာ (score, related_id) — ordering အတိုင်း tie ကို pk ကြီးတာ နိုင်
+    lists = {}
+    for other, score, related_id in related.filter(post_id__in=[other for other, _ in scores]).values_list(
+        'post_id', 'score', 'related_id',
+    ):
+        size, lowest = lists.get(other, (0, None))
+        lists[other] = (size + 1, min(lowest, (score, related_id)) if lowest else (score, related_id))
+    added = []
+    for other, score in scores:
+        size, lowest = lists.get(other, (0, None))
+        if size < limit or (score, pk) > lowest:
+            if size >= limit:
+                cursor.execute(EVICT_SQL, [other])
+            added.append(RelatedPost(post_id=other, related_id=pk, score=score))
+    related.bulk_create(added)
+
+    # pk ကို ဖယ်လိုက်ရလို့ တစ်ခုလျော့သွားတဲ့ list → အသစ်ပြန်တွက်
+    changed = {pk} | {row.post_id for row in added}
+    for other in had - changed:
+        _replace_list(other, _scores(cursor, other), using)
+    return changed | had
+
+
+def update_posts(pks, using=None):
+    """
+    pks ရဲ့ vector ကို ပြန်တွက်ပြီး neighbour list တွေကို incremental patch (corpus မတွက်)
+    ဖျက်ပြီးသား pk → CASCADE က ရှင်းပြီးသားလို့ ကျော်
+    """
+    from main.models import Post, PostTerm
+
+    using = using or router.db_for_write(PostTerm)
+    rows = list(Post.objects.using(using).filter(pk__in=pks).values_list('pk', 'title', 'content'))
+    counts = {pk: term_counts(title, content) for pk, title, content in rows}
+    vocabulary = _load_vocabulary(set().union(*counts.values()), using)
+    total = stats.get_totals(using).posts or Post.objects.using(using).count()
+    changed = set()
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        PostTerm.objects.using(using).filter(post_id__in=list(counts)).delete()
+        _insert_terms(cursor, [
+            (pk, term_id, weight)
+            for pk, post_counts in counts.items()
+            for term_id, weight in vectorize(post_counts, vocabulary, total)
+        ])
+        for pk in counts:
+            changed |= _refresh_neighbours(cursor, pk, using)
+    for pk in changed:
+        fragment_cache.invalidate(pk)
+    return len(counts)
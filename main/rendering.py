@@ -0,0 +1,191 @@
+"""
+Post.content (Markdown) → sanitized HTML — save() / bulk path တွေမှာ တစ်ခါပဲ render ပြီး
+Post.content_html ထဲ သိမ်း (detail page က request တိုင်း render မလုပ်)
+
+Stdlib ပဲသုံးတဲ့ Markdown subset:
+- # heading, paragraph, > blockquote, - / * / 1. list, ``` fenced code, --- rule
+- `code`, **bold**, *italic*, [text](url)
+
+Sanitize: input တစ်ခုလုံးကို အရင် HTML escape ပြီးမှ ကိုယ်ထုတ်တဲ့ tag တွေပဲ ထည့်လို့ raw HTML
+မဝင်နိုင်။ Link ကို http(s) / mailto / relative URL ပဲ ခွင့်ပြု (javascript: စသည် → text)။
+
+Output ပြောင်းမယ့် ပြင်ဆင်မှုတိုင်း RENDERER_VERSION ကို တိုးပြီး ``manage.py render_posts`` run။
+Module ကို Django settings မလိုဘဲ import လို့ရ (render_posts ရဲ့ process pool worker)။
+"""
+import hashlib
+import html
+import re
+
+RENDERER_VERSION = 1
+
+ALLOWED_SCHEMES = ("http", "https", "mailto")
+
+_FENCE = re.compile(r"^```")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_RULE = re.compile(r"^(?:-{3,}|\*{3,}|_{3,})\s*$")
+_QUOTE = re.compile(r"^&gt;\s?(.*)$")  # escape ပြီးမှ parse လို့ ">" → "&gt;"
+_BULLET = re.compile(r"^[-*+]\s+(.*)$")
+_ORDERED = re.compile(r"^\d{1,9}[.)]\s+(.*)$")
+
+_CODE_SPAN = re.compile(r"`([^`\n]+)`")
+_LINK = re.compile(r"\[([^\]\n]+)\]\(([^)\s]+)\)")
+_BOLD = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
+_ITALIC = re.compile(r"(?<![*\w])([*_])(?=\S)(.+?)(?<=\S)\1(?![*\w])")
+_PLACEHOLDER = re.compile("\x00(\\d+)\x00")
+_SCHEME = re.compile(r"^([a-z][a-z0-9+.-]*):")
+_IGNORED_URL_CHARS = re.compile(r"[\x00-\x20\x7f]")
+
+
+def content_hash(text):
+    """Re-render လိုမလို စစ်ဖို့ content digest (32 hex)"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def is_safe_url(url):
+    """Escape မလုပ်ရသေးတဲ့ URL — browser က ကျော်ဖတ်တဲ့ whitespace / control char ဖယ်ပြီး scheme စစ်"""
+    match = _SCHEME.match(_IGNORED_URL_CHARS.sub("", url).lower())
+    return match is None or match.group(1) in ALLOWED_SCHEMES
+
+
+def _emphasis(text):
+    return _ITALIC.sub(r"<em>\2</em>", _BOLD.sub(r"<strong>\2</strong>", text))
+
+
+def _render_inline(escaped):
+    """Escape ပြီးသား text တစ်ကြောင်း → inline markup"""
+    spans = []
+
+    def hold(fragment):
+        spans.append(fragment)
+        return f"\x00{len(spans) - 1}\x00"
+
+    text = _CODE_SPAN.sub(lambda m: hold(f"<code>{m.group(1)}</code>"), escaped)
+
+    def link(match):
+        label, url = match.groups()
+        if not is_safe_url(html.unescape(url)):
+            return match.group(0)
+        return hold(f'<a href="{url}" rel="nofollow noopener">{_emphasis(label)}</a>')
+
+    text = _emphasis(_LINK.sub(link, text))
+    # code span က link label ထဲမှာ ရှိနိုင်လို့ placeholder မကျန်မချင်း ပြန်ထည့်
+    while _PLACEHOLDER.search(text):
+        text = _PLACEHOLDER.sub(lambda m: spans[int(m.group(1))], text)
+    return text
+
+
+def _paragraph(lines):
+    return "<p>" + "\n".join(_render_inline(line.strip()) for line in lines) + "</p>"
+
+
+def render(text):
+    """Markdown text → sanitized HTML string"""
+    lines = html.escape(text.replace("\x00", "")).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    blocks = []
+    paragraph = []
+    i = 0
+
+    def flush_paragraph():
+        if paragraph:
+            blocks.append(_paragraph(paragraph))
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        if _FENCE.match(line):
+            flush_paragraph()
+            code = []
+            i += 1
+            while i < len(lines) and not _FENCE.match(lines[i]):
+                code.append(lines[i])
+                i += 1
+            blocks.append("<pre><code>" + "\n".join(code) + "</code></pre>")
+            i += 1
+            continue
+        if not line.strip():
+            flush_paragraph()
+        elif match := _HEADING.match(line):
+            flush_paragraph()
+            level = len(match.group(1))
+            blocks.append(f"<h{level}>{_render_inline(match.group(2))}</h{level}>")
+        elif _RULE.match(line):
+            flush_paragraph()
+            blocks.append("<hr>")
+        elif _QUOTE.match(line):
+            flush_paragraph()
+            quoted = []
+            while i < len(lines) and (match := _QUOTE.match(lines[i])):
+                quoted.append(match.group(1))
+                i += 1
+            blocks.append("<blockquote>" + _paragraph(quoted) + "</blockquote>")
+            continue
+        elif _BULLET.match(line) or _ORDERED.match(line):
+            flush_paragraph()
+            pattern, tag = (_BULLET, "ul") if _BULLET.match(line) else (_ORDERED, "ol")
+            items = []
+            while i < len(lines) and (match := pattern.match(lines[i])):
+                items.append(f"<li>{_render_inline(match.group(1))}</li>")
+                i += 1
+            blocks.append(f"<{tag}>" + "".join(items) + f"</{tag}>")
+            continue
+        else:
+            paragraph.append(line)
+        i += 1
+    flush_paragraph()
+    return "\n".join(blocks)
+
+
+def render_row(row):
+    """(pk, text) → (pk, hash, html) — render_posts process pool worker"""
+    pk, text = row
+    return pk, content_hash(text), render(text)
+
+
+def rerender_posts(chunk_size=500, processes=None, force=False, using="default"):
+    """
+    RENDERER_VERSION မကိုက်တဲ့ (force=True ဆို အားလုံး) post တွေကို pk chunk အလိုက် process pool နဲ့
+    parallel render ပြီး chunk တစ်ခုစီကို transaction တစ်ခုနဲ့ ရေး — processes=1 ဆို pool မသုံး
+    Read ပြီးမှ ပြင်သွားတဲ့ row (version မကိုက်) ကို မရေး (save() က render ပြီးသား)
+    updated_at / version မပြောင်းလို့ fragment cache ကို ဒီမှာ invalidate
+    Chunk ပြီးတိုင်း rendered rows (cumulative) ကို yield
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from django.db import connections, transaction
+    from main import fragment_cache
+    from main.models import Post
+
+    conn = connections[using]
+    html_field = Post._meta.get_field("content_html")
+    posts = Post.objects.using(using).order_by("pk")
+    if not force:
+        posts = posts.exclude(render_version=RENDERER_VERSION)
+    sql = (
+        f"UPDATE {conn.ops.quote_name(Post._meta.db_table)} "
+        "SET content_html = %s, content_hash = %s, render_version = %s WHERE id = %s AND version = %s"
+    )
+    pool = ProcessPoolExecutor(max_workers=processes) if processes != 1 else None
+    render_many = pool.map if pool else map
+    last_pk = 0
+    total = 0
+    try:
+        while True:
+            rows = list(posts.filter(pk__gt=last_pk).values_list("pk", "version", "content")[:chunk_size])
+            if not rows:
+                break
+            versions = {pk: version for pk, version, _ in rows}
+            rendered = render_many(render_row, [(pk, content) for pk, _, content in rows])
+            params = [
+                (html_field.get_db_prep_save(html, conn), digest, RENDERER_VERSION, pk, versions[pk])
+                for pk, digest, html in rendered
+            ]
+            with transaction.atomic(using=using), conn.cursor() as cursor:
+                cursor.executemany(sql, params)
+            for pk in versions:
+                fragment_cache.invalidate(pk)
+            last_pk = rows[-1][0]
+            total += len(rows)
+            yield total
+    finally:
+        if pool:
+            pool.shutdown()
@@ -0,0 +1,202 @@
+"""
+SQLite FTS5 full-text search over Post.title / Post.content
+
+``main_post_fts`` က title / content text ကို ကိုယ်တိုင် သိမ်းတဲ့ FTS5 table (snippet() အတွက်)။
+Trigger တွေက insert / update / delete တိုင်း index ကို sync လုပ်ပေးတယ်
+(bulk_create, queryset.update အပါအဝင်)။
+
+Trigger တွေမှာ SQLite built-in function ပဲ သုံး (sqlite3 CLI / dbshell / backup tool ကနေ
+main_post ကို write လုပ်လို့ရအောင်)။ Post.content ကို ချုံ့သိမ်းထားရင် (main/fields.py) trigger က
+text ကို မဖတ်နိုင်လို့ — insert မှာ NULL၊ update မှာ ရှိပြီးသား text ကို ထားခဲ့ — plain text ကို
+Python write path (Post.save / bulk_create / bulk_update / queryset.update) က ``index_text()``
+နဲ့ ဖြည့်တယ်။ compress_post_content backfill က text မပြောင်းလို့ index မထိ။
+
+SQLite table remake (AddField စတဲ့ migration) လုပ်ရင် trigger တွေ ပျက်သွားတဲ့အတွက်
+FTS table ရှိပြီးသားဆိုရင် ``install()`` ကို post_migrate မှာ ထပ်ခေါ်တယ် (idempotent)။
+"""
+import re
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from main import fields
+
+FTS_TABLE = "main_post_fts"
+
+# BLOB (ချုံ့ထားတဲ့) content ကို trigger က မဖတ်နိုင် → index_text() က ဖြည့်
+_TEXT = "CASE WHEN typeof({0}.content) = 'blob' THEN {1} ELSE {0}.content END"
+
+# NUL က SQLite string literal ကို ဖြတ်လို့ ("unterminated string") control char တွေ ဖယ်
+_CONTROL = re.compile(r"[\x00-\x1f\x7f]")
+_HIGHLIGHT_START = "\x02"
+_HIGHLIGHT_END = "\x03"
+
+SCHEMA_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON main_post BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, {_TEXT.format('new', 'NULL')});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON main_post BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, content ON main_post
+    WHEN old.title IS NOT new.title OR old.content IS NOT new.content BEGIN
+        UPDATE {FTS_TABLE} SET title = new.title, content = {_TEXT.format('new', 'content')}
+        WHERE rowid = new.id;
+    END
+    """,
+]
+
+
+@dataclass
+class SearchResult:
+    pk: int
+    title: str
+    snippet: str
+    score: float
+
+
+def is_supported(conn=connection):
+    return conn.vendor == "sqlite"
+
+
+def is_installed(conn=connection):
+    if not is_supported(conn):
+        return False
+    return FTS_TABLE in conn.introspection.table_names()
+
+
+def install(conn=connection):
+    """FTS table + sync trigger တွေ ဖန်တီး (ရှိပြီးသားဆိုရင် ဘာမှမလုပ်)"""
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        for sql in SCHEMA_SQL:
+            cursor.execute(sql)
+
+
+def rebuild(batch_size=1000, conn=connection):
+    """
+    Index ကို အစကနေ ပြန်ဆောက် — pk range batch တစ်ခုချင်းစီကို transaction တစ်ခုစီနဲ့
+    (ချုံ့ထားတဲ့ content ကို Python မှာ decompress)
+    Batch ပြီးတိုင်း indexed rows အရေအတွက် (cumulative) ကို yield လုပ်
+    """
+    install(conn)
+    with conn.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+    last_pk = 0
+    total = 0
+    while True:
+        with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT id, title, content FROM main_post WHERE id > %s ORDER BY id LIMIT %s",
+                [last_pk, batch_size],
+            )
+            rows = [(pk, title, fields.decompress(content)) for pk, title, content in cursor.fetchall()]
+            if not rows:
+                break
+            cursor.executemany(f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (%s, %s, %s)", rows)
+        last_pk = rows[-1][0]
+        total += len(rows)
+        yield total
+    with conn.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+
+
+def index_text(rows, conn=connection):
+    """
+    Python ကရေးလိုက်တဲ့ (pk, content) တွေထဲက ချုံ့သိမ်းနိုင်တဲ့ size ရှိတာကို FTS content အဖြစ် set
+    (trigger က BLOB ကို မဖတ်နိုင်လို့) — main_post write နဲ့ transaction တစ်ခုတည်းအတွင်း ခေါ်
+    """
+    if not is_supported(conn):
+        return
+    rows = [(text, pk) for pk, text in rows if fields.may_compress(text)]
+    if rows:
+        with conn.cursor() as cursor:
+            cursor.executemany(f"UPDATE {FTS_TABLE} SET content = %s WHERE rowid = %s", rows)
+
+
+def build_match_query(text):
+    """
+    User input → FTS5 MATCH expression
+    Whitespace နဲ့ ခွဲပြီး token တစ်ခုစီကို double-quote နဲ့ ပိတ်လို့ FTS syntax
+    (AND/OR/NEAR, *, :) injection မဖြစ်။ ``\\w`` regex က မြန်မာ vowel sign တွေကို
+    ဖြတ်ပစ်တဲ့အတွက် မသုံးဘဲ word ခွဲတာကို FTS tokenizer ကိုပဲ လွှဲထား
+    """
+    tokens = _CONTROL.sub(" ", text or "").split()
+    if not tokens:
+        return None
+    return " ".join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+
+
+def _highlight(raw):
+    html = escape(raw).replace(_HIGHLIGHT_START, "<mark>").replace(_HIGHLIGHT_END, "</mark>")
+    return mark_safe(html)
+
+
+def search(text, limit=None):
+    """bm25 rank အလိုက် SearchResult list (highlighted snippet ပါ)"""
+    limit = limit or settings.SEARCH_RESULTS_LIMIT
+    match = build_match_query(text)
+    if match is None:
+        return []
+    if not is_supported():
+        return _fallback_search(text, limit)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT p.id, p.title,
+                   snippet({FTS_TABLE}, 1, %s, %s, '…', 16),
+                   bm25({FTS_TABLE}, 5.0, 1.0) AS score
+            FROM {FTS_TABLE}
+            JOIN main_post p ON p.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s
+            ORDER BY score
+            LIMIT %s
+            """,
+            [_HIGHLIGHT_START, _HIGHLIGHT_END, match, limit],
+        )
+        return [
+            SearchResult(pk=pk, title=title, snippet=_highlight(snippet), score=score)
+            for pk, title, snippet, score in cursor.fetchall()
+        ]
+
+
+def filter_queryset(queryset, text):
+    """
+    Post queryset ကို FTS MATCH ဖြစ်တဲ့ rows ပဲ ကျန်အောင် filter (``pk IN (SELECT rowid ...)``)
+    Ordering / pagination ကို caller ဘက်က ဆက်လုပ် (admin changelist စသည်)
+    """
+    match = build_match_query(text)
+    if match is None:
+        return queryset
+    if not is_supported():
+        return queryset.filter(Q(title__icontains=text) | Q(content__icontains=text))
+    return queryset.filter(
+        pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+    )
+
+
+def _fallback_search(text, limit):
+    """SQLite မဟုတ်တဲ့ backend အတွက် (rank မရှိ)"""
+    from main.models import Post
+
+    queryset = Post.objects.listing().filter(Q(title__icontains=text) | Q(content__icontains=text))
+    return [
+        SearchResult(pk=post.pk, title=post.title, snippet=escape(post.summary), score=0.0)
+        for post in queryset[:limit]
+    ]
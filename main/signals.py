@@ -0,0 +1,65 @@
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save, post_delete, post_migrate, pre_delete
+from django.dispatch import receiver
+from main.models import Post, RelatedPost
+from main import fragment_cache, conditional, metrics, search, stats, tasks
+
+
+@receiver(connection_created)
+def instrument_queries(sender, connection, **kwargs):
+    """Thread (sync_to_async worker ပါ) တိုင်းရဲ့ connection မှာ request metrics query counter"""
+    metrics.install_query_recorder(connection)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_fragments(sender, instance, **kwargs):
+    """Post save / delete → rendered fragment cache ကို invalidate"""
+    fragment_cache.invalidate(instance.pk)
+
+
+@receiver(pre_delete, sender=Post)
+def invalidate_linking_fragments(sender, instance, using, **kwargs):
+    """
+    Delete → ဒီ post ကို related list ထဲ ထည့်ထားတဲ့ post တွေရဲ့ fragment မှာ dead link ကျန်မယ်
+    RelatedPost row တွေ cascade နဲ့ မပျက်ခင် ဖတ်ပြီး commit ပြီးမှ invalidate
+    (commit မတိုင်ခင် cache ပြန်ဖြည့်သွားရင် link အဟောင်း ပြန်ဝင်လို့)
+    """
+    pks = list(RelatedPost.objects.using(using).filter(related_id=instance.pk).values_list('post_id', flat=True))
+
+    def invalidate():
+        for pk in pks:
+            fragment_cache.invalidate(pk)
+
+    if pks:
+        transaction.on_commit(invalidate, using=using)
+
+
+@receiver(post_save, sender=Post)
+def enqueue_post_jobs(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Slug / related posts ကို request thread မှာ မတွက်ဘဲ job queue ထဲ ထည့် (pk တူရင် coalesce)"""
+    if raw:
+        return
+    tasks.enqueue_post_updates([instance.pk], fields=update_fields)
+
+
+@receiver(post_delete, sender=Post)
+def mark_listing_changed(sender, instance, **kwargs):
+    """Delete → MAX(updated_at) မပြောင်းလို့ index validator အတွက် marker"""
+    conditional.mark_listing_changed()
+
+
+@receiver(post_migrate)
+def reinstall_search_triggers(sender, using, **kwargs):
+    """
+    SQLite table remake (AddField စသည်) က main_post trigger တွေကို drop လုပ်တဲ့အတွက်
+    migrate ပြီးတိုင်း FTS / stats trigger တွေ ပြန်ထည့်
+    """
+    if sender.name != 'main':
+        return
+    conn = connections[using]
+    if search.is_installed(conn):
+        search.install(conn)
+    if stats.STATS_TABLE in conn.introspection.table_names():
+        stats.install(conn)
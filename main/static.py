@@ -0,0 +1,37 @@
+"""
+Static files — WhiteNoise ကို Django middleware chain အပြင်မှာ (WSGI / ASGI application ကို wrap)
+
+WhiteNoiseMiddleware က sync-only ဖြစ်လို့ MIDDLEWARE ထဲထည့်ရင် ASGI မှာ chain တစ်ခုလုံးကို
+async_to_sync / sync_to_async နဲ့ adapt လုပ်ပြီး async view တိုင်း worker thread တစ်ခု ယူသွားတယ်။
+ဒါကြောင့် ``STATIC_URL`` အောက်က request တွေကိုပဲ application ရှေ့မှာ ဖမ်းပြီး WhiteNoise ရဲ့
+file table (hashed name → immutable Cache-Control, .br / .gz variant) နဲ့ serve၊ ကျန်တာ
+middleware chain ကို မထိဘဲ application ဆီ လွှဲတယ်။
+"""
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler, StaticFilesHandler
+from django.http import Http404
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class WhiteNoiseServeMixin:
+    """StaticFilesHandler ရဲ့ serve() (staticfiles finders) အစား WhiteNoise lookup"""
+
+    def __init__(self, application):
+        super().__init__(application)
+        self.whitenoise = WhiteNoiseMiddleware()
+
+    def serve(self, request):
+        if self.whitenoise.autorefresh:
+            static_file = self.whitenoise.find_file(request.path_info)
+        else:
+            static_file = self.whitenoise.files.get(request.path_info)
+        if static_file is None:
+            raise Http404(f"{request.path_info} not found")
+        return self.whitenoise.serve(static_file, request)
+
+
+class StaticFilesWSGIHandler(WhiteNoiseServeMixin, StaticFilesHandler):
+    pass
+
+
+class StaticFilesASGIHandler(WhiteNoiseServeMixin, ASGIStaticFilesHandler):
+    pass
@@ -0,0 +1,163 @@
+"""
+Denormalized Post counters (PostStats / PostDailyStats)
+
+``COUNT(*)`` / ``SUM(length(content))`` ကို table တစ်ခုလုံး scan မလုပ်ဘဲ O(1) ဖတ်ဖို့
+main_post ပေါ်က AFTER INSERT / UPDATE / DELETE trigger တွေက stats row တွေကို
+write transaction တစ်ခုတည်းအတွင်း update လုပ်တယ် (bulk_create, queryset.update / delete ပါ)။
+
+- total_posts, total_content_bytes (content ရဲ့ UTF-8 size — ချုံ့ထားရင် main/fields.py BLOB header
+  ထဲက မူလ size ကို ဖတ်၊ decompress မလုပ်) → main_poststats (id = 1)
+- per-day (UTC, created_at) create count → main_postdailystats
+
+search.py နဲ့အတူတူ SQLite table remake က trigger ကို drop လုပ်လို့ post_migrate မှာ
+``install()`` ကို ထပ်ခေါ်တယ်။ Drift ဖြစ်ခဲ့ရင် ``manage.py reconcile_post_stats``။
+"""
+import datetime
+from typing import NamedTuple
+
+from django.db import connection, models, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+STATS_TABLE = "main_poststats"
+DAILY_TABLE = "main_postdailystats"
+STATS_PK = 1
+
+# Built-in function ပဲ (sqlite3 CLI ကနေ write လုပ်လည်း trigger အလုပ်လုပ်) — BLOB ဆို
+# ``z<UTF-8 size>:<zlib>`` header ရဲ့ leading digits ကို INTEGER အဖြစ် CAST
+_CONTENT_BYTES = (
+    "CASE WHEN typeof({0}) = 'blob' THEN CAST(substr({0}, 2, 20) AS INTEGER) "
+    "ELSE length(CAST({0} AS BLOB)) END"
+)
+
+SCHEMA_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_ai AFTER INSERT ON main_post BEGIN
+        INSERT INTO {STATS_TABLE} (id, total_posts, total_content_bytes)
+        VALUES ({STATS_PK}, 1, {_CONTENT_BYTES.format('new.content')})
+        ON CONFLICT(id) DO UPDATE SET
+            total_posts = total_posts + 1,
+            total_content_bytes = total_content_bytes + excluded.total_content_bytes;
+        INSERT INTO {DAILY_TABLE} (day, created_count) VALUES (date(new.created_at), 1)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_ad AFTER DELETE ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_posts = total_posts - 1,
+            total_content_bytes = total_content_bytes - {_CONTENT_BYTES.format('old.content')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1 WHERE day = date(old.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS main_post_stats_au AFTER UPDATE OF content, created_at ON main_post BEGIN
+        UPDATE {STATS_TABLE} SET
+            total_content_bytes = total_content_bytes - {_CONTENT_BYTES.format('old.content')} + {_CONTENT_BYTES.format('new.content')}
+        WHERE id = {STATS_PK};
+        UPDATE {DAILY_TABLE} SET created_count = created_count - 1
+        WHERE day = date(old.created_at) AND date(old.created_at) IS NOT date(new.created_at);
+        DELETE FROM {DAILY_TABLE} WHERE day = date(old.created_at) AND created_count <= 0;
+        INSERT INTO {DAILY_TABLE} (day, created_count)
+        SELECT date(new.created_at), 1 WHERE date(old.created_at) IS NOT date(new.created_at)
+        ON CONFLICT(day) DO UPDATE SET created_count = created_count + 1;
+    END
+    """,
+]
+
+
+class ContentBytes(models.Func):
+    """reconcile() အတွက် trigger နဲ့ တူတဲ့ content UTF-8 size expression"""
+    template = _CONTENT_BYTES.format("%(expressions)s")
+    output_field = models.BigIntegerField()
+
+
+class Totals(NamedTuple):
+    posts: int
+    content_bytes: int
+
+
+def is_supported(conn=connection):
+    return conn.vendor == "sqlite"
+
+
+def is_installed(conn=connection):
+    if not is_supported(conn):
+        return False
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'main_post_stats_ai'")
+        return cursor.fetchone() is not None
+
+
+def install(conn=connection):
+    """Stats trigger တွေ ဖန်တီး (ရှိပြီးသားဆိုရင် ဘာမှမလုပ်)"""
+    if not is_supported(conn):
+        return
+    with conn.cursor() as cursor:
+        for sql in SCHEMA_SQL:
+            cursor.execute(sql)
+
+
+def get_totals(using=None):
+    """PostStats row တစ်ကြောင်း (pk lookup) → Totals"""
+    from main.models import PostStats
+
+    row = PostStats.objects.using(using).filter(pk=STATS_PK).values_list(
+        "total_posts", "total_content_bytes"
+    ).first()
+    return Totals(*row) if row else Totals(0, 0)
+
+
+async def aget_totals():
+    from main.models import PostStats
+
+    row = await PostStats.objects.filter(pk=STATS_PK).values_list(
+        "total_posts", "total_content_bytes"
+    ).afirst()
+    return Totals(*row) if row else Totals(0, 0)
+
+
+def reconcile(chunk_size=10000, conn=connection):
+    """
+    Stats table ကို main_post ကနေ ပြန်တွက် — pk range chunk တစ်ခုစီကို SQL aggregate နဲ့ ပေါင်း
+    Transaction တစ်ခုတည်းအတွင်း run လို့ scan နေတုန်း write တွေ စောင့်ရပြီး count က တိကျ
+    Chunk ပြီးတိုင်း scan ပြီးသား rows (cumulative) ကို yield လုပ်
+    """
+    from main.models import Post, PostStats, PostDailyStats
+
+    using = conn.alias
+    posts = Post.objects.using(using)
+    content_bytes = ContentBytes("content")
+    with transaction.atomic(using=using):
+        total_posts = total_bytes = 0
+        daily = {}
+        last_pk = 0
+        while True:
+            boundary = posts.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)
+            upper = boundary[chunk_size - 1:chunk_size].first()
+            chunk = posts.filter(pk__gt=last_pk)
+            if upper is not None:
+                chunk = chunk.filter(pk__lte=upper)
+            result = chunk.aggregate(count=Count("pk"), size=Sum(content_bytes))
+            if not result["count"]:
+                break
+            total_posts += result["count"]
+            total_bytes += result["size"] or 0
+            for day, count in chunk.annotate(day=TruncDate("created_at", tzinfo=datetime.timezone.utc)).values("day").annotate(
+                count=Count("pk")
+            ).values_list("day", "count"):
+                daily[day] = daily.get(day, 0) + count
+            yield total_posts
+            if upper is None:
+                break
+            last_pk = upper
+
+        PostStats.objects.using(using).update_or_create(
+            pk=STATS_PK, defaults={"total_posts": total_posts, "total_content_bytes": total_bytes}
+        )
+        PostDailyStats.objects.using(using).all().delete()
+        PostDailyStats.objects.using(using).bulk_create(
+            PostDailyStats(day=day, created_count=count) for day, count in daily.items()
+        )
@@ -0,0 +1,252 @@
+"""
+Lightweight DB-backed job queue (SQLite = broker)
+
+    @task("posts.slug", batch_size=200)
+    def generate_slugs(payloads): ...
+
+    generate_slugs.enqueue({"pk": 1}, key="posts.slug:1")
+
+- enqueue() က caller ရဲ့ transaction ထဲမှာပဲ Job row insert (transactional outbox) →
+  request rollback ဖြစ်ရင် job လည်း ပျောက်၊ commit ပြီးမှ worker မြင်
+- idempotency key တူတဲ့ pending job ရှိပြီးသားဆိုရင် insert မလုပ် (coalesce)
+- Worker (``manage.py run_worker``) က name တူတဲ့ due job တွေကို batch_size ခုအထိ claim ပြီး
+  handler ကို payload list နဲ့ တစ်ခါခေါ်
+- Handler exception → exponential backoff နဲ့ retry, max_attempts ပြည့်ရင် failed
+- Worker crash ကြောင့် running မှာ TASK_LOCK_TIMEOUT ထက်ကြာနေတဲ့ job ကို ပြန် claim
+- Queue read (claim ပြီး ပြန်ဖတ်တာ စသည်) အားလုံး primary ကနေ — replica က UPDATE လုပ်ပြီးခါစ
+  row တွေကို မမြင်သေးနိုင်လို့ (main/db_router.py)။ Handler ကိုလည်း primary pin ထားပြီး run
+"""
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from main import db_router
+
+_registry = {}
+
+
+@dataclass
+class Task:
+    name: str
+    handler: Callable
+    batch_size: int = 100
+    max_attempts: int = 5
+
+    def __call__(self, payloads):
+        return self.handler(payloads)
+
+    def enqueue(self, payload, key=None, delay=0):
+        enqueue(self.name, payload, key=key, delay=delay)
+
+    def enqueue_many(self, items, delay=0):
+        """items = [(payload, key), ...]"""
+        enqueue_many(self.name, items, delay=delay)
+
+
+def task(name, batch_size=100, max_attempts=5):
+    """handler(payloads: list) ကို queue task အဖြစ် register"""
+    def decorator(handler):
+        _registry[name] = Task(name, handler, batch_size=batch_size, max_attempts=max_attempts)
+        return _registry[name]
+    return decorator
+
+
+def get_task(name):
+    return _registry.get(name)
+
+
+def _jobs():
+    """Job manager on the primary"""
+    from main.models import Job
+
+    return Job.objects.using(router.db_for_write(Job))
+
+
+def enqueue(name, payload, key=None, delay=0):
+    enqueue_many(name, [(payload, key)], delay=delay)
+
+
+def enqueue_many(name, items, delay=0):
+    enqueue_jobs([(name, payload, key) for payload, key in items], delay=delay)
+
+
+def enqueue_jobs(jobs, delay=0):
+    """jobs = [(name, payload, key), ...] — task မတူတာတွေကိုလည်း INSERT တစ်ခုတည်းနဲ့"""
+    from main.models import Job
+
+    if not jobs:
+        return
+    run_at = timezone.now() + timedelta(seconds=delay)
+    # INSERT OR IGNORE → pending key ရှိပြီးသား row တွေကို partial unique index က ကျော်
+    _jobs().bulk_create(
+        [Job(name=name, payload=payload, idempotency_key=key, run_at=run_at) for name, payload, key in jobs],
+        ignore_conflicts=True,
+    )
+
+
+def backoff(attempts):
+    """retry delay (seconds) — base * 2^(attempts - 1), TASK_MAX_BACKOFF အထိ"""
+    return min(settings.TASK_RETRY_BACKOFF * 2 ** (attempts - 1), settings.TASK_MAX_BACKOFF)
+
+
+def _requeue_or_coalesce(jobs, **updates):
+    """
+    running job တွေကို pending ပြန်ပြောင်း — key တူ pending job အသစ် ရှိနေရင်
+    (running အတွင်း enqueue ထပ်ထားရင်) အဟောင်းကို ဖျက်ပြီး အသစ်ကိုပဲ ထား
+    """
+    from main.models import Job
+
+    keys = [job.idempotency_key for job in jobs if job.idempotency_key]
+    pending_keys = set(
+        _jobs().filter(status=Job.PENDING, idempotency_key__in=keys).values_list('idempotency_key', flat=True)
+    )
+    coalesced = [job.pk for job in jobs if job.idempotency_key in pending_keys]
+    _jobs().filter(pk__in=coalesced).delete()
+    _jobs().filter(pk__in=[job.pk for job in jobs if job.pk not in coalesced]).update(
+        status=Job.PENDING, locked_by='', locked_at=None, **updates
+    )
+
+
+def reclaim_stale(now=None):
+    """TASK_LOCK_TIMEOUT ထက်ကြာ running ဖြစ်နေတဲ့ job (worker သေသွား) → pending"""
+    from main.models import Job
+
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=settings.TASK_LOCK_TIMEOUT)
+    with transaction.atomic(using=router.db_for_write(Job)):
+        stale = list(_jobs().filter(status=Job.RUNNING, locked_at__lt=cutoff))
+        if stale:
+            _requeue_or_coalesce(stale)
+    return len(stale)
+
+
+def claim(now=None, names=None):
+    """
+    အဟောင်းဆုံး due job ရဲ့ name နဲ့ တူတဲ့ pending job တွေကို batch_size ခုအထိ claim
+    UPDATE ... WHERE status = 'pending' တစ်ခုတည်းနဲ့ lock လို့ worker အများကြီး ပြိုင်လည်း ထပ်မယူ
+    → (Task | None, [Job])
+    """
+    from main.models import Job
+
+    now = now or timezone.now()
+    due = _jobs().filter(status=Job.PENDING, run_at__lte=now)
+    if names:
+        due = due.filter(name__in=names)
+    name = due.order_by('run_at', 'pk').values_list('name', flat=True).first()
+    if name is None:
+        return None, []
+
+    registered = get_task(name)
+    batch_size = registered.batch_size if registered else 100
+    token = uuid.uuid4().hex
+    batch = due.filter(name=name).order_by('run_at', 'pk').values('pk')[:batch_size]
+    _jobs().filter(pk__in=batch, status=Job.PENDING).update(
+        status=Job.RUNNING, locked_by=token, locked_at=now,
+    )
+    return registered, list(_jobs().filter(locked_by=token, status=Job.RUNNING).order_by('pk'))
+
+
+def run_batch(registered, jobs, now=None):
+    """claim လုပ်ထားတဲ့ job တွေကို handler နဲ့ run — success ဆို delete, error ဆို retry / failed"""
+    from main.models import Job
+
+    now = now or timezone.now()
+    pks = [job.pk for job in jobs]
+    if registered is None:
+        _jobs().filter(pk__in=pks).update(
+            status=Job.FAILED, attempts=1, last_error=f"No task registered as {jobs[0].name!r}",
+        )
+        return False
+    token = db_router.pin_to_primary()
+    try:
+        with transaction.atomic(using=router.db_for_write(Job)):
+            registered.handler([job.payload for job in jobs])
+    except Exception:
+        error = traceback.format_exc()
+        groups = {}
+        for job in jobs:
+            groups.setdefault(job.attempts + 1, []).append(job)
+        with transaction.atomic(using=router.db_for_write(Job)):
+            for attempts, group in groups.items():
+                if attempts >= registered.max_attempts:
+                    _jobs().filter(pk__in=[job.pk for job in group]).update(
+                        status=Job.FAILED, locked_by='', attempts=attempts, last_error=error,
+                    )
+                else:
+                    _requeue_or_coalesce(
+                        group, attempts=attempts, last_error=error,
+                        run_at=now + timedelta(seconds=backoff(attempts)),
+                    )
+        return False
+    finally:
+        db_router.unpin(token)
+    _jobs().filter(pk__in=pks).delete()
+    return True
+
+
+def run_pending(limit=None, names=None):
+    """due job တွေ ကုန်တဲ့အထိ (သို့) limit batch အထိ run → run ခဲ့တဲ့ job အရေအတွက်"""
+    reclaim_stale()
+    processed = batches = 0
+    while limit is None or batches < limit:
+        registered, jobs = claim(names=names)
+        if not jobs:
+            break
+        run_batch(registered, jobs)
+        processed += len(jobs)
+        batches += 1
+    return processed
+
+
+# ------------------------------------------------------------------------------
+# Post tasks
+# ------------------------------------------------------------------------------
+
+@task("posts.slug", batch_size=500)
+def generate_post_slugs(payloads):
+    """Post.slug ကို batch တစ်ခုလုံးအတွက် CASE UPDATE တစ်ကြိမ်နဲ့ set (updated_at မပြောင်း)"""
+    from main.models import Post
+
+    pks = {payload["pk"] for payload in payloads}
+    slugs = {}
+    for post in Post.objects.primary().filter(pk__in=pks).only('id', 'title', 'slug'):
+        slug = post.build_slug()
+        if slug != post.slug:
+            slugs[post.pk] = slug
+    if slugs:
+        Post.objects.primary().filter(pk__in=slugs).update(
+            slug=Case(*[When(pk=pk, then=Value(slug)) for pk, slug in slugs.items()])
+        )
+
+
+def enqueue_post_slugs(pks):
+    generate_post_slugs.enqueue_many([({"pk": pk}, f"posts.slug:{pk}") for pk in pks])
+
+
+@task("posts.related", batch_size=200)
+def update_related_posts(payloads):
+    """ပြောင်းသွားတဲ့ post တွေရဲ့ TF-IDF vector + related list ကို incremental update (main/related.py)"""
+    from main import related
+
+    related.update_posts({payload["pk"] for payload in payloads})
+
+
+def enqueue_post_updates(pks, fields=None):
+    """
+    Post create / update → ပြောင်းတဲ့ field (None = အားလုံး) အလိုက် slug / related job ကို
+    INSERT တစ်ခုတည်းနဲ့ enqueue (pk တူရင် coalesce)
+    """
+    jobs = []
+    for pk in pks:
+        if fields is None or 'title' in fields:
+            jobs.append((generate_post_slugs.name, {"pk": pk}, f"posts.slug:{pk}"))
+        if fields is None or 'title' in fields or 'content' in fields:
+            jobs.append((update_related_posts.name, {"pk": pk}, f"posts.related:{pk}"))
+    enqueue_jobs(jobs)
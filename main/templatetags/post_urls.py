@@ -0,0 +1,42 @@
+"""
+Per-row ``{% url %}`` reverse မလုပ်ဘဲ pk ပါတဲ့ URL ကို string concat နဲ့ တည်ဆောက်
+
+    urls = post_urls()                       # render တစ်ခါ reverse တစ်ကြိမ်
+    {{ urls.detail|with_pk:item.id }}        # row တစ်ခုစီ → prefix + pk + suffix
+"""
+from django import template
+from django.urls import reverse
+
+register = template.Library()
+
+# URL ထဲမှာ တခြားနေရာ မပေါ်နိုင်တဲ့ pk placeholder
+_SENTINEL = 9876543210123
+
+
+class PkURL:
+    """reverse(name, args=[pk]) ကို prefix / suffix အဖြစ် ခွဲထား"""
+
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(self, viewname):
+        url = reverse(viewname, args=[_SENTINEL])
+        self.prefix, _, self.suffix = url.partition(str(_SENTINEL))
+
+    def format(self, pk):
+        return f"{self.prefix}{pk}{self.suffix}"
+
+    def __str__(self):
+        return self.prefix
+
+
+def post_urls():
+    """Post row / result တွေမှာ သုံးတဲ့ pk URL patterns"""
+    return {
+        "detail": PkURL("website:get-detail"),
+        "edit": PkURL("website:get-update-post"),
+    }
+
+
+@register.filter
+def with_pk(url, pk):
+    return url.format(pk)
@@ -0,0 +1,48 @@
+"""
+Test helper
+- QueryBudgetMixin → settings.VIEW_QUERY_BUDGETS ထက် query ပိုသုံးရင် CI fail
+- TestRunner → background thread မှ DB write (view-count flusher) နဲ့ replica routing ကို ပိတ်
+
+    class IndexBudgetTest(QueryBudgetMixin, TestCase):
+        def test_index(self):
+            with self.assertQueryBudget("website:index"):
+                self.client.get(reverse("website:index"))
+"""
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Flusher thread က test တွေကြား ဆက်ရှင်ပြီး တခြား test က SQLite lock ကိုင်ထားတုန်း ရေးလို့
+    ပိတ်ထား — counter test တွေက flush() ကို ကိုယ်တိုင်ခေါ်
+    SQLITE_REPLICAS ပေးထားရင် replica တစ်ခုစီက ကိုယ်ပိုင် test DB (primary ရဲ့ write မမြင်) ဖြစ်လို့
+    read routing ကို ပိတ် — ReplicaIntegrationTest က override_settings နဲ့ ပြန်ဖွင့်
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.VIEW_COUNT_FLUSHER = False
+        settings.DATABASE_REPLICAS = {}
+
+
+class QueryBudgetMixin:
+    """TestCase mixin"""
+
+    @contextmanager
+    def assertQueryBudget(self, view_name, using="default"):
+        budget = settings.VIEW_QUERY_BUDGETS.get(view_name)
+        if budget is None:
+            self.fail(f"No query budget declared for {view_name!r} in VIEW_QUERY_BUDGETS")
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        executed = len(context)
+        if executed > budget:
+            queries = "\n".join(
+                f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{view_name} ran {executed} queries, budget is {budget}:\n{queries}")
@@ -0,0 +1,70 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from main.models import Post, PostStats
+from main.pagination import EstimatedCountPaginator
+
+
+class PostAdminChangelistTest(TestCase):
+    """
+    PostAdmin changelist performance mode
+    - content column မပြ / မ fetch, summary ပြ
+    - filter မပါရင် COUNT(*) မရှိ
+    - search → FTS MATCH
+    """
+
+    def setUp(self):
+        User.objects.create_superuser("admin", "admin@example.com", "password")
+        self.client = Client()
+        self.client.login(username="admin", password="password")
+        self.url = reverse('admin:main_post_changelist')
+        Post.objects.create(title="Apple pie", content="ပန်းသီး recipe " + "x" * 500)
+        Post.objects.create(title="Banana bread", content="Banana " + "y" * 500)
+
+    def _get(self, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'].upper() for query in ctx.captured_queries]
+
+    def test_summary_column_without_content(self):
+        response, queries = self._get()
+        self.assertContains(response, "ပန်းသီး recipe")
+        self.assertNotContains(response, "x" * 100)
+        post_queries = [sql for sql in queries if 'FROM "MAIN_POST"' in sql and 'MAIN_POST_FTS' not in sql]
+        self.assertTrue(post_queries)
+        for sql in post_queries:
+            self.assertNotIn('"MAIN_POST"."CONTENT"', sql)
+
+    def test_unfiltered_changelist_skips_count(self):
+        response, queries = self._get()
+        self.assertEqual(response.context['cl'].result_count, 2)
+        self.assertFalse([sql for sql in queries if 'COUNT(' in sql and 'MAIN_POST' in sql])
+
+    def test_search_uses_fts(self):
+        response, queries = self._get({'q': 'ပန်းသီး'})
+        self.assertEqual([post.title for post in response.context['cl'].result_list], ["Apple pie"])
+        self.assertTrue(any('MATCH' in sql for sql in queries))
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    """Stats row → count, filter ပါရင် / row မရှိရင် exact count"""
+
+    def setUp(self):
+        for i in range(3):
+            Post.objects.create(title=f"P{i}", content="body")
+
+    def test_unfiltered_uses_stats(self):
+        PostStats.objects.update(total_posts=1000)
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 1000)
+
+    def test_filtered_counts_exactly(self):
+        PostStats.objects.update(total_posts=1000)
+        paginator = EstimatedCountPaginator(Post.objects.filter(title="P1").order_by('pk'), 10)
+        self.assertEqual(paginator.count, 1)
+
+    def test_missing_stats_row_falls_back(self):
+        PostStats.objects.all().delete()
+        self.assertEqual(EstimatedCountPaginator(Post.objects.order_by('pk'), 10).count, 3)
@@ -0,0 +1,204 @@
+import json
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from main.models import Post
+
+
+class PostApiTest(TestCase):
+    """
+    JSON API အတွက် unit test
+    - list (keyset pagination), detail, create, partial update, delete
+    - batch create / update → transaction တစ်ခု, invalid row ပါရင် ဘာမှမရေး
+    - write → login + permission, PATCH → version မကိုက်ရင် 409
+    """
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user('editor')
+        self.user.user_permissions.set(Permission.objects.filter(
+            content_type__app_label='main', codename__in=['add_post', 'change_post', 'delete_post'],
+        ))
+        self.client.force_login(self.user)
+        self.url = reverse('website:api-posts')
+
+    def _send(self, method, url, payload):
+        return getattr(self.client, method)(url, data=json.dumps(payload), content_type='application/json')
+
+    def test_create_single(self):
+        """Object တစ်ခု POST → 201 + object"""
+        response = self._send('post', self.url, {'title': 'API', 'content': 'Body'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['title'], 'API')
+        self.assertEqual(Post.objects.get().summary, 'Body')
+
+    def test_batch_create_uses_single_insert(self):
+        """List POST → bulk_create (INSERT တစ်ခုတည်း)"""
+        payload = [{'title': f'T{i}', 'content': f'C{i}'} for i in range(20)]
+        # session, user, permission (user + group) → SAVEPOINT, INSERT, slug job INSERT, RELEASE
+        with self.assertNumQueries(8):
+            response = self._send('post', self.url, payload)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()['results']), 20)
+        self.assertEqual(Post.objects.count(), 20)
+
+    def test_batch_create_is_all_or_nothing(self):
+        """Invalid row တစ်ခုပါ → 400, DB မှာ ဘာမှ မဝင်"""
+        payload = [{'title': 'ok', 'content': 'ok'}, {'title': '', 'content': 'x'}]
+        response = self._send('post', self.url, payload)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('1', response.json()['errors'])
+        self.assertEqual(Post.objects.count(), 0)
+
+    @override_settings(API_MAX_BATCH_SIZE=2)
+    def test_batch_size_limit(self):
+        """API_MAX_BATCH_SIZE ကျော် → 400"""
+        payload = [{'title': 't', 'content': 'c'}] * 3
+        self.assertEqual(self._send('post', self.url, payload).status_code, 400)
+
+    def test_invalid_json(self):
+        """JSON မဟုတ် → 400"""
+        response = self.client.post(self.url, data='{nope', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_json_content_type_is_rejected(self):
+        """Cross-site text/plain form POST → 415 (CSRF exempt ဖြစ်လို့)"""
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.user)
+        body = json.dumps({'title': 'CSRF', 'content': 'x'})
+        response = client.post(self.url, data=body, content_type='text/plain')
+        self.assertEqual(response.status_code, 415)
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        self.assertEqual(client.patch(url, data=body, content_type='text/plain').status_code, 415)
+        self.assertEqual(Post.objects.get().title, 'A')
+
+    def test_non_string_fields_are_rejected(self):
+        """title / content က string မဟုတ် → 400 (repr အဖြစ် မသိမ်း)"""
+        response = self._send('post', self.url, [{'title': ['a'], 'content': 'x'}, {'title': 't', 'content': 1}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()['errors']), {'0', '1'})
+        self.assertEqual(Post.objects.count(), 0)
+
+    def test_batch_update(self):
+        """PATCH list → bulk_update, မပါတဲ့ field မပြောင်း"""
+        first = Post.objects.create(title='A', content='a')
+        second = Post.objects.create(title='B', content='b')
+        response = self._send('patch', self.url, [
+            {'id': first.pk, 'version': 1, 'title': 'A2'},
+            {'id': second.pk, 'version': 1, 'content': 'b2'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['version'] for r in response.json()['results']], [2, 2])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.title, first.content), ('A2', 'a'))
+        self.assertEqual((second.title, second.content, second.summary), ('B', 'b2', 'b2'))
+
+    def test_batch_update_version_conflict(self):
+        """Read ပြီးနောက် တခြား request ပြင်သွားတဲ့ row ပါ → 409, ဘာမှ မပြောင်း"""
+        first = Post.objects.create(title='A', content='a')
+        second = Post.objects.create(title='B', content='b')
+        Post.objects.get(pk=second.pk).save()  # version 2
+        response = self._send('patch', self.url, [
+            {'id': first.pk, 'version': 1, 'title': 'A2'},
+            {'id': second.pk, 'version': 1, 'title': 'B2'},
+        ])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(set(response.json()['errors']), {'1'})
+        self.assertEqual(sorted(Post.objects.values_list('title', flat=True)), ['A', 'B'])
+
+    def test_update_requires_version(self):
+        """PATCH မှာ version မပါ (သို့) integer မဟုတ် → 400"""
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        self.assertEqual(self._send('patch', url, {'title': 'X'}).status_code, 400)
+        self.assertEqual(self._send('patch', url, {'title': 'X', 'version': '1'}).status_code, 400)
+        response = self._send('patch', self.url, [{'id': post.pk, 'title': 'X'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('version', response.json()['errors']['0'])
+        post.refresh_from_db()
+        self.assertEqual((post.title, post.version), ('A', 1))
+
+    def test_batch_update_unknown_id(self):
+        """မရှိတဲ့ id → 400, ဘာမှ မပြောင်း"""
+        post = Post.objects.create(title='A', content='a')
+        response = self._send('patch', self.url, [
+            {'id': post.pk, 'version': 1, 'title': 'X'},
+            {'id': 999, 'version': 1, 'title': 'Y'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        post.refresh_from_db()
+        self.assertEqual(post.title, 'A')
+
+    def test_batch_update_rejects_boolean_id(self):
+        """{"id": true} ကို pk 1 အဖြစ် မယူရ"""
+        post = Post.objects.create(title='A', content='a')
+        response = self._send('patch', self.url, [{'id': True, 'version': 1, 'title': 'X'}])
+        self.assertEqual(response.status_code, 400)
+        post.refresh_from_db()
+        self.assertEqual(post.title, 'A')
+
+    def test_list_pagination(self):
+        """GET list → results + next cursor, content မပါ"""
+        for i in range(3):
+            Post.objects.create(title=f'P{i}', content='body')
+        response = self.client.get(self.url, {'page_size': 2})
+        data = response.json()
+        self.assertEqual([r['title'] for r in data['results']], ['P0', 'P1'])
+        self.assertNotIn('content', data['results'][0])
+        data = self.client.get(self.url, {'page_size': 2, 'after': data['next']}).json()
+        self.assertEqual([r['title'] for r in data['results']], ['P2'])
+        self.assertIsNone(data['next'])
+
+    def test_detail_patch_delete(self):
+        """Detail GET / PATCH / DELETE"""
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        self.assertEqual(self.client.get(url).json()['content'], 'a')
+        response = self._send('patch', url, {'content': 'new', 'version': 1})
+        self.assertEqual((response.json()['content'], response.json()['version']), ('new', 2))
+        self.assertEqual(self._send('patch', url, {'title': '', 'version': 2}).status_code, 400)
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_detail_patch_version_conflict(self):
+        """Client read ပြီးနောက် တခြား request ပြင်သွား → 409, နောက်ဆုံး edit ကို မဖျက်"""
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        version = self.client.get(url).json()['version']
+        self.assertEqual(self._send('patch', url, {'title': 'First', 'version': version}).status_code, 200)
+        response = self._send('patch', url, {'title': 'Second', 'version': version})
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('version', response.json()['errors'])
+        post.refresh_from_db()
+        self.assertEqual((post.title, post.version), ('First', 2))
+
+    def test_writes_require_login(self):
+        """Anonymous write → 401 (GET ရ), DB မပြောင်း"""
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        self.client.logout()
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(self._send('post', self.url, {'title': 'T', 'content': 'c'}).status_code, 401)
+        self.assertEqual(self._send('patch', url, {'title': 'X', 'version': 1}).status_code, 401)
+        self.assertEqual(self.client.delete(url).status_code, 401)
+        self.assertEqual(list(Post.objects.values_list('title', flat=True)), ['A'])
+
+    def test_writes_require_permission(self):
+        """Permission မရှိတဲ့ user → 403"""
+        post = Post.objects.create(title='A', content='a')
+        url = reverse('website:api-post-detail', args=[post.pk])
+        self.client.force_login(User.objects.create_user('reader'))
+        self.assertEqual(self._send('post', self.url, {'title': 'T', 'content': 'c'}).status_code, 403)
+        self.assertEqual(self._send('patch', url, {'title': 'X', 'version': 1}).status_code, 403)
+        self.assertEqual(self.client.delete(url).status_code, 403)
+        self.user.user_permissions.remove(Permission.objects.get(codename='delete_post'))
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.delete(url).status_code, 403)
+        self.assertTrue(Post.objects.filter(pk=post.pk).exists())
+
+    def test_method_not_allowed(self):
+        """PUT → 405"""
+        self.assertEqual(self.client.put(self.url).status_code, 405)
@@ -0,0 +1,100 @@
+import asyncio
+from unittest import mock
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from main import async_views
+from main.models import Post
+from main.urls import post_urlpatterns
+
+urlpatterns = [path('', include((post_urlpatterns(async_views), 'website')))]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncViewsTest(TestCase):
+    """
+    async_views (VIEW_MODE="async") အတွက် unit test
+    - sync view တွေနဲ့ behaviour တူရမယ်
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.post = Post.objects.create(title="Async Title", content="Async content")
+
+    async def test_index(self):
+        """GET index → 200 + row ပါ"""
+        response = await self.async_client.get(reverse('website:index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Async Title")
+        self.assertEqual(list(response.context['items']), [self.post])
+
+    async def test_detail_and_not_found(self):
+        """Detail → 200, မရှိတဲ့ pk → redirect + message"""
+        response = await self.async_client.get(reverse('website:get-detail', args=[self.post.pk]))
+        self.assertContains(response, "Async content")
+        response = await self.async_client.get(reverse('website:get-detail', args=[999]))
+        self.assertRedirects(response, reverse('website:index'), fetch_redirect_response=False)
+        messages = list(get_messages(response.asgi_request))
+        self.assertTrue(any("Id not found" in str(m) for m in messages))
+
+    async def test_unrendered_post_falls_back_to_escaped_content(self):
+        """render_version = 0 (render မလုပ်ရသေး) → deferred content ကို loop ပေါ်ကနေ lazy load မလုပ်"""
+        await Post.objects.filter(pk=self.post.pk).aupdate(render_version=0, content_html="", content="<b>raw</b>")
+        response = await self.async_client.get(reverse('website:get-detail', args=[self.post.pk]))
+        self.assertContains(response, "<p>&lt;b&gt;raw&lt;/b&gt;</p>", html=False)
+
+    async def test_cache_is_not_called_on_event_loop(self):
+        """file / redis backend မှာ loop ကို block မလုပ်အောင် sync cache API ကို loop ပေါ်ကနေ မခေါ်ရ"""
+        on_loop = []
+
+        def guard(name):
+            original = getattr(LocMemCache, name)
+
+            def wrapper(self, *args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    on_loop.append(name)
+                except RuntimeError:
+                    pass
+                return original(self, *args, **kwargs)
+            return mock.patch.object(LocMemCache, name, wrapper)
+
+        patches = [guard(name) for name in ("get", "get_many", "set_many", "add", "incr")]
+        for patch in patches:
+            patch.start()
+        try:
+            for url in (reverse('website:index'), reverse('website:get-detail', args=[self.post.pk])):
+                self.assertEqual((await self.async_client.get(url)).status_code, 200)
+                self.assertEqual((await self.async_client.get(url)).status_code, 200)  # cache hit
+        finally:
+            for patch in patches:
+                patch.stop()
+        self.assertEqual(on_loop, [])
+
+    async def test_create(self):
+        """POST valid → asave() + redirect"""
+        response = await self.async_client.post(
+            reverse('website:post-create-post'), {"title": "New", "content": "Body"}
+        )
+        self.assertRedirects(response, reverse('website:index'), fetch_redirect_response=False)
+        self.assertTrue(await Post.objects.filter(title="New").aexists())
+
+    async def test_update(self):
+        """POST valid → update, invalid → form ပြန်ပြ"""
+        url = reverse('website:post-update-post', args=[self.post.pk])
+        response = await self.async_client.post(url, {"title": "Updated", "content": "Changed"})
+        self.assertEqual(response.status_code, 302)
+        await self.post.arefresh_from_db()
+        self.assertEqual(self.post.summary, "Changed")
+        response = await self.async_client.post(url, {"title": "", "content": ""})
+        self.assertTemplateUsed(response, "create_post.html")
+
+    async def test_get_update_post(self):
+        """Edit form → 200, မရှိ → redirect"""
+        response = await self.async_client.get(reverse('website:get-update-post', args=[self.post.pk]))
+        self.assertEqual(response.status_code, 200)
+        response = await self.async_client.get(reverse('website:get-update-post', args=[999]))
+        self.assertEqual(response.status_code, 302)
@@ -0,0 +1,99 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from main.models import Post
+
+
+class ImportExportCommandTest(TestCase):
+    """
+    import_posts / export_posts command အတွက် unit test
+    - JSONL / CSV round trip
+    - PostForm validation (invalid row → abort / skip)
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def _write(self, name, text):
+        path = self._path(name)
+        with open(path, "w", encoding="utf-8", newline="") as stream:
+            stream.write(text)
+        return path
+
+    def test_import_jsonl_in_batches(self):
+        """JSONL → batch-size အလိုက် import, throughput report"""
+        lines = "".join(json.dumps({"title": f"T{i}", "content": f"body {i}"}) + "\n" for i in range(5))
+        out = StringIO()
+        call_command("import_posts", self._write("posts.jsonl", lines), "--batch-size", "2", stdout=out)
+        self.assertEqual(Post.objects.count(), 5)
+        self.assertIn("Imported 5 posts", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(Post.objects.get(title="T3").summary, "body 3")
+
+    def test_import_csv(self):
+        """CSV header (title, content) → import"""
+        path = self._write("posts.csv", "title,content\nခေါင်းစဉ်,\"multi, line\ncontent\"\n")
+        call_command("import_posts", path, stdout=StringIO())
+        self.assertEqual(Post.objects.get().content, "multi, line\ncontent")
+
+    def test_invalid_row_aborts(self):
+        """Invalid row → CommandError"""
+        path = self._write("bad.jsonl", json.dumps({"title": "", "content": "x"}) + "\n")
+        with self.assertRaises(CommandError):
+            call_command("import_posts", path, stdout=StringIO())
+        self.assertEqual(Post.objects.count(), 0)
+
+    def test_skip_invalid(self):
+        """--skip-invalid → invalid row ကို ကျော်"""
+        lines = json.dumps({"title": "", "content": "x"}) + "\n" + json.dumps({"title": "ok", "content": "y"}) + "\n"
+        err = StringIO()
+        call_command("import_posts", self._write("mixed.jsonl", lines), "--skip-invalid", stdout=StringIO(), stderr=err)
+        self.assertEqual(Post.objects.count(), 1)
+        self.assertIn("line 1", err.getvalue())
+
+    def test_non_string_fields_are_invalid_rows(self):
+        """JSON title / content က string မဟုတ် → invalid row (repr အဖြစ် မသိမ်း၊ traceback မထွက်)"""
+        rows = [{"title": ["a"], "content": "x"}, {"title": "t", "content": 1}, {"title": None}, {"title": "ok", "content": "y"}]
+        path = self._write("types.jsonl", "".join(json.dumps(row) + "\n" for row in rows))
+        with self.assertRaisesMessage(CommandError, "line 1"):
+            call_command("import_posts", path, stdout=StringIO())
+        err = StringIO()
+        call_command("import_posts", path, "--skip-invalid", stdout=StringIO(), stderr=err)
+        self.assertEqual(list(Post.objects.values_list("title", flat=True)), ["ok"])
+        for line_no in (1, 2, 3):
+            self.assertIn(f"line {line_no}:", err.getvalue())
+        self.assertIn("Expected a string.", err.getvalue())
+
+    def test_export_jsonl_and_csv_round_trip(self):
+        """export → import ပြန်လုပ်ရင် data တူရမယ်"""
+        Post.objects.create(title="One", content="first, with comma")
+        Post.objects.create(title="Two", content="second\nline")
+        jsonl_path = self._path("out.jsonl")
+        csv_path = self._path("out.csv")
+        call_command("export_posts", jsonl_path, "--chunk-size", "1", stdout=StringIO())
+        call_command("export_posts", csv_path, stdout=StringIO())
+
+        with open(jsonl_path, encoding="utf-8") as stream:
+            rows = [json.loads(line) for line in stream]
+        self.assertEqual([r["title"] for r in rows], ["One", "Two"])
+        with open(csv_path, encoding="utf-8", newline="") as stream:
+            self.assertEqual([r["content"] for r in csv.DictReader(stream)], ["first, with comma", "second\nline"])
+
+        Post.objects.all().delete()
+        call_command("import_posts", csv_path, stdout=StringIO())
+        self.assertEqual(list(Post.objects.values_list("title", flat=True)), ["One", "Two"])
+
+    def test_unknown_extension_requires_format(self):
+        """Extension မသိရင် --format လိုအပ်"""
+        with self.assertRaises(CommandError):
+            call_command("export_posts", self._path("out.txt"), stdout=StringIO())
@@ -0,0 +1,85 @@
+from django.core.cache import cache
+from django.test import TestCase, Client
+from django.urls import reverse
+from main.models import Post
+
+
+class DetailConditionalGetTest(TestCase):
+    """
+    get_detail → ETag / Last-Modified
+    - validator ကိုက်ရင် 304, template render မလုပ်ရ
+    - update ပြီးရင် 200 ပြန်ရ
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.post = Post.objects.create(title="Title", content="Body")
+        self.url = reverse('website:get-detail', args=[self.post.pk])
+
+    def test_headers_present(self):
+        """200 response မှာ ETag, Last-Modified ပါရမယ်"""
+        response = self.client.get(self.url)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertTrue(response.has_header('Last-Modified'))
+
+    def test_if_none_match_returns_304(self):
+        """If-None-Match ကိုက် → 304, template မသုံး"""
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertTemplateNotUsed(response, 'detail.html')
+
+    def test_if_modified_since_returns_304(self):
+        """If-Modified-Since >= updated_at → 304"""
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_update_changes_etag(self):
+        """Post update ပြီးရင် ETag အဟောင်း → 200"""
+        etag = self.client.get(self.url)['ETag']
+        self.post.content = "New body"
+        self.post.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class IndexConditionalGetTest(TestCase):
+    """
+    index → MAX(updated_at) ကနေ validator
+    - 304 path မှာ aggregate query တစ်ခုပဲ
+    - create / delete ပြီးရင် ETag ပြောင်းရ
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.post = Post.objects.create(title="Title", content="Body")
+        self.url = reverse('website:index')
+
+    def test_if_none_match_returns_304_with_single_query(self):
+        """ETag ကိုက် → 304, MAX aggregate query ပဲ"""
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1) as ctx:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('MAX(', ctx.captured_queries[0]['sql'].upper())
+
+    def test_create_and_delete_change_etag(self):
+        """Create / delete → ETag အသစ်"""
+        first = self.client.get(self.url)['ETag']
+        other = Post.objects.create(title="Other", content="Body")
+        second = self.client.get(self.url)['ETag']
+        self.assertNotEqual(first, second)
+        other.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=second)
+        self.assertEqual(response.status_code, 200)
+
+    def test_query_string_changes_etag(self):
+        """Page တစ်ခုစီ ETag မတူရ"""
+        first = self.client.get(self.url)['ETag']
+        other = self.client.get(self.url, {'page_size': 1})['ETag']
+        self.assertNotEqual(first, other)
@@ -0,0 +1,137 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from main import counters
+from main.models import Post, PostViews
+
+
+class ViewCounterTest(TestCase):
+    """Buffer → PostViews upsert (delta ပေါင်း)"""
+
+    def setUp(self):
+        cache.clear()
+        counters.buffer.discard()
+        self.addCleanup(counters.buffer.discard)
+        self.posts = [Post.objects.create(title=f"P{i}", content="body") for i in range(3)]
+
+    def counts(self):
+        return dict(PostViews.objects.values_list('post_id', 'count'))
+
+    def test_flush_upserts_in_one_transaction(self):
+        counter = counters.ViewCounter()
+        a, b, _ = self.posts
+        counter._pending.update({a.pk: 3, b.pk: 1})
+        with self.assertNumQueries(4):  # SAVEPOINT, SELECT existing, upsert, RELEASE
+            self.assertEqual(counter.flush(), 2)
+        self.assertEqual(self.counts(), {a.pk: 3, b.pk: 1})
+        self.assertEqual(counter.pending(), {})
+
+    def test_workers_add_deltas(self):
+        """Process နှစ်ခု (buffer နှစ်ခု) flush → count ပေါင်း (overwrite မဖြစ်)"""
+        pk = self.posts[0].pk
+        for n in (2, 5):
+            counter = counters.ViewCounter()
+            counter._pending[pk] = n
+            counter.flush()
+        self.assertEqual(self.counts(), {pk: 7})
+
+    def test_deleted_post_is_skipped(self):
+        post = self.posts[0]
+        counters.buffer._pending.update({post.pk: 1, 999: 4})
+        counters.buffer.flush()
+        self.assertEqual(self.counts(), {post.pk: 1})
+        post.delete()
+        self.assertFalse(PostViews.objects.exists())
+
+    def test_failed_flush_restores_pending(self):
+        pk = self.posts[0].pk
+        counters.buffer._pending[pk] = 2
+        with mock.patch.object(counters, 'write_counts', side_effect=DatabaseError("database is locked")):
+            with self.assertRaises(DatabaseError):
+                counters.buffer.flush()
+        self.assertEqual(counters.buffer.pending(), {pk: 2})
+        counters.buffer.flush()
+        self.assertEqual(self.counts(), {pk: 2})
+
+    def test_background_flush_failure_is_logged(self):
+        pk = self.posts[0].pk
+        counters.buffer._pending[pk] = 2
+        with mock.patch.object(counters, 'write_counts', side_effect=DatabaseError("database is locked")):
+            with self.assertLogs('main.counters', 'ERROR') as logs:
+                counters.buffer._flush_logged()
+        self.assertIn("database is locked", logs.output[0])
+        self.assertEqual(counters.buffer.pending(), {pk: 2})
+
+    def test_large_flush_is_chunked(self):
+        """Distinct pk များလာလည်း statement တစ်ခုစီ bound variable limit မကျော်"""
+        counts = {post.pk: 1 for post in self.posts}
+        counts.update({100000 + i: 1 for i in range(5000)})  # ဖျက်ပြီးသား post
+        with mock.patch.object(counters, 'WRITE_CHUNK_SIZE', 2):
+            # SAVEPOINT / RELEASE + chunk 2502 ခုစီ SELECT + post ရှိတဲ့ chunk 2 ခု upsert
+            with self.assertNumQueries(2 + 2502 + 2):
+                self.assertEqual(counters.write_counts(counts), 3)
+        self.assertEqual(counters.write_counts({100000 + i: 1 for i in range(20000)} | counts), 3)
+        self.assertEqual(self.counts(), {post.pk: 2 for post in self.posts})
+
+
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=60)
+class ViewCountViewsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        counters.buffer.discard()
+        self.addCleanup(counters.buffer.discard)
+        self.post = Post.objects.create(title="Viewed", content="body")
+
+    def test_detail_records_in_memory_only(self):
+        url = reverse('website:get-detail', args=[self.post.pk])
+        self.client.get(url)
+        with self.assertNumQueries(0):  # fragment cache hit + buffer
+            self.client.get(url)
+        self.assertEqual(counters.buffer.pending(), {self.post.pk: 2})
+        self.assertFalse(PostViews.objects.exists())
+
+    def test_missing_post_is_not_counted(self):
+        self.client.get(reverse('website:get-detail', args=[999]))
+        self.assertEqual(counters.buffer.pending(), {})
+
+    def test_popular_listing(self):
+        other = Post.objects.create(title="Most <viewed>", content="body")
+        PostViews.objects.bulk_create([PostViews(post=self.post, count=3), PostViews(post=other, count=10)])
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('website:popular'))
+        self.assertEqual([view.post_id for view in response.context['views']], [other.pk, self.post.pk])
+        self.assertContains(response, "Most &lt;viewed&gt;</a> (10 views)")
+
+
+class ViewCounterFlusherTest(TransactionTestCase):
+
+    def setUp(self):
+        counters.buffer.discard()
+
+    def test_flusher_is_off_in_tests(self):
+        post = Post.objects.create(title="P", content="body")
+        counters.record_view(post.pk)
+        self.assertIsNone(counters.buffer._thread)
+        self.assertEqual(counters.buffer.flush(), 1)
+        self.assertEqual(PostViews.objects.get().count, 1)
+
+    @override_settings(VIEW_COUNT_FLUSHER=True, VIEW_COUNT_FLUSH_SIZE=2)
+    def test_size_threshold_wakes_flusher(self):
+        # TransactionTestCase ရဲ့ table flush မတိုင်ခင် thread ကို ရပ်
+        self.addCleanup(counters.buffer.stop)
+        post = Post.objects.create(title="P", content="body")
+        counters.record_view(post.pk)
+        counters.record_view(post.pk)
+        deadline = time.monotonic() + 5
+        while not PostViews.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(PostViews.objects.get().count, 2)
+        counters.record_view(post.pk)
+        counters.buffer.stop()
+        self.assertFalse(counters.buffer.pending())
+        self.assertEqual(PostViews.objects.get().count, 3)
@@ -0,0 +1,201 @@
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.http import HttpResponse
+from django.test import TestCase, TransactionTestCase, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from main import db_router
+from main.db_router import PrimaryReplicaRouter
+from main.middleware import ReplicaStickinessMiddleware
+from main.models import Post
+
+
+class SqliteProfileTest(TestCase):
+    """
+    SQLITE_PROFILE = "tuned" → connection init မှာ pragma တွေ apply ဖြစ်ရမယ်
+    """
+
+    def _pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragmas_applied(self):
+        """synchronous=NORMAL(1), temp_store=MEMORY(2), busy_timeout, cache_size"""
+        if settings.SQLITE_PROFILE != "tuned" or connection.vendor != "sqlite":
+            self.skipTest("tuned SQLite profile is not active")
+        self.assertEqual(self._pragma("synchronous"), 1)
+        self.assertEqual(self._pragma("temp_store"), 2)
+        self.assertEqual(self._pragma("busy_timeout"), settings.SQLITE_PRAGMAS["busy_timeout"])
+        self.assertEqual(self._pragma("cache_size"), settings.SQLITE_PRAGMAS["cache_size"])
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+
+    def test_wal_is_opt_in(self):
+        """WAL (file header ထဲ အမြဲမှတ်) ကို SQLITE_WAL=true မှ init_command ထဲ ထည့်"""
+        if settings.SQLITE_PROFILE != "tuned":
+            self.skipTest("tuned SQLite profile is not active")
+        init_command = settings.DATABASES["default"]["OPTIONS"]["init_command"]
+        self.assertEqual("PRAGMA journal_mode=WAL" in init_command, settings.SQLITE_WAL)
+
+
+@override_settings(DATABASE_REPLICAS={'replica1': 1, 'replica2': 3}, REPLICA_STRATEGY='round_robin')
+class PrimaryReplicaRouterTest(TestCase):
+    """
+    PrimaryReplicaRouter အတွက် unit test
+    - read → replica (round robin / weighted), write → primary
+    - pinned → read လည်း primary
+    """
+
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_round_robin_reads(self):
+        """Read → replica1, replica2, replica1 ..."""
+        picks = [self.router.db_for_read(Post) for _ in range(4)]
+        self.assertEqual(picks, ['replica1', 'replica2', 'replica1', 'replica2'])
+        self.assertEqual(self.router.db_for_write(Post), 'default')
+
+    @override_settings(REPLICA_STRATEGY='weighted')
+    def test_weighted_reads(self):
+        """Weighted → replica alias တွေထဲကပဲ ရွေး"""
+        picks = {self.router.db_for_read(Post) for _ in range(50)}
+        self.assertTrue(picks <= {'replica1', 'replica2'})
+
+    def test_pinned_reads_use_primary(self):
+        """pin_to_primary() → read လည်း default"""
+        token = db_router.pin_to_primary()
+        try:
+            self.assertEqual(self.router.db_for_read(Post), 'default')
+        finally:
+            db_router.unpin(token)
+        self.assertNotEqual(self.router.db_for_read(Post), 'default')
+
+    @override_settings(DATABASE_REPLICAS={})
+    def test_no_replicas(self):
+        """Replica မရှိ → default"""
+        self.assertEqual(self.router.db_for_read(Post), 'default')
+
+
+class ReplicaStickinessMiddlewareTest(TestCase):
+    """
+    Write ပြီးရင် cookie window အတွင်း read တွေ primary ကိုပဲ သွားရမယ်
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = []
+
+        def view(request):
+            self.seen.append(db_router.is_pinned())
+            return HttpResponse(status=302 if request.method == 'POST' else 200)
+
+        self.middleware = ReplicaStickinessMiddleware(view)
+
+    def test_write_sets_cookie_and_pins(self):
+        """POST → pinned + cookie set"""
+        response = self.middleware(self.factory.post('/create/'))
+        self.assertEqual(self.seen, [True])
+        cookie = response.cookies[settings.READ_YOUR_WRITES_COOKIE]
+        self.assertEqual(cookie['max-age'], settings.READ_YOUR_WRITES_SECONDS)
+        self.assertFalse(db_router.is_pinned())
+
+    def test_read_with_cookie_is_pinned(self):
+        """Cookie ပါတဲ့ GET → pinned, cookie မပါ → replica"""
+        request = self.factory.get('/')
+        request.COOKIES[settings.READ_YOUR_WRITES_COOKIE] = '1'
+        self.middleware(request)
+        self.middleware(self.factory.get('/'))
+        self.assertEqual(self.seen, [True, False])
+
+    def test_failed_write_does_not_set_cookie(self):
+        """4xx write → cookie မထည့်"""
+        middleware = ReplicaStickinessMiddleware(lambda request: HttpResponse(status=400))
+        response = middleware(self.factory.post('/create/'))
+        self.assertNotIn(settings.READ_YOUR_WRITES_COOKIE, response.cookies)
+
+
+class ReplicaReadPathTest(TestCase):
+    """
+    Fragment cache miss → primary ကနေပဲ ဖတ် (replica lag ကြောင့် stale HTML မ cache မိအောင်)
+    Streaming index → middleware unpin ပြီးမှ iterate လည်း pinned database ကို သုံး
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.post = Post.objects.create(title="Primary", content="fresh")
+        self.reads = []
+        original = PrimaryReplicaRouter.db_for_read
+
+        def db_for_read(router, model, **hints):
+            self.reads.append((model._meta.model_name, db_router.is_pinned()))
+            return original(router, model, **hints)
+
+        patcher = mock.patch.object(PrimaryReplicaRouter, 'db_for_read', db_for_read)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_detail_miss_reads_primary(self):
+        response = self.client.get(reverse('website:get-detail', args=[self.post.pk]))
+        self.assertContains(response, "fresh")
+        self.assertEqual([model for model, _ in self.reads if model in ('post', 'relatedpost')], [])
+
+    def test_stream_keeps_pinned_database(self):
+        self.client.cookies[settings.READ_YOUR_WRITES_COOKIE] = '1'
+        response = self.client.get(reverse('website:index-stream'))
+        self.assertFalse(db_router.is_pinned())
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn("Primary", body)
+        self.assertEqual({pinned for model, pinned in self.reads if model == 'post'}, {True})
+
+
+REPLICAS = [alias for alias in settings.DATABASES if alias != DEFAULT_DB_ALIAS]
+
+
+@skipUnless(REPLICAS, "set SQLITE_REPLICAS=/path/replica.sqlite3 to run")
+@override_settings(DATABASE_REPLICAS=dict.fromkeys(REPLICAS, 1))
+class ReplicaIntegrationTest(TransactionTestCase):
+    """
+    Primary + replica test DB နှစ်ခု (MIRROR မဟုတ်) နဲ့ end-to-end စမ်းသပ်
+    Replica ကို setUp မှာ primary ကနေ copy (replication) ပြီး နောက် write တွေက primary မှာပဲ (lag)
+    TestRunner က routing ကို ပိတ်ထားလို့ ဒီ class မှာပဲ DATABASE_REPLICAS ပြန်ဖွင့်
+
+        SQLITE_REPLICAS=/tmp/replica.sqlite3 python manage.py test main.tests.test_database
+    """
+    databases = '__all__'
+
+    def setUp(self):
+        cache.clear()
+        Post.objects.create(title="Replicated", content="c")
+        rows = list(Post.objects.using(DEFAULT_DB_ALIAS).values())
+        for alias in REPLICAS:
+            Post.objects.using(alias).bulk_create(Post(**row) for row in rows)
+
+    @contextmanager
+    def capture_replica_queries(self):
+        with ExitStack() as stack:
+            contexts = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in REPLICAS]
+            queries = []
+            yield queries
+        queries.extend(query for context in contexts for query in context.captured_queries)
+
+    def test_reads_go_to_replica_until_write(self):
+        """Cookie မရှိ → replica, create ပြီး cookie ပါ → primary (replica မှာ မရှိသေးတဲ့ row ပါ)"""
+        with self.capture_replica_queries() as replica_queries:
+            response = self.client.get(reverse('website:index'))
+        self.assertTrue(replica_queries)
+        self.assertContains(response, "Replicated")
+
+        self.client.post(reverse('website:post-create-post'), {"title": "Fresh", "content": "c"})
+        self.assertIn(settings.READ_YOUR_WRITES_COOKIE, self.client.cookies)
+        for alias in REPLICAS:
+            self.assertFalse(Post.objects.using(alias).filter(title="Fresh").exists())
+        with self.capture_replica_queries() as replica_queries:
+            response = self.client.get(reverse('website:index'))
+        self.assertEqual(replica_queries, [])
+        self.assertContains(response, "Fresh")
@@ -0,0 +1,143 @@
+import sqlite3
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from main import fields, search, stats
+from main.models import Post
+
+LONG = "compressible paragraph about django " * 100
+
+
+def storage_type(pk):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT typeof(content) FROM main_post WHERE id = %s", [pk])
+        return cursor.fetchone()[0]
+
+
+@override_settings(TEXT_COMPRESS_MIN_BYTES=1024)
+class CompressedTextFieldTest(TestCase):
+    """Post.content → threshold ကျော်ရင် BLOB၊ attribute access မှ decompress"""
+
+    def setUp(self):
+        self.big = Post.objects.create(title="Big", content=LONG)
+        self.small = Post.objects.create(title="Small", content="short body")
+
+    def test_threshold(self):
+        self.assertEqual(storage_type(self.big.pk), "blob")
+        self.assertEqual(storage_type(self.small.pk), "text")
+        self.assertEqual(Post.objects.get(pk=self.big.pk).content, LONG)
+
+    def test_incompressible_text_stays_plain(self):
+        post = Post.objects.create(title="Random", content=bytes(range(256)).hex() * 2)
+        with mock.patch.object(fields.zlib, "compress", return_value=b"x" * 2000):
+            post.save()
+        self.assertEqual(storage_type(post.pk), "text")
+
+    def test_decompress_on_attribute_access_only(self):
+        with mock.patch.object(fields, "decompress", wraps=fields.decompress) as decompress:
+            post = Post.objects.get(pk=self.big.pk)
+            self.assertEqual(post.get_summary(), LONG[:50])
+            decompress.assert_not_called()
+            self.assertEqual(post.content, LONG)
+            self.assertEqual(post.content, LONG)
+            decompress.assert_called_once()
+
+    def test_title_only_save_keeps_compressed_bytes(self):
+        with mock.patch.object(fields, "decompress", wraps=fields.decompress) as decompress:
+            post = Post.objects.get(pk=self.big.pk)
+            post.title = "Renamed"
+            post.save()
+            decompress.assert_not_called()
+        self.assertEqual(storage_type(post.pk), "blob")
+        self.assertEqual(Post.objects.get(pk=post.pk).content, LONG)
+
+    def test_values_are_decompressed(self):
+        self.assertEqual(Post.objects.filter(pk=self.big.pk).values("content").get(), {"content": LONG})
+        self.assertEqual(list(Post.objects.filter(pk=self.big.pk).values_list("content", flat=True)), [LONG])
+        row = Post.objects.filter(pk=self.big.pk).values_list("title", "content", named=True).get()
+        self.assertEqual((row.title, row.content), ("Big", LONG))
+
+    def test_bulk_update_compresses(self):
+        self.small.content = LONG
+        Post.objects.bulk_update([self.small], ["content"])
+        self.assertEqual(storage_type(self.small.pk), "blob")
+        self.assertEqual(Post.objects.get(pk=self.small.pk).summary, LONG[:50])
+
+    def test_search_snippet_reads_decompressed_text(self):
+        result = search.search("paragraph")[0]
+        self.assertEqual(result.pk, self.big.pk)
+        self.assertIn("<mark>paragraph</mark>", result.snippet)
+        post = Post.objects.get(pk=self.big.pk)
+        post.content = "now about flask " * 100
+        post.save()
+        self.assertEqual(search.search("paragraph"), [])
+        self.assertEqual([r.pk for r in search.search("flask")], [post.pk])
+
+    def test_queryset_update_and_bulk_create_index_compressed_text(self):
+        Post.objects.filter(pk=self.small.pk).update(content="now about flask " * 100)
+        created = Post.objects.bulk_create([Post(title="Bulk", content="all about rust " * 100)])
+        self.assertEqual(storage_type(self.small.pk), "blob")
+        self.assertEqual([r.pk for r in search.search("flask")], [self.small.pk])
+        self.assertEqual([r.pk for r in search.search("rust")], [created[0].pk])
+
+    def test_raw_sqlite_writes_need_no_app_functions(self):
+        """sqlite3 CLI / backup tool နဲ့တူ — app function မရှိတဲ့ connection ကနေ write"""
+        raw = sqlite3.connect(":memory:")
+        self.addCleanup(raw.close)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT GLOB 'sqlite_*' "
+                "AND NOT (type = 'table' AND name GLOB %s) ORDER BY type = 'trigger'",
+                [f"{search.FTS_TABLE}_*"],
+            )
+            for (sql,) in cursor.fetchall():
+                raw.execute(sql)
+        insert = (
+            "INSERT INTO main_post (title, content, summary, content_html, content_hash, render_version, "
+            "slug, created_at, updated_at, version) VALUES (?, ?, '', '', '', 0, '', "
+            "'2026-01-01 00:00:00', '2026-01-01 00:00:00', 1)"
+        )
+        raw.execute(insert, ["Big", fields.compress(LONG)])
+        raw.execute(insert, ["Raw", "inserted by hand"])
+        raw.execute(insert, ["Edit", "draft"])
+        raw.execute("UPDATE main_post SET content = 'edited by hand', title = 'Edited' WHERE title = 'Edit'")
+        raw.execute("DELETE FROM main_post WHERE title = 'Big'")
+
+        matches = raw.execute(
+            f"SELECT count(*) FROM {search.FTS_TABLE} WHERE {search.FTS_TABLE} MATCH 'hand'"
+        ).fetchone()
+        self.assertEqual(matches, (2,))
+        totals = raw.execute(
+            f"SELECT total_posts, total_content_bytes FROM {stats.STATS_TABLE} WHERE id = {stats.STATS_PK}"
+        ).fetchone()
+        self.assertEqual(totals, (2, len("inserted by hand") + len("edited by hand")))
+
+    def test_blob_header_records_text_size(self):
+        stored = fields.compress(LONG)
+        self.assertTrue(stored.startswith(fields.ZLIB + str(len(LONG.encode())).encode() + fields.SIZE_END))
+        self.assertEqual(fields.decompress(stored), LONG)
+        self.assertEqual(stats.get_totals().content_bytes, len(LONG) + len("short body"))
+
+
+class CompressPostContentCommandTest(TestCase):
+    """compress_post_content → chunk အလိုက် backfill (version / updated_at / index မပြောင်း)"""
+
+    def test_backfill_and_decompress(self):
+        with override_settings(TEXT_COMPRESS_MIN_BYTES=10 ** 9):
+            posts = [Post.objects.create(title=f"P{i}", content=LONG) for i in range(5)]
+        Post.objects.create(title="Small", content="short body")
+        before = list(Post.objects.order_by("pk").values_list("version", "updated_at"))
+
+        out = StringIO()
+        call_command("compress_post_content", "--chunk-size", "2", stdout=out)
+        self.assertIn("5 of 6 posts compressed", out.getvalue())
+        self.assertEqual({storage_type(post.pk) for post in posts}, {"blob"})
+        self.assertEqual(list(Post.objects.order_by("pk").values_list("version", "updated_at")), before)
+        self.assertEqual(len(search.search("paragraph")), 5)
+
+        call_command("compress_post_content", "--decompress", stdout=out)
+        self.assertEqual({storage_type(post.pk) for post in posts}, {"text"})
+        self.assertEqual(Post.objects.get(pk=posts[0].pk).content, LONG)
@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.test import TestCase, Client
+from django.urls import reverse
+from main import fragment_cache
+from main.models import Post
+
+
+class FragmentCacheTest(TestCase):
+    """
+    Fragment cache အတွက် unit test
+    - version counter တိုးရင် fragment အဟောင်း မရတော့
+    - save / delete signal → invalidate
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.post = Post.objects.create(title="Cached", content="Body")
+
+    def test_render_then_hit(self):
+        """render_fragments() ပြီးရင် get_fragments() hit ဖြစ်ရမယ်"""
+        versions = fragment_cache.get_versions([self.post.pk])
+        self.assertEqual(fragment_cache.get_fragments(versions, 'detail'), {})
+        fragment_cache.render_fragments([self.post], 'detail', versions)
+        hit = fragment_cache.get_fragments(fragment_cache.get_versions([self.post.pk]), 'detail')
+        self.assertIn("Cached", hit[self.post.pk].html)
+
+    def test_save_and_delete_bump_version(self):
+        """save() / delete() → version ပြောင်းရမယ်"""
+        before = fragment_cache.get_versions([self.post.pk])[self.post.pk]
+        self.post.title = "Changed"
+        self.post.save()
+        after_save = fragment_cache.get_versions([self.post.pk])[self.post.pk]
+        self.assertNotEqual(before, after_save)
+        pk = self.post.pk
+        self.post.delete()
+        self.assertNotEqual(after_save, fragment_cache.get_versions([pk])[pk])
+
+    def test_missing_version_is_reinitialised(self):
+        """Version key evict ဖြစ်သွားရင် invalidate() က error မတက်ရ"""
+        cache.clear()
+        fragment_cache.invalidate(self.post.pk)
+        self.assertIn(self.post.pk, fragment_cache.get_versions([self.post.pk]))
+
+
+class CachedViewsTest(TestCase):
+    """
+    View level cache behaviour
+    - detail cache hit → ORM query 0
+    - post_update_post → fragment invalidate
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.post = Post.objects.create(title="Old Title", content="Old content")
+        self.detail_url = reverse('website:get-detail', args=[self.post.pk])
+
+    def test_detail_cache_hit_needs_no_queries(self):
+        """ဒုတိယ request → DB query မရှိ"""
+        self.client.get(self.detail_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url)
+        self.assertContains(response, "Old content")
+
+    def test_update_invalidates_detail_and_row(self):
+        """Update ပြီးရင် detail / index မှာ content အသစ် ပြရမယ်"""
+        self.client.get(self.detail_url)
+        self.client.get(reverse('website:index'))
+        self.client.post(
+            reverse('website:post-update-post', args=[self.post.pk]),
+            {"title": "New Title", "content": "New content"},
+        )
+        self.assertContains(self.client.get(self.detail_url), "New content")
+        self.assertContains(self.client.get(reverse('website:index')), "New Title")
+
+    def test_index_row_hits_skip_listing_query(self):
+        """Row fragment အားလုံး hit → validator aggregate + stats row + pk page query ပဲ"""
+        self.client.get(reverse('website:index'))
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('website:index'))
+        self.assertContains(response, "Old Title")
@@ -0,0 +1,103 @@
+from django.core.cache import cache
+from django.test import TestCase, Client
+from django.urls import reverse
+from main.metrics import registry
+from main.models import Post
+from main.testing import QueryBudgetMixin
+
+
+class RequestMetricsMiddlewareTest(TestCase):
+    """
+    RequestMetricsMiddleware
+    - Server-Timing header
+    - /metrics မှာ URL name အလိုက် histogram
+    """
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.client = Client()
+        self.post = Post.objects.create(title="Title", content="Body")
+
+    def test_server_timing_header(self):
+        """Response မှာ db / tpl / total timing ပါရမယ်"""
+        response = self.client.get(reverse('website:get-detail', args=[self.post.pk]))
+        timing = response['Server-Timing']
+        self.assertIn('db;dur=', timing)
+        self.assertIn('desc="2 queries"', timing)  # post + related posts
+        self.assertIn('tpl;dur=', timing)
+        self.assertIn('total;dur=', timing)
+
+    async def test_server_timing_counts_queries_under_asgi(self):
+        """ASGI → ORM က sync_to_async thread ရဲ့ connection ပေါ်မှာ run လည်း ရေတွက်ရမယ်"""
+        response = await self.async_client.get(reverse('website:get-detail', args=[self.post.pk]))
+        self.assertIn('desc="2 queries"', response['Server-Timing'])
+        response = await self.async_client.get(reverse('website:index'))
+        self.assertNotIn('desc="0 queries"', response['Server-Timing'])
+
+    def test_metrics_endpoint_has_histograms_per_view(self):
+        """/metrics → Prometheus text, website:index label နဲ့ histogram"""
+        self.client.get(reverse('website:index'))
+        self.client.get(reverse('website:index'))
+        response = self.client.get(reverse('website:metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn('# TYPE django_request_queries histogram', body)
+        self.assertIn('django_request_duration_seconds_count{view="website:index"} 2', body)
+        self.assertIn('django_request_queries_bucket{view="website:index",le="+Inf"} 2', body)
+        self.assertIn('django_response_size_bytes_sum{view="website:index"}', body)
+        self.assertIn('django_request_template_seconds_count{view="website:index"} 2', body)
+
+    def test_unresolved_request_recorded(self):
+        """404 (URL မကိုက်) request လည်း မှတ်ရမယ်"""
+        self.client.get('/no/such/url/')
+        self.assertIn('view="<unresolved>"', registry.render())
+
+
+class ViewQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """
+    settings.VIEW_QUERY_BUDGETS — cold cache နဲ့ view တစ်ခုစီ budget အတွင်း ရှိရမယ်
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        for i in range(5):
+            self.post = Post.objects.create(title=f"Post {i}", content="Body")
+
+    def test_index(self):
+        with self.assertQueryBudget('website:index'):
+            self.client.get(reverse('website:index'))
+
+    def test_get_detail(self):
+        with self.assertQueryBudget('website:get-detail'):
+            self.client.get(reverse('website:get-detail', args=[self.post.pk]))
+
+    def test_search(self):
+        with self.assertQueryBudget('website:search'):
+            self.client.get(reverse('website:search'), {'q': 'Post'})
+
+    def test_popular(self):
+        with self.assertQueryBudget('website:popular'):
+            self.client.get(reverse('website:popular'))
+
+    def test_get_update_post(self):
+        with self.assertQueryBudget('website:get-update-post'):
+            self.client.get(reverse('website:get-update-post', args=[self.post.pk]))
+
+    def test_api_posts(self):
+        with self.assertQueryBudget('website:api-posts'):
+            self.client.get(reverse('website:api-posts'))
+
+    def test_api_post_detail(self):
+        with self.assertQueryBudget('website:api-post-detail'):
+            self.client.get(reverse('website:api-post-detail', args=[self.post.pk]))
+
+    def test_budget_exceeded_fails(self):
+        """Budget ကျော်ရင် AssertionError"""
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget('website:get-detail'):
+                list(Post.objects.all())
+                list(Post.objects.all())
+                list(Post.objects.all())
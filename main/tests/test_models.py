@@ -1,5 +1,7 @@
+from django.db import connection
 from django.test import TestCase
-from main.models import Post
+from django.test.utils import CaptureQueriesContext
+from main.models import Post, PostVersionConflict
 
 class PostModelTest(TestCase):
     """
@@ -32,3 +34,66 @@ class PostModelTest(TestCase):
         short_content = "တိုတို content"
         post = Post.objects.create(title="Short Post", content=short_content)
         self.assertEqual(post.get_summary(), short_content)
+
+    def test_summary_kept_in_sync_on_save(self):
+        """content ပြောင်းပြီး save() → summary column update ဖြစ်ရမယ်"""
+        post = Post.objects.create(title="Title", content="a" * 80)
+        post.content = "b" * 80
+        post.save(update_fields=['content'])
+        post.refresh_from_db()
+        self.assertEqual(post.summary, "b" * 50)
+
+    def test_bulk_create_fills_summary(self):
+        """bulk_create() လည်း summary ဖြည့်ရမယ်"""
+        Post.objects.bulk_create([Post(title="Bulk", content="z" * 70)])
+        self.assertEqual(Post.objects.get().summary, "z" * 50)
+
+    def test_listing_defers_content(self):
+        """listing() → content column ကို SQL ထဲ မထည့်ရ"""
+        Post.objects.create(title="Title", content="long body " * 500)
+        post = Post.objects.listing().get()
+        self.assertIn('content', post.get_deferred_fields())
+        self.assertNotIn('"content"', str(Post.objects.listing().query))
+        with self.assertNumQueries(0):
+            self.assertEqual(post.get_summary(), ("long body " * 5))
+
+
+class PostVersionTest(TestCase):
+    """
+    Optimistic version column — save() / bulk_update() က +1၊
+    save_changes() က ပြောင်းတဲ့ field တွေကိုပဲ WHERE version = ? နဲ့ ရေး
+    """
+
+    def setUp(self):
+        self.post = Post.objects.create(title="Title", content="long body " * 500)
+
+    def test_save_and_bulk_update_bump_version(self):
+        self.assertEqual(self.post.version, 1)
+        self.post.save()
+        self.post.title = "New"
+        Post.objects.bulk_update([self.post], ['title'])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.version, 3)
+
+    def test_save_changes_writes_only_changed_fields(self):
+        self.post.title = "New title"
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(self.post.save_changes(['title'], expected_version=1))
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "main_post"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"version" = 1', updates[0])
+        self.assertNotIn('"content" =', updates[0])
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.title, self.post.version), ("New title", 2))
+
+    def test_save_changes_without_fields_skips_write(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(self.post.save_changes([], expected_version=1))
+
+    def test_stale_version_raises_conflict(self):
+        Post.objects.filter(pk=self.post.pk).update(title="Other edit", version=2)
+        self.post.title = "Mine"
+        with self.assertRaises(PostVersionConflict):
+            self.post.save_changes(['title'], expected_version=1)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.title, self.post.version), ("Other edit", 2))
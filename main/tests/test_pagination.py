@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from main.models import Post
+from main.pagination import paginate, encode_cursor, decode_cursor, InvalidCursor
+
+
+class CursorTest(TestCase):
+    """
+    Cursor token encode/decode စမ်းသပ်
+    """
+
+    def test_round_trip(self):
+        """encode → decode → same pk"""
+        self.assertEqual(decode_cursor(encode_cursor(12345)), 12345)
+
+    def test_invalid_token_raises(self):
+        """Garbage token → InvalidCursor"""
+        for token in ["", "!!!", encode_cursor("abc"), "cGs6", encode_cursor("²"), encode_cursor("١٢")]:
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(token)
+
+
+class PaginateTest(TestCase):
+    """
+    paginate() helper အတွက် unit test
+    - next / previous cursor
+    - page boundary
+    """
+
+    def setUp(self):
+        self.posts = [Post.objects.create(title=f"Post {i}", content="c") for i in range(5)]
+
+    def test_first_page(self):
+        """ပထမ page → previous မရှိ၊ next ရှိ"""
+        page = paginate(Post.objects.all(), page_size=2)
+        self.assertEqual(page.items, self.posts[:2])
+        self.assertFalse(page.has_previous)
+        self.assertTrue(page.has_next)
+
+    def test_after_and_before(self):
+        """after → နောက် page, before → ရှေ့ page ပြန်ရ"""
+        first = paginate(Post.objects.all(), page_size=2)
+        second = paginate(Post.objects.all(), after=first.next_cursor, page_size=2)
+        self.assertEqual(second.items, self.posts[2:4])
+        back = paginate(Post.objects.all(), before=second.previous_cursor, page_size=2)
+        self.assertEqual(back.items, self.posts[:2])
+        self.assertFalse(back.has_previous)
+
+    def test_last_page(self):
+        """နောက်ဆုံး page → next မရှိ"""
+        page = paginate(Post.objects.all(), after=encode_cursor(self.posts[3].pk), page_size=2)
+        self.assertEqual(page.items, self.posts[4:])
+        self.assertFalse(page.has_next)
+        self.assertTrue(page.has_previous)
+
+    @override_settings(POSTS_MAX_PAGE_SIZE=3)
+    def test_page_size_is_clamped(self):
+        """page_size > POSTS_MAX_PAGE_SIZE → clamp"""
+        page = paginate(Post.objects.all(), page_size="100")
+        self.assertEqual(len(page.items), 3)
+
+
+class IndexQueryCostTest(TestCase):
+    """
+    Index view query cost က page number နဲ့ မသက်ဆိုင်ရ
+    - page 1 နဲ့ page 10,000 query အရေအတွက် တူရမယ်
+    - OFFSET / COUNT(*) မပါရ
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Post.objects.bulk_create(Post(title=f"P{i}", content="x") for i in range(10_001))
+        cls.pks = list(Post.objects.order_by("pk").values_list("pk", flat=True))
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.url = reverse("website:index")
+
+    def _capture(self, params):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, ctx.captured_queries
+
+    def test_constant_query_cost(self):
+        """page 1 vs page 10,000 → query count တူ၊ OFFSET/COUNT မရှိ"""
+        _, first_queries = self._capture({"page_size": 1})
+        response, deep_queries = self._capture(
+            {"page_size": 1, "after": encode_cursor(self.pks[9_998])}
+        )
+
+        self.assertEqual(list(response.context["items"]), [Post.objects.get(pk=self.pks[9_999])])
+        self.assertEqual(len(first_queries), len(deep_queries))
+        for query in first_queries + deep_queries:
+            sql = query["sql"].upper()
+            self.assertNotIn("OFFSET", sql)
+            self.assertNotIn("COUNT(", sql)
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        """Invalid cursor → ပထမ page"""
+        response, _ = self._capture({"page_size": 1, "after": "not-a-cursor"})
+        self.assertEqual(response.context["items"][0].pk, self.pks[0])
@@ -0,0 +1,125 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from main import related, tasks
+from main.models import Job, Post, PostTerm, RelatedPost, RelatedTerm
+
+TOPICS = {
+    "django": "django views templates orm queryset migrations",
+    "sqlite": "sqlite index wal journal vacuum pragma",
+    "garden": "garden tomato soil compost seeds watering",
+}
+
+
+def related_ids(post):
+    return list(RelatedPost.objects.filter(post=post).order_by('-score', '-related').values_list('related_id', flat=True))
+
+
+@override_settings(RELATED_POSTS_LIMIT=2, RELATED_MAX_DF=0.9)
+class RelatedPostsTest(TestCase):
+    """TF-IDF vector → top-k neighbour, rebuild + incremental update"""
+
+    def setUp(self):
+        cache.clear()
+        self.posts = {}
+        for topic, words in TOPICS.items():
+            for i in range(3):
+                self.posts[topic, i] = Post.objects.create(title=f"{topic} notes {i}", content=f"{words} only{topic}{i}")
+        Job.objects.all().delete()
+        for _ in related.rebuild(chunk_size=4):
+            pass
+
+    def test_tokenize(self):
+        self.assertEqual(related.tokenize("The Django ORM, and 2024 x မြန်မာစာ"), ["django", "orm", "မြန်မာစာ"])
+
+    def test_rebuild_groups_topics(self):
+        self.assertEqual(RelatedTerm.objects.filter(term="onlydjango0").count(), 0)  # df = 1
+        self.assertTrue(RelatedTerm.objects.filter(term="django").exists())
+        for (topic, i), post in self.posts.items():
+            expected = {self.posts[topic, j].pk for j in range(3) if j != i}
+            self.assertEqual(set(related_ids(post)), expected)
+
+    def test_create_and_edit_update_incrementally(self):
+        post = Post.objects.create(title="sqlite tuning", content="sqlite wal pragma vacuum index journal")
+        tasks.run_pending()
+        sqlite_pks = {self.posts["sqlite", i].pk for i in range(3)}
+        self.assertLessEqual(set(related_ids(post)), sqlite_pks)
+        self.assertEqual(len(related_ids(post)), 2)
+        joined = [pk for pk in sqlite_pks if post.pk in related_ids(pk)]
+        self.assertTrue(joined)
+        self.assertTrue(all(len(related_ids(pk)) == 2 for pk in sqlite_pks))
+
+        post.title = "garden tuning"
+        post.content = "garden tomato soil compost seeds watering"
+        post.save()
+        tasks.run_pending()
+        self.assertLessEqual(set(related_ids(post)), {self.posts["garden", i].pk for i in range(3)})
+        # sqlite list တွေက post ကို ဖယ်ပြီး sqlite post နှစ်ခုနဲ့ ပြန်ပြည့်
+        for pk in sqlite_pks:
+            self.assertEqual(set(related_ids(pk)), sqlite_pks - {pk})
+
+    def test_deleted_post_is_skipped(self):
+        post = self.posts["django", 0]
+        post.delete()
+        self.assertEqual(related.update_posts([post.pk]), 0)
+        self.assertFalse(PostTerm.objects.filter(post_id=post.pk).exists())
+
+    def test_detail_lists_related_posts(self):
+        post = self.posts["garden", 0]
+        response = self.client.get(reverse('website:get-detail', args=[post.pk]))
+        self.assertEqual([r.related_id for r in response.context['item'].related_list], related_ids(post))
+        self.assertContains(response, "garden notes 1</a>")
+        self.assertNotContains(response, "django notes")
+
+    def test_lookup_uses_index(self):
+        queryset = RelatedPost.objects.filter(post_id=self.posts["django", 0].pk).order_by('-score', '-related')
+        with connection.cursor() as cursor:
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        self.assertIn("main_relatedpost_lookup_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_incremental_update_invalidates_neighbour_fragments(self):
+        neighbour = self.posts["sqlite", 0]
+        url = reverse('website:get-detail', args=[neighbour.pk])
+        self.client.get(url)
+        post = Post.objects.create(title="sqlite again", content="sqlite wal pragma vacuum index journal")
+        tasks.run_pending()
+        self.assertIn(post.pk, related_ids(neighbour))
+        self.assertContains(self.client.get(url), "sqlite again</a>")
+
+    def test_delete_invalidates_linking_fragments(self):
+        """Delete → related list ထဲမှာ ပါခဲ့တဲ့ post တွေရဲ့ cached fragment မှာ dead link မကျန်"""
+        neighbour = self.posts["garden", 0]
+        url = reverse('website:get-detail', args=[neighbour.pk])
+        self.assertContains(self.client.get(url), "garden notes 1</a>")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts["garden", 1].delete()
+        self.assertNotContains(self.client.get(url), "garden notes 1</a>")
+
+    def test_related_list_change_changes_etag(self):
+        """Neighbour edit → updated_at မပြောင်းပေမယ့် ETag အဟောင်းနဲ့ 304 မပြန်ရ"""
+        neighbour = self.posts["sqlite", 0]
+        url = reverse('website:get-detail', args=[neighbour.pk])
+        etag = self.client.get(url)['ETag']
+        Post.objects.create(title="sqlite again", content="sqlite wal pragma vacuum index journal")
+        tasks.run_pending()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "sqlite again</a>")
+
+
+class RebuildRelatedPostsCommandTest(TestCase):
+
+    @override_settings(RELATED_MAX_DF=1.0)
+    def test_command(self):
+        Post.objects.bulk_create(Post(title=f"Post {i}", content="shared words here") for i in range(4))
+        out = StringIO()
+        call_command("rebuild_related_posts", "--chunk-size", "3", stdout=out)
+        self.assertIn("Related posts rebuilt: 4 posts", out.getvalue())
+        self.assertEqual(RelatedPost.objects.count(), 4 * 3)
@@ -0,0 +1,120 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from main import rendering
+from main.models import Post
+
+
+class RenderTest(TestCase):
+    """Markdown subset → sanitized HTML"""
+
+    def test_blocks(self):
+        html = rendering.render("# Title\n\npara *one*\nline two\n\n- a\n- b\n\n1. x\n\n> quoted\n\n---")
+        self.assertEqual(html, (
+            "<h1>Title</h1>\n<p>para <em>one</em>\nline two</p>\n<ul><li>a</li><li>b</li></ul>\n"
+            "<ol><li>x</li></ol>\n<blockquote><p>quoted</p></blockquote>\n<hr>"
+        ))
+
+    def test_inline(self):
+        html = rendering.render("**bold** `a<b` snake_case_name [site](https://example.com/?a=1&b=2)")
+        self.assertEqual(html, (
+            '<p><strong>bold</strong> <code>a&lt;b</code> snake_case_name '
+            '<a href="https://example.com/?a=1&amp;b=2" rel="nofollow noopener">site</a></p>'
+        ))
+
+    def test_code_block_is_not_formatted(self):
+        self.assertEqual(rendering.render("```\n**x** <i>\n```"), "<pre><code>**x** &lt;i&gt;</code></pre>")
+
+    def test_raw_html_and_unsafe_links_are_escaped(self):
+        html = rendering.render('<script>alert(1)</script> [x](javascript:alert(1)) [y](Java\tScript:z) "q"')
+        self.assertNotIn("<script", html)
+        self.assertNotIn("<a ", html)
+        self.assertIn("&lt;script&gt;", html)
+        self.assertIn("&quot;q&quot;", html)
+
+
+class PostRenderTest(TestCase):
+    """save() / bulk path မှာ content_html render — content_hash မပြောင်းရင် မ render"""
+
+    def test_rendered_on_save(self):
+        post = Post.objects.create(title="T", content="*hi*")
+        post.refresh_from_db()
+        self.assertEqual(post.content_html, "<p><em>hi</em></p>")
+        self.assertEqual(post.content_hash, rendering.content_hash("*hi*"))
+        self.assertEqual(post.render_version, rendering.RENDERER_VERSION)
+
+    def test_unchanged_content_is_not_rerendered(self):
+        post = Post.objects.create(title="T", content="*hi*")
+        post = Post.objects.get(pk=post.pk)
+        post.title = "New"
+        post.content = "*hi*"
+        with mock.patch.object(rendering, "render", wraps=rendering.render) as render:
+            post.save()
+            render.assert_not_called()
+            post.content = "**bye**"
+            post.save()
+            render.assert_called_once_with("**bye**")
+
+    def test_bulk_paths(self):
+        post, = Post.objects.bulk_create([Post(title="T", content="*a*")])
+        self.assertEqual(Post.objects.get(pk=post.pk).content_html, "<p><em>a</em></p>")
+        post.content = "*b*"
+        Post.objects.bulk_update([post], ["content"])
+        self.assertEqual(Post.objects.get(pk=post.pk).content_html, "<p><em>b</em></p>")
+
+
+class DetailRenderTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_detail_uses_stored_html_only(self):
+        post = Post.objects.create(title="T", content="**rich** <b>raw</b>")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('website:get-detail', args=[post.pk]))
+        self.assertContains(response, "<strong>rich</strong> &lt;b&gt;raw&lt;/b&gt;", html=False)
+        self.assertEqual(len(ctx.captured_queries), 2)  # post + related posts
+        self.assertNotIn('"main_post"."content",', ctx.captured_queries[0]['sql'])
+
+    def test_unrendered_post_falls_back_to_escaped_content(self):
+        post = Post.objects.create(title="T", content="**rich** <b>raw</b>")
+        Post.objects.filter(pk=post.pk).update(render_version=0, content_html="")
+        response = self.client.get(reverse('website:get-detail', args=[post.pk]))
+        self.assertContains(response, "<p>**rich** &lt;b&gt;raw&lt;/b&gt;</p>", html=False)
+
+
+class RenderPostsCommandTest(TestCase):
+    """render_posts → RENDERER_VERSION မကိုက်တဲ့ rows ကို process pool နဲ့ ပြန် render"""
+
+    def setUp(self):
+        self.posts = Post.objects.bulk_create(Post(title=f"P{i}", content=f"*{i}*") for i in range(5))
+        Post.objects.filter(pk__in=[p.pk for p in self.posts[:3]]).update(render_version=0, content_html="")
+
+    def test_renders_stale_posts_in_pool(self):
+        out = StringIO()
+        call_command("render_posts", "--processes", "2", "--chunk-size", "2", stdout=out)
+        self.assertIn("Rendered 3 posts", out.getvalue())
+        self.assertEqual(
+            list(Post.objects.order_by("pk").values_list("content_html", "render_version")),
+            [(f"<p><em>{i}</em></p>", rendering.RENDERER_VERSION) for i in range(5)],
+        )
+
+    def test_all_and_concurrent_edit(self):
+        edited = self.posts[0]
+
+        def render_row(row):
+            # render နေတုန်း post ကို တခြား request က ပြင်သွား → version မကိုက်လို့ မရေး
+            if row[0] == edited.pk:
+                Post.objects.filter(pk=edited.pk).update(version=99)
+            return row[0], rendering.content_hash(row[1]), "<p>stale</p>"
+
+        with mock.patch.object(rendering, "render_row", render_row):
+            self.assertEqual(list(rendering.rerender_posts(chunk_size=10, processes=1, force=True)), [5])
+        self.assertEqual(Post.objects.get(pk=edited.pk).content_html, "")
+        self.assertEqual(Post.objects.get(pk=self.posts[4].pk).content_html, "<p>stale</p>")
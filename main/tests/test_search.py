@@ -0,0 +1,99 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client
+from django.urls import reverse
+from main import search
+from main.models import Post
+
+
+class SearchIndexTest(TestCase):
+    """
+    FTS5 index sync + ranking စမ်းသပ်
+    - insert / update / delete trigger
+    - bm25 ranking, snippet highlight + escape
+    """
+
+    def setUp(self):
+        self.title_hit = Post.objects.create(title="Django tuning", content="notes about databases")
+        self.body_hit = Post.objects.create(title="Other", content="we love django and <b>html</b>")
+        Post.objects.create(title="Unrelated", content="nothing here")
+
+    def test_ranked_results(self):
+        """Title match က content-only match ထက် ရှေ့မှာ ရှိရမယ်"""
+        results = search.search("django")
+        self.assertEqual([r.pk for r in results], [self.title_hit.pk, self.body_hit.pk])
+
+    def test_snippet_is_highlighted_and_escaped(self):
+        """Snippet မှာ <mark> ပါ၊ content ထဲက HTML ကို escape"""
+        result = search.search("love")[0]
+        self.assertIn("<mark>love</mark>", result.snippet)
+        self.assertIn("&lt;b&gt;", result.snippet)
+
+    def test_update_and_delete_keep_index_in_sync(self):
+        """Update / delete → index update ဖြစ်ရမယ်"""
+        self.body_hit.content = "now about flask"
+        self.body_hit.save()
+        self.assertEqual([r.pk for r in search.search("django")], [self.title_hit.pk])
+        self.assertEqual([r.pk for r in search.search("flask")], [self.body_hit.pk])
+        self.title_hit.delete()
+        self.assertEqual(search.search("django"), [])
+
+    def test_bulk_create_is_indexed(self):
+        """bulk_create() လည်း trigger ကြောင့် index ဝင်ရမယ်"""
+        Post.objects.bulk_create([Post(title="Bulk", content="zebra")])
+        self.assertEqual(len(search.search("zebra")), 1)
+
+    def test_fts_syntax_is_not_injected(self):
+        """FTS operator / quote တွေပါတဲ့ input → error မတက်ရ"""
+        self.assertEqual(search.search('NEAR( "django OR title:*'), [])
+        self.assertEqual(search.search("   "), [])
+
+    def test_control_characters_are_stripped(self):
+        """NUL / control char ပါတဲ့ input → 500 မဖြစ်ရ"""
+        self.assertIsNone(search.build_match_query("\x00\x1f"))
+        self.assertEqual(search.build_match_query("dja\x00ngo"), '"dja" "ngo"')
+        self.assertEqual(search.search("\x00"), [])
+        self.assertEqual(len(search.filter_queryset(Post.objects.all(), "django\x00")), 2)
+        self.assertEqual(self.client.get(reverse("website:search"), {"q": "\x00"}).status_code, 200)
+
+    def test_myanmar_text(self):
+        """မြန်မာစာ ရှာလို့ရရမယ်"""
+        post = Post.objects.create(title="ခေါင်းစဉ်", content="အကြောင်းအရာ")
+        self.assertEqual([r.pk for r in search.search("ခေါင်းစဉ်")], [post.pk])
+
+
+class RebuildSearchIndexCommandTest(TestCase):
+    """rebuild_search_index command → batch အလိုက် index ပြန်ဆောက်"""
+
+    def test_rebuild_restores_index(self):
+        Post.objects.bulk_create(Post(title=f"Post {i}", content="rebuild me") for i in range(7))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.FTS_TABLE}")
+        self.assertEqual(search.search("rebuild"), [])
+
+        out = StringIO()
+        call_command("rebuild_search_index", "--batch-size", "3", stdout=out)
+        self.assertIn("7 posts", out.getvalue())
+        self.assertEqual(len(search.search("rebuild")), 7)
+
+
+class SearchViewTest(TestCase):
+    """search view → template, results"""
+
+    def setUp(self):
+        self.client = Client()
+        self.post = Post.objects.create(title="Searchable", content="body text")
+
+    def test_search_results(self):
+        """?q= → 200 + result ပါ"""
+        response = self.client.get(reverse('website:search'), {'q': 'searchable'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'search.html')
+        self.assertEqual([r.pk for r in response.context['results']], [self.post.pk])
+
+    def test_empty_query(self):
+        """q မပါ → result မရှိ"""
+        response = self.client.get(reverse('website:search'))
+        self.assertEqual(response.context['results'], [])
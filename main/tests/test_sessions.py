@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from main.models import Post
+
+
+class SessionProfileTest(TestCase):
+    """
+    SESSION_PROFILES → profile တိုင်းမှာ login / messages အလုပ်လုပ်ရမယ်
+    db မဟုတ်တဲ့ profile တွေမှာ django_session table ကို မထိ
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("reader", password="pw")
+        self.post = Post.objects.create(title="Title", content="Body")
+
+    def run_flow(self, profile):
+        engine, storage = settings.SESSION_PROFILES[profile]
+        with override_settings(SESSION_ENGINE=engine, MESSAGE_STORAGE=storage):
+            # SessionMiddleware က engine ကို load_middleware မှာ ဖတ်လို့ profile တစ်ခုစီ Client အသစ်
+            self.client = self.client_class()
+            self.client.force_login(self.user)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse('website:get-detail', args=[999]))
+                self.assertIn("Id not found", [str(m) for m in get_messages(response.wsgi_request)])
+                response = self.client.post(
+                    reverse('website:post-update-post', args=[self.post.pk]),
+                    {'title': 'New', 'content': 'Body'},
+                )
+                self.assertIn("Update successfully", [str(m) for m in get_messages(response.wsgi_request)])
+                self.assertTrue(response.wsgi_request.user.is_authenticated)
+                self.client.get(reverse('website:index'))
+        return [query['sql'] for query in ctx.captured_queries if 'django_session' in query['sql']]
+
+    def test_db_profile_reads_session_table(self):
+        session_queries = self.run_flow('db')
+        self.assertTrue(session_queries)
+        # session data မပြောင်းလို့ write မရှိ
+        self.assertTrue(all(sql.startswith('SELECT') for sql in session_queries))
+
+    def test_other_profiles_skip_session_table(self):
+        for profile in ('cached_db', 'cache', 'signed_cookies'):
+            with self.subTest(profile=profile):
+                self.assertEqual(self.run_flow(profile), [])
@@ -0,0 +1,94 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from asgiref.testing import ApplicationCommunicator
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.test import SimpleTestCase, RequestFactory, override_settings
+from main.static import StaticFilesASGIHandler, StaticFilesWSGIHandler
+
+MANIFEST_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+
+
+class StaticPipelineTest(SimpleTestCase):
+    """
+    collectstatic (production storage)
+    - content-hashed filename + manifest
+    - .gz / .br variants
+    - WhiteNoise က middleware chain / view layer မရောက်ဘဲ immutable Cache-Control နဲ့ serve (WSGI / ASGI)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls.static_root)
+        cls.settings = override_settings(
+            DEBUG=False, STATIC_ROOT=cls.static_root, STORAGES=MANIFEST_STORAGES,
+            WHITENOISE_USE_FINDERS=False, WHITENOISE_AUTOREFRESH=False,
+        )
+        cls.settings.enable()
+        cls.addClassCleanup(cls.settings.disable)
+        call_command("collectstatic", interactive=False, verbosity=0, ignore_patterns=["admin"])
+        manifest = json.loads((cls.static_root / "staticfiles.json").read_text())
+        cls.hashed = manifest["paths"]["main/css/site.css"]
+
+    def test_hashed_name_and_compressed_variants(self):
+        """site.css → site.<hash>.css + .gz + .br"""
+        self.assertRegex(self.hashed, r"^main/css/site\.[0-9a-f]{12}\.css$")
+        for suffix in ("", ".gz", ".br"):
+            self.assertTrue((self.static_root / (self.hashed + suffix)).exists(), suffix)
+
+    def test_served_without_reaching_views(self):
+        """Hashed URL → WhiteNoise response (immutable)၊ wrap ထားတဲ့ application ကို မခေါ်"""
+        calls = []
+        handler = StaticFilesWSGIHandler(lambda environ, start_response: calls.append(environ))
+        request = RequestFactory().get(f"/static/{self.hashed}", HTTP_ACCEPT_ENCODING="br, gzip")
+        response = handler.get_response(request)
+        self.assertEqual(calls, [])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(response["Content-Encoding"], "br")
+        response.close()
+        self.assertEqual(handler.get_response(RequestFactory().get("/static/missing.css")).status_code, 404)
+
+    async def test_asgi_serves_static_and_passes_other_requests(self):
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["path"])
+
+        handler = StaticFilesASGIHandler(app)
+        scope = {
+            "type": "http", "method": "GET", "path": f"/static/{self.hashed}", "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        communicator = ApplicationCommunicator(handler, scope)
+        await communicator.send_input({"type": "http.request", "body": b""})
+        start = await communicator.receive_output()
+        self.assertEqual(start["status"], 200)
+        self.assertIn((b"Content-Encoding", b"gzip"), start["headers"])
+        await communicator.wait()
+        await handler({**scope, "path": "/"}, None, None)
+        self.assertEqual(calls, ["/"])
+
+
+class AsgiMiddlewareChainTest(SimpleTestCase):
+    """ASGI handler → middleware chain တစ်ခုလုံး async (sync-only middleware မပါ)"""
+
+    def test_asgi_application_wraps_static_files(self):
+        from cicd_test.asgi import application
+
+        self.assertIsInstance(application, StaticFilesASGIHandler)
+        self.assertIsInstance(application.application, ASGIHandler)
+
+    @override_settings(DEBUG=True)
+    def test_middleware_chain_is_not_adapted(self):
+        # BaseHandler.adapt_method_mode က DEBUG မှာ adapt လုပ်တိုင်း django.request ကို log
+        with self.assertNoLogs("django.request", "DEBUG"):
+            ASGIHandler()
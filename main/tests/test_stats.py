@@ -0,0 +1,119 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from main import stats
+from main.models import Post, PostStats, PostDailyStats
+
+
+def content_bytes():
+    return sum(len(content.encode()) for content in Post.objects.values_list('content', flat=True))
+
+
+class PostStatsTriggerTest(TestCase):
+    """
+    main_post trigger → PostStats / PostDailyStats sync
+    - create / bulk_create / update / delete / queryset.delete
+    """
+
+    def assertStatsMatch(self):
+        totals = stats.get_totals()
+        self.assertEqual(totals.posts, Post.objects.count())
+        self.assertEqual(totals.content_bytes, content_bytes())
+
+    def test_create_and_bulk_create(self):
+        Post.objects.create(title="A", content="abc")
+        Post.objects.bulk_create([Post(title=f"B{i}", content="မြန်မာ") for i in range(3)])
+        self.assertEqual(stats.get_totals(), stats.Totals(4, 3 + 3 * len("မြန်မာ".encode())))
+        today = timezone.now().date()
+        self.assertEqual(PostDailyStats.objects.get(day=today).created_count, 4)
+
+    def test_update_changes_bytes(self):
+        post = Post.objects.create(title="A", content="abc")
+        post.content = "abcdef"
+        post.save()
+        Post.objects.filter(pk=post.pk).update(content="x")
+        self.assertStatsMatch()
+
+    @override_settings(TEXT_COMPRESS_MIN_BYTES=1024)
+    def test_compressed_content_counts_text_bytes(self):
+        """ချုံ့ထားတဲ့ BLOB size မဟုတ်ဘဲ မူလ UTF-8 size"""
+        post = Post.objects.create(title="Big", content="ချုံ့နိုင်တဲ့ စာ " * 200)
+        Post.objects.create(title="Small", content="abc")
+        self.assertStatsMatch()
+        self.assertEqual(stats.get_totals().content_bytes, len(post.content.encode()) + 3)
+        post.content = "other words " * 300
+        post.save()
+        Post.objects.filter(pk=post.pk).update(content="again " * 400)
+        self.assertStatsMatch()
+        PostStats.objects.update(total_content_bytes=1)
+        call_command('reconcile_post_stats', stdout=StringIO())
+        self.assertStatsMatch()
+
+    def test_delete(self):
+        posts = [Post.objects.create(title=f"P{i}", content="body") for i in range(3)]
+        posts[0].delete()
+        Post.objects.filter(pk=posts[1].pk).delete()
+        self.assertStatsMatch()
+        Post.objects.all().delete()
+        self.assertEqual(stats.get_totals(), stats.Totals(0, 0))
+        self.assertFalse(PostDailyStats.objects.exists())
+
+    def test_created_at_change_moves_day(self):
+        post = Post.objects.create(title="A", content="abc")
+        yesterday = timezone.now() - datetime.timedelta(days=1)
+        Post.objects.filter(pk=post.pk).update(created_at=yesterday)
+        self.assertEqual(
+            dict(PostDailyStats.objects.values_list('day', 'created_count')),
+            {yesterday.date(): 1},
+        )
+
+
+class ReconcilePostStatsTest(TestCase):
+    """reconcile_post_stats command → drift ပြင်"""
+
+    def test_reconcile_fixes_drift(self):
+        for i in range(7):
+            Post.objects.create(title=f"P{i}", content="body" * i)
+        PostStats.objects.update(total_posts=999, total_content_bytes=1)
+        PostDailyStats.objects.all().delete()
+        out = StringIO()
+        call_command('reconcile_post_stats', chunk_size=3, stdout=out)
+        self.assertIn("7 posts", out.getvalue())
+        self.assertEqual(stats.get_totals(), stats.Totals(7, content_bytes()))
+        self.assertEqual(PostDailyStats.objects.get().created_count, 7)
+
+    def test_reconcile_empty_table(self):
+        PostStats.objects.all().delete()
+        call_command('reconcile_post_stats', stdout=StringIO())
+        self.assertEqual(stats.get_totals(), stats.Totals(0, 0))
+
+
+class StatsDisplayTest(TestCase):
+    """Index header နဲ့ admin changelist က COUNT(*) မလုပ်ဘဲ stats table ကနေ ဖတ်"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        for i in range(3):
+            Post.objects.create(title=f"P{i}", content="body")
+
+    def test_index_header_count(self):
+        with self.assertNumQueries(4) as ctx:
+            response = self.client.get(reverse('website:index'))
+        self.assertContains(response, "<h1>Items (3)</h1>", html=True)
+        for query in ctx.captured_queries:
+            self.assertNotIn("COUNT(", query['sql'].upper())
+
+    def test_admin_changelist_dashboard(self):
+        User.objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.login(username="admin", password="password")
+        response = self.client.get(reverse('admin:main_post_changelist'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['post_totals'].posts, 3)
+        self.assertContains(response, 'id="post-stats"')
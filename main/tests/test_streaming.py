@@ -0,0 +1,126 @@
+import gzip
+from unittest import skipIf
+
+from django.core.cache import cache
+from django.test import TestCase, Client, override_settings
+from django.urls import include, path, reverse
+from main import async_views, compression
+from main.models import Post
+from main.urls import post_urlpatterns
+
+urlpatterns = [path('', include((post_urlpatterns(async_views), 'website')))]
+
+
+@override_settings(POSTS_STREAM_CHUNK_SIZE=2)
+class IndexStreamTest(TestCase):
+    """
+    index_stream → StreamingHttpResponse
+    - row အားလုံး pk order နဲ့ ပါ
+    - chunk size အလိုက် ခွဲပို့
+    - ETag ကိုက်ရင် 304
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.posts = [Post.objects.create(title=f"Post {i}", content="Body") for i in range(5)]
+        self.url = reverse('website:index-stream')
+
+    def test_streams_all_rows_in_chunks(self):
+        """5 rows, chunk 2 → head + 3 row chunks + tail"""
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 5)
+        body = b"".join(chunks).decode()
+        positions = [body.index(f"Post {i} -") for i in range(5)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertTrue(body.rstrip().endswith("</html>"))
+
+    def test_empty_table(self):
+        Post.objects.all().delete()
+        body = b"".join(self.client.get(self.url).streaming_content).decode()
+        self.assertIn("No items found", body)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(ROOT_URLCONF=__name__, POSTS_STREAM_CHUNK_SIZE=2)
+class AsyncIndexStreamTest(TestCase):
+    """async_views.index_stream → async iterator နဲ့ stream"""
+
+    def setUp(self):
+        cache.clear()
+        for i in range(3):
+            Post.objects.create(title=f"Async {i}", content="Body")
+
+    async def test_streams_all_rows(self):
+        response = await self.async_client.get(reverse('website:index-stream'))
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode()
+        for i in range(3):
+            self.assertIn(f"Async {i} -", body)
+
+
+class CompressionMiddlewareTest(TestCase):
+    """
+    CompressionMiddleware
+    - Accept-Encoding အလိုက် br / gzip / မ compress
+    - Streaming body ကို gzip stream အဖြစ် decode လုပ်လို့ရ
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        for i in range(20):
+            Post.objects.create(title=f"Post {i}", content="Body " * 20)
+
+    def test_gzip_regular_response(self):
+        response = self.client.get(reverse('website:index'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertTrue(response['ETag'].startswith('W/'))
+        self.assertIn(b"Post 19 -", gzip.decompress(response.content))
+
+    @override_settings(POSTS_STREAM_CHUNK_SIZE=5)
+    def test_gzip_streaming_response(self):
+        response = self.client.get(reverse('website:index-stream'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertFalse(response.has_header('Content-Length'))
+        body = gzip.decompress(b"".join(response.streaming_content))
+        self.assertIn(b"Post 0 -", body)
+        self.assertIn(b"Post 19 -", body)
+
+    def test_no_accept_encoding(self):
+        response = self.client.get(reverse('website:index'))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_q_zero_is_refused(self):
+        response = self.client.get(reverse('website:index'), HTTP_ACCEPT_ENCODING='gzip;q=0, br;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_accepted_encodings(self):
+        self.assertEqual(compression.accepted_encodings("gzip, br;q=0.5, identity;q=0"), {"gzip", "br"})
+
+    @skipIf(compression.brotli is None, "brotli not installed")
+    def test_brotli_preferred(self):
+        response = self.client.get(reverse('website:index-stream'), HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        body = compression.brotli.decompress(b"".join(response.streaming_content))
+        self.assertIn(b"Post 19 -", body)
+
+    @skipIf(compression.brotli is None, "brotli not installed")
+    def test_csrf_token_responses_use_gzip_only(self):
+        """CSRF token ပါတဲ့ form → BREACH padding ရှိတဲ့ gzip ပဲ (br ကို မသုံး)"""
+        post = Post.objects.first()
+        for url in (reverse('website:get-create-post'), reverse('website:get-update-post', args=[post.pk])):
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            self.assertIn(b"csrfmiddlewaretoken", gzip.decompress(response.content))
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING='br')
+            self.assertFalse(response.has_header('Content-Encoding'))
+        response = self.client.get(reverse('website:index'), HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
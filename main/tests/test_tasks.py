@@ -0,0 +1,178 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from main import db_router, tasks
+from main.models import Job, Post
+
+calls = []
+
+
+@tasks.task("tests.record", batch_size=2, max_attempts=3)
+def record(payloads):
+    calls.append([payload["n"] for payload in payloads])
+
+
+@tasks.task("tests.pinned")
+def pinned(payloads):
+    calls.append(db_router.is_pinned())
+
+
+@tasks.task("tests.fail", max_attempts=2)
+def fail(payloads):
+    raise RuntimeError("boom")
+
+
+class EnqueueTest(TestCase):
+    """Post save / bulk_create → slug / related job, idempotency key နဲ့ coalesce"""
+
+    def test_create_enqueues_slug_job(self):
+        post = Post.objects.create(title="Hello World", content="body")
+        job = Job.objects.get(name="posts.slug")
+        self.assertEqual((job.name, job.payload, job.idempotency_key), ("posts.slug", {"pk": post.pk}, f"posts.slug:{post.pk}"))
+        job = Job.objects.get(name="posts.related")
+        self.assertEqual((job.payload, job.idempotency_key), ({"pk": post.pk}, f"posts.related:{post.pk}"))
+
+    def test_same_key_coalesces(self):
+        post = Post.objects.create(title="A", content="body")
+        post.title = "B"
+        post.save()
+        Post.objects.bulk_update([post], ["title"])
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_update_fields_without_title_skips(self):
+        post = Post.objects.create(title="A", content="body")
+        Job.objects.all().delete()
+        post.content = "changed"
+        post.save(update_fields=["content", "summary", "updated_at"])
+        self.assertEqual(list(Job.objects.values_list("name", flat=True)), ["posts.related"])
+        Job.objects.all().delete()
+        post.save(update_fields=["slug"])
+        self.assertFalse(Job.objects.exists())
+
+    def test_bulk_create_enqueues_each(self):
+        Post.objects.bulk_create([Post(title=f"P{i}", content="body") for i in range(5)])
+        self.assertEqual(Job.objects.filter(name="posts.slug").count(), 5)
+
+    def test_rollback_discards_job(self):
+        try:
+            with transaction.atomic():
+                Post.objects.create(title="A", content="body")
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        self.assertFalse(Job.objects.exists())
+
+
+class WorkerTest(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_slug_batch_single_update(self):
+        posts = [Post.objects.create(title=f"Hello World {i}", content="body") for i in range(3)]
+        updated_at = {post.pk: post.updated_at for post in posts}
+        with self.assertNumQueries(2):  # SELECT posts, CASE UPDATE
+            tasks.generate_post_slugs([{"pk": post.pk} for post in posts])
+        for post in Post.objects.filter(pk__in=updated_at):
+            self.assertEqual(post.slug, f"hello-world-{post.title[-1]}-{post.pk}")
+            self.assertEqual(post.updated_at, updated_at[post.pk])
+
+    def test_run_pending_fills_slugs_and_deletes_jobs(self):
+        post = Post.objects.create(title="မြန်မာ Post!", content="body")
+        self.assertEqual(tasks.run_pending(), 2)  # slug + related
+        post.refresh_from_db()
+        self.assertEqual(post.slug, f"post-{post.pk}")
+        self.assertFalse(Job.objects.exists())
+
+    def test_claims_by_batch_size(self):
+        record.enqueue_many([({"n": n}, None) for n in range(5)])
+        self.assertEqual(tasks.run_pending(), 5)
+        self.assertEqual(calls, [[0, 1], [2, 3], [4]])
+
+    def test_limit_and_names(self):
+        record.enqueue_many([({"n": n}, None) for n in range(5)])
+        fail.enqueue({})
+        self.assertEqual(tasks.run_pending(limit=1, names=["tests.record"]), 2)
+        self.assertEqual(Job.objects.filter(name="tests.fail", attempts=0).count(), 1)
+
+    def test_not_due_is_skipped(self):
+        record.enqueue({"n": 1}, delay=60)
+        self.assertEqual(tasks.run_pending(), 0)
+
+    def test_retry_with_backoff_then_failed(self):
+        fail.enqueue({}, key="k")
+        before = timezone.now()
+        tasks.run_pending()
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), (Job.PENDING, 1))
+        self.assertGreaterEqual(job.run_at, before + timedelta(seconds=tasks.backoff(1)))
+        self.assertIn("RuntimeError: boom", job.last_error)
+
+        Job.objects.update(run_at=before)
+        tasks.run_pending()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.locked_by), (Job.FAILED, 2, ""))
+        # failed job က key ကို မပိတ် — အသစ် enqueue ရ
+        fail.enqueue({}, key="k")
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 1)
+
+    @override_settings(TASK_RETRY_BACKOFF=2, TASK_MAX_BACKOFF=10)
+    def test_backoff_is_capped(self):
+        self.assertEqual([tasks.backoff(n) for n in range(1, 5)], [2, 4, 8, 10])
+
+    def test_unknown_task_marked_failed(self):
+        tasks.enqueue("tests.missing", {})
+        tasks.run_pending()
+        job = Job.objects.get()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIn("tests.missing", job.last_error)
+
+    def test_stale_running_job_reclaimed(self):
+        record.enqueue({"n": 1}, key="r")
+        Job.objects.update(
+            status=Job.RUNNING, locked_by="dead", locked_at=timezone.now() - timedelta(hours=1),
+        )
+        self.assertEqual(tasks.run_pending(), 1)
+        self.assertEqual(calls, [[1]])
+
+    def test_stale_job_coalesces_with_newer_pending(self):
+        record.enqueue({"n": 1}, key="r")
+        Job.objects.update(status=Job.RUNNING, locked_at=timezone.now() - timedelta(hours=1))
+        record.enqueue({"n": 2}, key="r")
+        self.assertEqual(tasks.reclaim_stale(), 1)
+        self.assertEqual(list(Job.objects.values_list("payload", flat=True)), [{"n": 2}])
+
+
+    def test_queue_reads_use_primary(self):
+        """Replica ရှိလည်း claim / re-read / handler read တွေ primary (replica alias ကို မထိ)"""
+        post = Post.objects.create(title="Primary Title", content="body")
+        pinned.enqueue({})
+        with override_settings(DATABASE_REPLICAS={"missing-replica": 1}):
+            self.assertEqual(tasks.run_pending(), 3)  # slug + related + pinned
+        self.assertEqual(calls, [True])
+        post.refresh_from_db()
+        self.assertEqual(post.slug, f"primary-title-{post.pk}")
+        self.assertFalse(Job.objects.exists())
+
+
+class RunWorkerCommandTest(TransactionTestCase):
+
+    def test_once_drains_queue(self):
+        posts = Post.objects.bulk_create([Post(title=f"Post {i}", content="body") for i in range(3)])
+        out = StringIO()
+        call_command("run_worker", "--once", stdout=out)
+        self.assertIn("Worker processed 6 jobs", out.getvalue())  # slug + related
+        self.assertEqual(
+            sorted(Post.objects.values_list("slug", flat=True)),
+            sorted(f"post-{i}-{post.pk}" for i, post in enumerate(posts)),
+        )
+
+    def test_unknown_name_rejected(self):
+        from django.core.management.base import CommandError
+
+        with self.assertRaisesMessage(CommandError, "tests.nope"):
+            call_command("run_worker", "--once", "--names", "tests.nope")
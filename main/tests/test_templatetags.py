@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.test import TestCase, Client
+from django.urls import reverse
+from main.models import Post
+from main.templatetags.post_urls import PkURL, post_urls, with_pk
+
+
+class PkURLTest(TestCase):
+    """
+    Precomputed pk URL pattern → reverse() နဲ့ ရလဒ်တူရမယ်
+    """
+
+    def test_matches_reverse(self):
+        """pk မျိုးစုံအတွက် reverse() နဲ့ တူ"""
+        for name in ("website:get-detail", "website:get-update-post", "website:post-update-post"):
+            url = PkURL(name)
+            for pk in (1, 42, 1234567):
+                self.assertEqual(with_pk(url, pk), reverse(name, args=[pk]))
+
+    def test_post_urls_keys(self):
+        self.assertEqual(set(post_urls()), {"detail", "edit"})
+
+
+class IndexRowLinksTest(TestCase):
+    """
+    Index row → detail / edit link မှန်ရမယ်၊ Create link က loop အပြင် တစ်ခုတည်း
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.posts = [Post.objects.create(title=f"Post {i}", content="Body") for i in range(3)]
+
+    def test_row_links(self):
+        response = self.client.get(reverse('website:index'))
+        for post in self.posts:
+            self.assertContains(response, f'href="{reverse("website:get-detail", args=[post.pk])}"')
+            self.assertContains(response, f'href="{reverse("website:get-update-post", args=[post.pk])}"')
+        self.assertContains(response, f'href="{reverse("website:get-create-post")}"', count=1)
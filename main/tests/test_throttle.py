@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import include, path, reverse
+from main import async_views, throttle
+from main.models import Post
+from main.urls import post_urlpatterns
+
+urlpatterns = [path('', include((post_urlpatterns(async_views), 'website')))]
+
+
+class TokenBucketTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_rate(self):
+        self.assertEqual(throttle.parse_rate("30/m"), throttle.Rate(30, 0.5))
+        self.assertEqual(throttle.parse_rate("5/sec"), throttle.Rate(5, 5.0))
+        self.assertIsNone(throttle.parse_rate(""))
+        with self.assertRaises(ValueError):
+            throttle.parse_rate("5/day")
+
+    def test_burst_then_refill(self):
+        rate = throttle.Rate(2, 1.0)
+        self.assertEqual(throttle.take_token("k", rate, now=100), (True, 0.0))
+        self.assertEqual(throttle.take_token("k", rate, now=100), (True, 0.0))
+        self.assertEqual(throttle.take_token("k", rate, now=100.25), (False, 0.75))
+        self.assertEqual(throttle.take_token("k", rate, now=101), (True, 0.0))
+        # client တစ်ခုချင်း bucket သီးသန့်
+        self.assertEqual(throttle.take_token("other", rate, now=101), (True, 0.0))
+
+
+class WriteAdmissionTest(TestCase):
+
+    def test_fifo_handoff_and_timeout(self):
+        admission = throttle.WriteAdmission(1, timeout=5)
+        self.assertTrue(admission.acquire())
+        order = []
+        threads = []
+        for name in ("first", "second"):
+            thread = threading.Thread(target=lambda name=name: order.append((name, admission.acquire())))
+            thread.start()
+            threads.append(thread)
+            while len(admission._waiters) < len(threads):
+                time.sleep(0.001)
+        admission.release()
+        threads[0].join()
+        admission.release()
+        threads[1].join()
+        self.assertEqual(order, [("first", True), ("second", True)])
+
+        admission.timeout = 0.01
+        self.assertFalse(admission.acquire())  # slot ကို second က ကိုင်ထား
+        admission.release()
+        self.assertTrue(admission.acquire())
+
+    async def test_async_waiter_timeout_and_handoff(self):
+        admission = throttle.WriteAdmission(1, timeout=0.01)
+        self.assertTrue(await admission.aacquire())
+        self.assertFalse(await admission.aacquire())
+        admission.timeout = 5
+        waiter = asyncio.ensure_future(admission.aacquire())
+        while not admission._waiters:
+            await asyncio.sleep(0)
+        threading.Thread(target=admission.release).start()  # တခြား thread ကနေ လွှဲ
+        self.assertTrue(await waiter)
+        admission.release()
+        self.assertEqual(admission._available, 1)
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Client disconnect → waiter cancel — slot မပျောက်ရ (503 ဆက်တိုက် မဖြစ်ရ)"""
+        admission = throttle.WriteAdmission(1, timeout=5)
+        self.assertTrue(await admission.aacquire())
+        # (1) slot မလွှဲခင် cancel
+        waiter = asyncio.ensure_future(admission.aacquire())
+        while not admission._waiters:
+            await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertFalse(admission._waiters)
+        # (2) slot လွှဲပြီး waiter မနိုးခင် cancel
+        waiter = asyncio.ensure_future(admission.aacquire())
+        while not admission._waiters:
+            await asyncio.sleep(0)
+        admission.release()
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(admission._available, 1)
+        self.assertTrue(await admission.aacquire())
+
+
+@override_settings(WRITE_RATE_LIMIT="2/m")
+class ThrottleWritesTest(TestCase):
+    """Create / update / API write → 429 (rate) / 503 (admission), GET ကို မထိ"""
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('website:post-create-post')
+
+    def test_rate_limit_returns_429(self):
+        data = {'title': 'T', 'content': 'C'}
+        for _ in range(2):
+            self.assertEqual(self.client.post(self.url, data).status_code, 302)
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(Post.objects.count(), 2)
+        # read request တွေ ဆက်ရ
+        self.assertEqual(self.client.get(reverse('website:api-posts')).status_code, 200)
+
+    def test_api_write_is_limited(self):
+        self.client.force_login(User.objects.create_superuser('ingest'))
+        url = reverse('website:api-posts')
+        body = '{"title": "T", "content": "C"}'
+        statuses = [self.client.post(url, body, content_type='application/json').status_code for _ in range(3)]
+        self.assertEqual(statuses, [201, 201, 429])
+
+    @override_settings(WRITE_RATE_LIMIT="")
+    def test_disabled(self):
+        for _ in range(3):
+            self.assertEqual(self.client.post(self.url, {'title': 'T', 'content': 'C'}).status_code, 302)
+
+    @override_settings(WRITE_MAX_CONCURRENCY=1, WRITE_QUEUE_TIMEOUT=0.01)
+    def test_admission_full_returns_503(self):
+        admission = throttle.get_admission()
+        self.assertTrue(admission.acquire())
+        try:
+            response = self.client.post(self.url, {'title': 'T', 'content': 'C'})
+        finally:
+            admission.release()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertFalse(Post.objects.exists())
+        # slot ပြန်လွတ်ရင် ဝင်ရ
+        self.assertEqual(self.client.post(self.url, {'title': 'T', 'content': 'C'}).status_code, 302)
+
+
+@override_settings(ROOT_URLCONF=__name__, WRITE_MAX_CONCURRENCY=1, WRITE_QUEUE_TIMEOUT=0.01)
+class AsyncThrottleWritesTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_admission_full_returns_503(self):
+        admission = throttle.get_admission()
+        self.assertTrue(admission.acquire())
+        try:
+            response = await self.async_client.post(
+                reverse('website:post-create-post'), {'title': 'T', 'content': 'C'}
+            )
+        finally:
+            admission.release()
+        self.assertEqual(response.status_code, 503)
+
+    @override_settings(WRITE_RATE_LIMIT="1/m")
+    async def test_rate_limit_returns_429(self):
+        url = reverse('website:post-create-post')
+        self.assertEqual((await self.async_client.post(url, {'title': 'T', 'content': 'C'})).status_code, 302)
+        self.assertEqual((await self.async_client.post(url, {'title': 'T', 'content': 'C'})).status_code, 429)
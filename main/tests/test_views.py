@@ -276,3 +276,27 @@ class PostUpdatePostViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 405)
 
+    def test_unchanged_data_skips_write(self):
+        """ဘာမှမပြောင်းတဲ့ submit → SELECT တစ်ခုပဲ (UPDATE မရှိ) + success"""
+        data = {"title": "Old Title", "content": "Old content", "version": 1}
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, data)
+        self.assertRedirects(response, reverse(INDEX_URL_NAME))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.version, 1)
+
+    def test_stale_version_returns_conflict(self):
+        """Form ဖွင့်ပြီးနောက် တခြားသူ ပြင်သွားရင် → 409 + DB မပြောင်း (lost update မဖြစ်)"""
+        form_version = self.post.version
+        self.client.post(self.url, {"title": "First edit", "content": "Old content", "version": form_version})
+        response = self.client.post(self.url, {"title": "Second edit", "content": "Old content", "version": form_version})
+        self.assertEqual(response.status_code, 409)
+        self.assertTemplateUsed(response, "create_post.html")
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.title, self.post.version), ("First edit", 2))
+        messages = list(get_messages(response.wsgi_request))
+        self.assertTrue(any("changed by someone else" in str(m) for m in messages))
+
+    def test_edit_form_carries_version(self):
+        response = self.client.get(reverse("website:get-update-post", args=[self.post.pk]))
+        self.assertContains(response, 'name="version" value="1"')
@@ -0,0 +1,227 @@
+"""
+Write endpoint protection — token-bucket rate limit + write admission
+
+    @throttle_writes
+    def post_create_post(request): ...
+
+- Rate limit → client (login user / session / IP) တစ်ခုစီအတွက် Django cache ထဲမှာ token bucket
+  WRITE_RATE_LIMIT = "30/m" ဆို burst 30၊ တစ်မိနစ် 30 token ပြန်ဖြည့်။ ကုန်ရင် 429 + Retry-After
+- Admission → process တစ်ခုအတွင်း တပြိုင်နက် write view WRITE_MAX_CONCURRENCY ခုပဲ ဝင်ခွင့်
+  ကျန်တာ WRITE_QUEUE_TIMEOUT စက္ကန့်အထိ စောင့်၊ မရရင် 503 + Retry-After
+  → SQLite writer lock ပေါ်မှာ "database is locked" timeout အထိ ပုံမနေ (fail fast)
+GET / HEAD / OPTIONS ကို မထိ — API view တွေလို method ရောထားတဲ့ view ကိုလည်း တိုက်ရိုက် decorate လို့ရ
+Cache read-modify-write က atomic မဟုတ်လို့ ပြိုင်တဲ့ request တွေမှာ limit က best-effort
+"""
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+PERIODS = {"s": 1, "m": 60, "h": 3600}
+
+
+@dataclass(frozen=True)
+class Rate:
+    burst: int
+    per_second: float
+
+
+def parse_rate(value):
+    """ "30/m" → Rate(30, 0.5)၊ None / "" → None (rate limit ပိတ်)"""
+    if not value:
+        return None
+    count, _, period = value.partition("/")
+    try:
+        return Rate(int(count), int(count) / PERIODS[period[:1]])
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid rate {value!r}; expected '<count>/<s|m|h>'") from None
+
+
+def client_key(request):
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    session = getattr(request, "session", None)
+    if session is not None and session.session_key:
+        return f"session:{session.session_key}"
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+def take_token(key, rate, now=None):
+    """
+    Bucket ထဲက token တစ်ခုယူ → (allowed, retry_after_seconds)
+    State = (tokens, last_refill) ကို key တစ်ခုတည်းမှာ သိမ်း၊ refill ကို ယူတဲ့အချိန်မှ တွက်
+    """
+    now = time.time() if now is None else now
+    cache = caches[settings.RATE_LIMIT_CACHE_ALIAS]
+    cache_key = f"throttle:{key}"
+    tokens, stamp = cache.get(cache_key) or (rate.burst, now)
+    tokens = min(rate.burst, tokens + (now - stamp) * rate.per_second)
+    if tokens < 1:
+        return False, (1 - tokens) / rate.per_second
+    cache.set(cache_key, (tokens - 1, now), timeout=math.ceil(rate.burst / rate.per_second) + 1)
+    return True, 0.0
+
+
+class WriteAdmission:
+    """
+    Process-wide FIFO admission queue — concurrent writer အရေအတွက်ကို limit ခုအထိ
+    threading.Semaphore က wakeup order မသေချာလို့ (စောင့်တာကြာတဲ့ thread ငတ်ပြီး p99 တက်)
+    waiter တစ်ခုစီကို Event နဲ့ တန်းစီ၊ release က slot ကို ရှေ့ဆုံး waiter ဆီ တိုက်ရိုက်လွှဲ
+    Slot ပိုင်မပိုင်ကို lock အောက်မှာ waiter ကို queue ထဲက ဖယ်နိုင်မနိုင်နဲ့ ဆုံးဖြတ် —
+    ဖယ်လို့မရရင် လွှဲပြီးသားမို့ timeout / cancel ဖြစ်လည်း slot ကို ပိုင် (သို့) ပြန်လွှတ်ရ
+    """
+
+    def __init__(self, limit, timeout):
+        self.limit = limit
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._available = limit
+        self._waiters = deque()
+
+    def acquire(self):
+        with self._lock:
+            if self._available > 0 and not self._waiters:
+                self._available -= 1
+                return True
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        if waiter.wait(self.timeout):
+            return True
+        return not self._withdraw(waiter)  # timeout နဲ့ တပြိုင်နက် slot လွှဲပြီးသားဆို True
+
+    async def aacquire(self):
+        """
+        acquire() ရဲ့ asyncio version — thread မသုံးဘဲ loop ပေါ်မှာ စောင့်
+        Client disconnect (CancelledError) ဖြစ်ရင် queue ထဲက ထွက်၊ slot လွှဲပြီးသားဆို ပြန်လွှတ်
+        """
+        with self._lock:
+            if self._available > 0 and not self._waiters:
+                self._available -= 1
+                return True
+            waiter = _AsyncWaiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self.timeout)
+            return True
+        except asyncio.TimeoutError:
+            return not self._withdraw(waiter)
+        except asyncio.CancelledError:
+            if not self._withdraw(waiter):
+                self.release()
+            raise
+
+    def _withdraw(self, waiter):
+        """waiter ကို queue ထဲက ဖယ် → ဖယ်ရရင် True (slot မလွှဲရသေး)"""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                return False
+            return True
+
+    def release(self):
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._available += 1
+
+
+class _AsyncWaiter:
+    """release() (ဘယ် thread ကနေမဆို) → loop ပေါ်က future ကို နှိုး"""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.future = loop.create_future()
+
+    def set(self):
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+_admission = None
+
+
+def get_admission():
+    global _admission
+    if _admission is None:
+        _admission = WriteAdmission(settings.WRITE_MAX_CONCURRENCY, settings.WRITE_QUEUE_TIMEOUT)
+    return _admission
+
+
+@receiver(setting_changed)
+def _reset_admission(setting, **kwargs):
+    global _admission
+    if setting in ("WRITE_MAX_CONCURRENCY", "WRITE_QUEUE_TIMEOUT"):
+        _admission = None
+
+
+def _reject(status, message, retry_after):
+    response = HttpResponse(message, status=status, content_type="text/plain; charset=utf-8")
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def _check_rate(request):
+    rate = parse_rate(settings.WRITE_RATE_LIMIT)
+    if rate is None:
+        return None
+    allowed, retry_after = take_token(client_key(request), rate)
+    if allowed:
+        return None
+    return _reject(429, "Too many requests. Try again later.", retry_after)
+
+
+def _overloaded():
+    return _reject(503, "Server is busy. Try again later.", settings.WRITE_QUEUE_TIMEOUT)
+
+
+def throttle_writes(view):
+    """Write request ကို rate limit → admission ပြီးမှ view ကို ခေါ် (sync / async view နှစ်မျိုးလုံး)"""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def _wrapped(request, *args, **kwargs):
+            if request.method in SAFE_METHODS:
+                return await view(request, *args, **kwargs)
+            response = await sync_to_async(_check_rate)(request)
+            if response is not None:
+                return response
+            admission = get_admission()
+            if not await admission.aacquire():
+                return _overloaded()
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                admission.release()
+        return _wrapped
+
+    @wraps(view)
+    def _wrapped(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return view(request, *args, **kwargs)
+        response = _check_rate(request)
+        if response is not None:
+            return response
+        admission = get_admission()
+        if not admission.acquire():
+            return _overloaded()
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            admission.release()
+    return _wrapped
@@ -1,12 +1,26 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import views, api, async_views, metrics
+
+
+def post_urlpatterns(post_views):
+    """post_views = views (sync / WSGI) သို့မဟုတ် async_views (ASGI)"""
+    return [
+        path('', post_views.index, name='index'),
+        path('stream/', post_views.index_stream, name='index-stream'),
+        path('search/', views.search_posts, name='search'),
+        path('popular/', views.popular_posts, name='popular'),
+        path('getform/', views.get_create_post, name='get-create-post'),
+        path('create/', post_views.post_create_post, name='post-create-post'),
+        path('<int:pk>/post', post_views.get_detail, name='get-detail'),
+        path('<int:pk>/editform/', post_views.get_update_post, name='get-update-post'),
+        path('<int:pk>/edit/', post_views.post_update_post, name='post-update-post'),
+        path('api/posts/', api.post_collection, name='api-posts'),
+        path('api/posts/<int:pk>/', api.post_detail, name='api-post-detail'),
+    ]
+
 
 app_name='website'
-urlpatterns = [
-    path('', views.index, name='index'),
-    path('getform/', views.get_create_post, name='get-create-post'),
-    path('create/', views.post_create_post, name='post-create-post'),
-    path('<int:pk>/post', views.get_detail, name='get-detail'),
-    path('<int:pk>/editform/', views.get_update_post, name='get-update-post'),
-    path('<int:pk>/edit/', views.post_update_post, name='post-update-post'),
+urlpatterns = post_urlpatterns(async_views if settings.VIEW_MODE == 'async' else views) + [
+    path('metrics', metrics.metrics_view, name='metrics'),
 ]
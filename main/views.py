@@ -1,25 +1,154 @@
+from django.conf import settings
+from django.db import router
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.views.decorators.http import require_GET, require_POST,require_http_methods
 from django.urls import reverse
 from django.contrib import messages
-from .constants import INDEX_URL_NAME, CREATE_POST_URL_NAME, CREATE_POST_FORM_URL_NAME, UPDATE_POST_FORM_URL_NAME, ID_NOT_FOUND
-from main.models import Post
+from .constants import INDEX_URL_NAME, CREATE_POST_URL_NAME, CREATE_POST_FORM_URL_NAME, UPDATE_POST_FORM_URL_NAME, ID_NOT_FOUND, VERSION_CONFLICT
+from main.models import Post, PostVersionConflict
 from main.forms import PostForm
+from main.pagination import paginate, InvalidCursor
+from main import fragment_cache, conditional, counters, search, stats
+from main.templatetags.post_urls import post_urls
+from main.throttle import throttle_writes
 
 @require_GET
 def index(request):
-    items = Post.objects.all()
-    return render(request, 'index.html', {'items': items})
+    """
+    Keyset pagination → ?after= / ?before= cursor, ?page_size= (optional)
+    Invalid cursor ဆိုရင် ပထမ page ကို ပြန်ပြ
+    Page ကို pk ပဲ fetch ပြီး row HTML ကို fragment cache ကနေယူ၊ miss ဖြစ်တာပဲ DB ကနေ load
+    If-None-Match / If-Modified-Since ကိုက်ရင် template render မလုပ်ဘဲ 304
+    Header count ကို PostStats (pk lookup) ကနေ — COUNT(*) မလုပ်
+    """
+    etag, last_modified = conditional.listing_validators(Post.objects.latest_update(), request)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    try:
+        page = paginate(
+            Post.objects.only('id'),
+            after=request.GET.get('after'),
+            before=request.GET.get('before'),
+            page_size=request.GET.get('page_size'),
+        )
+    except InvalidCursor:
+        page = paginate(Post.objects.only('id'), page_size=request.GET.get('page_size'))
+
+    rows = _row_html([item.pk for item in page.items])
+    context = {'items': page.items, 'rows': rows, 'page': page, 'total_posts': stats.get_totals().posts}
+    response = render(request, 'index.html', context)
+    return conditional.set_validators(response, etag, last_modified)
+
+
+def _row_html(pks):
+    """pk list → row HTML list (fragment cache hit, miss ဖြစ်တာပဲ primary ကနေ load + render)"""
+    versions = fragment_cache.get_versions(pks)
+    fragments = fragment_cache.get_fragments(versions, 'row')
+    missing = [pk for pk in versions if pk not in fragments]
+    if missing:
+        fragments.update(fragment_cache.render_fragments(
+            Post.objects.primary().listing().filter(pk__in=missing), 'row', versions
+        ))
+    return [fragments[pk].html for pk in pks if pk in fragments]
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for value in iterable:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _stream_rows(pks, chunk_size, total_posts):
+    yield render_to_string('fragments/index_head.html', {'total_posts': total_posts})
+    empty = True
+    for chunk in _chunked(pks, chunk_size):
+        empty = False
+        yield "".join(_row_html(chunk))
+    if empty:
+        yield "<li>No items found</li>"
+    yield render_to_string('fragments/index_tail.html')
+
+
+@require_GET
+def index_stream(request):
+    """
+    Post အားလုံးကို StreamingHttpResponse နဲ့ ပို့ (pagination မပါ)
+    pk ကို .iterator() နဲ့ POSTS_STREAM_CHUNK_SIZE ခုစီ ဖတ်ပြီး chunk တစ်ခုစီ row fragments render →
+    TTFB နဲ့ peak memory က row အရေအတွက်နဲ့ မဆိုင်
+    """
+    etag, last_modified = conditional.listing_validators(Post.objects.latest_update(), request)
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    chunk_size = settings.POSTS_STREAM_CHUNK_SIZE
+    # Body ကို ReplicaStickinessMiddleware က unpin ပြီးမှ iterate လုပ်လို့ database ကို ဒီမှာ ရွေးထား
+    using = router.db_for_read(Post)
+    pks = Post.objects.using(using).order_by('pk').values_list('pk', flat=True).iterator(chunk_size=chunk_size)
+    content = _stream_rows(pks, chunk_size, stats.get_totals().posts)
+    response = StreamingHttpResponse(content, content_type='text/html; charset=utf-8')
+    return conditional.set_validators(response, etag, last_modified)
 
 
 @require_GET
 def get_detail(request, pk):
-    try:
-        item = Post.objects.get(pk=pk)
-        return render(request, 'detail.html', {'item': item})
-    except Post.DoesNotExist:
-        messages.error(request, ID_NOT_FOUND)
-        return redirect(INDEX_URL_NAME)
+    """
+    Fragment cache hit → ORM query မရှိ (validator ကို fragment ထဲကယူ)
+    Miss → Post ကို primary ကနေ load ပြီး render + cache
+    If-None-Match / If-Modified-Since ကိုက်ရင် template render မလုပ်ဘဲ 304
+    View count ကို main.counters buffer ထဲပဲ ထည့် (304 လည်း view တစ်ခု)
+    """
+    versions = fragment_cache.get_versions([pk])
+    fragment = fragment_cache.get_fragments(versions, 'detail').get(pk)
+    item = None
+    if fragment is None:
+        try:
+            item = Post.objects.primary().detail().get(pk=pk)
+        except Post.DoesNotExist:
+            messages.error(request, ID_NOT_FOUND)
+            return redirect(INDEX_URL_NAME)
+        updated_at = item.updated_at
+    else:
+        updated_at = fragment.updated_at
+    counters.record_view(pk)
+
+    etag, last_modified = conditional.post_validators(pk, updated_at, versions[pk])
+    response = conditional.not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    context = {'fragment': fragment.html if fragment else None}
+    if item is not None:
+        context['item'] = item
+        context['fragment'] = fragment_cache.render_fragments([item], 'detail', versions)[pk].html
+    response = render(request, 'detail.html', context)
+    return conditional.set_validators(response, etag, last_modified)
+
+
+@require_GET
+def search_posts(request):
+    """
+    ?q= → FTS5 (bm25 rank) search results + highlighted snippet
+    """
+    query = request.GET.get('q', '').strip()
+    results = search.search(query) if query else []
+    return render(request, 'search.html', {'query': query, 'results': results, 'urls': post_urls()})
+
+
+@require_GET
+def popular_posts(request):
+    """View အများဆုံး post တွေ (PostViews index ကနေ query တစ်ခုတည်း)"""
+    views = counters.popular(settings.POPULAR_POSTS_LIMIT)
+    return render(request, 'popular.html', {'views': views, 'urls': post_urls()})
 
 
 @require_GET
@@ -28,6 +157,7 @@ def get_create_post(request):
     return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': CREATE_POST_FORM_URL_NAME})
 
 @require_POST
+@throttle_writes
 def post_create_post(request):
     form = PostForm(request.POST)
     if form.is_valid():
@@ -56,30 +186,31 @@ def get_update_post(request, pk):
 
 
 @require_POST
+@throttle_writes
 def post_update_post(request, pk):
     """
     POST request:
-    - form data ကို validate → success ဖြစ်ရင် DB update
+    - form data ကို validate → ပြောင်းတဲ့ field တွေကိုပဲ version check ပါတဲ့ UPDATE တစ်ခုနဲ့ ရေး
+    - ဘာမှ မပြောင်းရင် DB write မလုပ်
+    - form ဖွင့်ပြီးနောက် တခြားသူ ပြင်သွားရင် (version မကိုက်) 409 + form ပြန်ပြ
     - invalid ဖြစ်ရင် error message ပြပြီး ပြန်ပြပါ
     - Post မရှိရင် redirect + message
     """
     try:
         post = Post.objects.get(pk=pk)
-        form = PostForm(request.POST, instance=post)
-
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Update successfully")
-            return redirect(INDEX_URL_NAME)
-        else:
-            messages.error(request, "Update failed. Check the data.")
-            return render(
-                request,
-                CREATE_POST_URL_NAME,
-                {'form': form, 'action': UPDATE_POST_FORM_URL_NAME}
-            )
     except Post.DoesNotExist:
         messages.error(request, ID_NOT_FOUND)
         return redirect(INDEX_URL_NAME)
 
-
+    form = PostForm(request.POST, instance=post)
+    action = reverse(UPDATE_POST_FORM_URL_NAME, args=[pk])
+    if not form.is_valid():
+        messages.error(request, "Update failed. Check the data.")
+        return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': action})
+    try:
+        form.save_changes()
+    except PostVersionConflict:
+        messages.error(request, VERSION_CONFLICT)
+        return render(request, CREATE_POST_URL_NAME, {'form': form, 'action': action}, status=409)
+    messages.success(request, "Update successfully")
+    return redirect(INDEX_URL_NAME)